@@ -21,6 +21,10 @@ setup(
         'jinja2>=3.0.0',
         'click>=8.0.0',
     ],
+    extras_require={
+        'speedups': ['orjson>=3.6.0'],
+        're2': ['google-re2>=1.0'],
+    },
     python_requires='>=3.10',
     entry_points={
         'console_scripts': [
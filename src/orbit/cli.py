@@ -14,7 +14,8 @@ import click
 # Import Orbit components
 try:
     from orbit import MissionControl
-    from orbit.satellites.all_satellites import all_satellites
+    # Satellite modules load on first use, not at CLI startup
+    import orbit.satellites.all_satellites as satellite_registry
     from orbit.core import SafetyLevel
     ORBIT_AVAILABLE = True
 except ImportError:
@@ -54,14 +55,24 @@ def colorize(text: str, color: str) -> str:
     return f"{color}{text}{Colors.ENDC}"
 
 
-def get_mission() -> MissionControl:
-    """Get or create MissionControl instance."""
+def get_mission(satellite_name: Optional[str] = None) -> MissionControl:
+    """Get or create MissionControl instance.
+
+    When satellite_name names a built-in satellite, only that satellite is
+    loaded and registered; otherwise every satellite is registered.
+    """
     if not ORBIT_AVAILABLE:
         click.echo(colorize("Error: Orbit is not installed. Please install with: pip install orbit-macos", Colors.FAIL), err=True)
         sys.exit(1)
 
     mission = MissionControl()
-    for satellite in all_satellites:
+    if satellite_name is not None:
+        try:
+            mission.register(satellite_registry.load_satellite(satellite_name))
+            return mission
+        except KeyError:
+            pass
+    for satellite in satellite_registry.all_satellites:
         mission.register(satellite)
     return mission
 
@@ -225,7 +236,7 @@ def run(satellite_name, parameters, bypass_shield, timeout, raw):
       orbit run file_list --path ~/Documents          # Run with named parameter (JSON)
       orbit run system_set_volume '{"level": 50}'      # Run with JSON parameters
     """
-    mission = get_mission()
+    mission = get_mission(satellite_name)
 
     # Parse parameters
     params = {}
@@ -586,6 +597,7 @@ def test(category):
         mission = MissionControl()
         click.echo(colorize("✅ MissionControl created", Colors.OKGREEN))
 
+        all_satellites = satellite_registry.all_satellites
         for satellite in all_satellites:
             mission.register(satellite)
 
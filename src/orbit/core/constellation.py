@@ -13,6 +13,7 @@ class Constellation:
         """Initialize the constellation."""
         self._satellites: Dict[str, Satellite] = {}
         self._categories: Dict[str, List[str]] = {}
+        self._openai_functions_json: Optional[bytes] = None
 
     def register(self, satellite: Satellite) -> None:
         """Register a satellite.
@@ -27,6 +28,7 @@ class Constellation:
             raise ValueError(f"Satellite '{satellite.name}' already registered")
 
         self._satellites[satellite.name] = satellite
+        self._openai_functions_json = None
 
         # Update category index
         if satellite.category not in self._categories:
@@ -48,6 +50,7 @@ class Constellation:
         satellite = self._satellites[name]
         self._categories[satellite.category].remove(name)
         del self._satellites[name]
+        self._openai_functions_json = None
 
     def get(self, name: str) -> Optional[Satellite]:
         """Get satellite by name.
@@ -115,6 +118,23 @@ class Constellation:
         """
         return [satellite.to_openai_function() for satellite in self._satellites.values()]
 
+    def to_openai_functions_json(self) -> bytes:
+        """Export all satellites to OpenAI Functions format as JSON bytes.
+
+        The payload is serialized once and reused until a satellite is
+        registered or unregistered.
+
+        Returns:
+            Compact UTF-8 encoded JSON array of OpenAI Function dicts
+        """
+        if self._openai_functions_json is None:
+            self._openai_functions_json = json.dumps(
+                self.to_openai_functions(),
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        return self._openai_functions_json
+
     def to_json_schema(self) -> str:
         """Export all satellites as JSON Schema string.
 
@@ -0,0 +1,190 @@
+"""Persistent AppleScript interpreter process."""
+
+import os
+import selectors
+import subprocess
+import threading
+import time
+import weakref
+from typing import Optional, Sequence, Tuple
+
+# JavaScript for Automation server run by the persistent osascript process.
+# It reads length-prefixed AppleScript sources from stdin, executes each one
+# with NSAppleScript and answers "<status> <length>\n<text>" on stdout, where
+# status is 0 for a result and 1 for an error message.
+_SERVER_SOURCE = r"""
+ObjC.import('Foundation');
+const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+const stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+function utf8(data) {
+    return $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding);
+}
+function readHeader() {
+    let header = '';
+    for (;;) {
+        const data = stdin.readDataOfLength(1);
+        if (data.length === 0) return null;
+        const ch = utf8(data).js;
+        if (ch === '\n') return header;
+        header += ch;
+    }
+}
+function reply(status, text) {
+    const body = $(text).dataUsingEncoding($.NSUTF8StringEncoding);
+    stdout.writeData($(status + ' ' + body.length + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+    stdout.writeData(body);
+}
+function run() {
+    for (;;) {
+        const header = readHeader();
+        if (header === null) return;
+        const source = utf8(stdin.readDataOfLength(parseInt(header, 10)));
+        const error = Ref();
+        const result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+        if (result.isNil()) {
+            const message = error[0].objectForKey('NSAppleScriptErrorMessage');
+            reply(1, message.isNil() ? 'AppleScript error' : message.js);
+        } else {
+            const text = result.stringValue;
+            reply(0, text.isNil() ? '' : text.js);
+        }
+    }
+}
+"""
+
+
+class AppleScriptInterpreter:
+    """Long-lived osascript process that executes scripts sent to it.
+
+    Spawning osascript costs tens of milliseconds per call. The interpreter
+    starts one process on first use and feeds it scripts over a pipe, so
+    later calls only pay for compiling and running the script. Calls are
+    serialized with a lock; a process that crashes or times out is killed
+    and replaced on the next call.
+
+    Script results are returned as their text value, so scripts should
+    return text or values that coerce to it (numbers, booleans, dates).
+    """
+
+    # Command starting the server; overridable for other server programs
+    command: Sequence[str] = ("osascript", "-l", "JavaScript", "-e", _SERVER_SOURCE)
+
+    def __init__(self):
+        """Initialize the interpreter without starting a process."""
+        self._process: Optional[subprocess.Popen] = None
+        # Kills the current process when the interpreter is garbage
+        # collected; detached in _stop() so restarts do not pile them up
+        self._finalizer: Optional[weakref.finalize] = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def run(self, script: str, timeout: float) -> Tuple[bool, str]:
+        """Execute a script in the persistent process.
+
+        Args:
+            script: AppleScript source
+            timeout: Seconds to wait for the whole call, covering sending
+                the script and reading the result
+
+        Returns:
+            (failed, output) pair; output is the error message on failure
+
+        Raises:
+            TimeoutError: If no result arrives in time (process is killed)
+            OSError: If the process cannot be started or exits mid-call
+        """
+        payload = script.encode("utf-8")
+        with self._lock:
+            self._ensure_process()
+            deadline = time.monotonic() + timeout
+            try:
+                self._write(b"%d\n" % len(payload) + payload, deadline)
+                status, _, length = self._read_until(b"\n", deadline).partition(b" ")
+                body = self._read_exactly(int(length), deadline)
+            except BaseException:
+                # Unknown protocol state, start over on the next call
+                self._stop()
+                raise
+        return status != b"0", body.decode("utf-8")
+
+    def close(self) -> None:
+        """Terminate the interpreter process, if running."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        """Return the running process, starting a new one if needed."""
+        if self._process is None or self._process.poll() is not None:
+            self._stop()
+            self._process = subprocess.Popen(
+                list(self.command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            # Writes wait in _write() so that they honour the deadline
+            os.set_blocking(self._process.stdin.fileno(), False)
+            self._finalizer = weakref.finalize(self, self._process.kill)
+        return self._process
+
+    def _stop(self) -> None:
+        """Kill the current process and drop any buffered output."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+        self._buffer = b""
+
+    def _write(self, data: bytes, deadline: float) -> None:
+        """Send data to the process as the pipe accepts it.
+
+        Raises:
+            TimeoutError: If the deadline passes first
+            OSError: If the process closed its input
+        """
+        stdin = self._process.stdin
+        view = memoryview(data)
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdin, selectors.EVENT_WRITE)
+            while view:
+                if not selector.select(max(deadline - time.monotonic(), 0)):
+                    raise TimeoutError("interpreter did not accept the script in time")
+                try:
+                    view = view[os.write(stdin.fileno(), view):]
+                except BlockingIOError:
+                    continue
+
+    def _read_until(self, separator: bytes, deadline: float) -> bytes:
+        """Read up to a separator, which is consumed but not returned."""
+        while separator not in self._buffer:
+            self._fill(deadline)
+        data, _, self._buffer = self._buffer.partition(separator)
+        return data
+
+    def _read_exactly(self, length: int, deadline: float) -> bytes:
+        """Read exactly length bytes."""
+        while len(self._buffer) < length:
+            self._fill(deadline)
+        data, self._buffer = self._buffer[:length], self._buffer[length:]
+        return data
+
+    def _fill(self, deadline: float) -> None:
+        """Append available process output to the buffer.
+
+        Raises:
+            TimeoutError: If the deadline passes first
+            OSError: If the process closed its output
+        """
+        stdout = self._process.stdout
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout, selectors.EVENT_READ)
+            if not selector.select(max(deadline - time.monotonic(), 0)):
+                raise TimeoutError("interpreter did not answer in time")
+        chunk = os.read(stdout.fileno(), 65536)
+        if not chunk:
+            raise OSError("interpreter process exited")
+        self._buffer += chunk
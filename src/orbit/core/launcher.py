@@ -1,21 +1,29 @@
 """Mission launcher - executes AppleScript for satellites."""
 
+import asyncio
+import re
 import subprocess
-from typing import Optional, Any
-
-try:
-    from jinja2 import Template
-    HAS_JINJA2 = True
-except ImportError:
-    HAS_JINJA2 = False
+import weakref
+from contextlib import nullcontext
+from typing import Optional, Any, List, Tuple
 
+from orbit.core.interpreter import AppleScriptInterpreter
 from orbit.core.satellite import Satellite
 from orbit.core.shield import SafetyShield
-from orbit.core.exceptions import (
-    AppleScriptError,
-    TemplateRenderingError,
+from orbit.core.permissions import format_error_with_hint
+from orbit.core.exceptions import AppleScriptError
+
+# Markers emitted between per-call outputs of a batched script
+BATCH_DELIMITER = "__ORBIT_DELIM__"
+BATCH_ERROR = "__ORBIT_ERROR__"
+_BATCH_MARKER_RE = re.compile(
+    rf"^({BATCH_DELIMITER}|{BATCH_ERROR})(\d+)__$\n?", re.MULTILINE
 )
 
+# Whitespace trimmed from script output. str.strip() would also drop the
+# ASCII separators that delimit list results, losing empty edge fields.
+_OUTPUT_WHITESPACE = " \t\r\n"
+
 
 class Launcher:
     """Mission launcher - executes AppleScript for satellites."""
@@ -26,6 +34,8 @@ class Launcher:
         timeout: int = 30,
         retry_on_failure: bool = False,
         max_retries: int = 3,
+        max_concurrent_launches: Optional[int] = None,
+        persistent_interpreter: bool = False,
     ):
         """Initialize the launcher.
 
@@ -34,17 +44,34 @@ class Launcher:
             timeout: Script execution timeout in seconds
             retry_on_failure: Whether to retry on failure
             max_retries: Maximum retry attempts
+            max_concurrent_launches: Maximum osascript processes this
+                launcher runs at once from launch_async (None for no limit)
+            persistent_interpreter: Run synchronous launches in one
+                long-lived osascript process instead of spawning one per
+                call; see AppleScriptInterpreter
         """
         self.safety_shield = safety_shield
         self.timeout = timeout
         self.retry_on_failure = retry_on_failure
         self.max_retries = max_retries
+        self.max_concurrent_launches = max_concurrent_launches
+        # asyncio.Semaphore binds to one event loop, so keep one per loop
+        self._launch_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._interpreter = AppleScriptInterpreter() if persistent_interpreter else None
+
+    def close(self) -> None:
+        """Stop the persistent interpreter process, if one is running."""
+        if self._interpreter is not None:
+            self._interpreter.close()
 
     def launch(
         self, satellite: Satellite, parameters: dict, bypass_shield: bool = False
     ) -> Any:
         """Launch a mission (execute a satellite).
 
+        Satellites with a native_handler run it in-process instead of
+        spawning osascript.
+
         Args:
             satellite: The satellite to launch
             parameters: Mission parameters
@@ -57,6 +84,69 @@ class Launcher:
             ShieldError: If safety check fails
             AppleScriptError: If execution fails
         """
+        if satellite.native_handler is not None:
+            return self._launch_native(satellite, parameters, bypass_shield)
+
+        script = self._prepare_script(satellite, parameters, bypass_shield)
+
+        result = self._execute_with_retry(script, satellite)
+
+        return self._parse_result(satellite, result)
+
+    def _launch_native(
+        self, satellite: Satellite, parameters: dict, bypass_shield: bool
+    ) -> Any:
+        """Run a satellite's in-process handler instead of AppleScript.
+
+        Args:
+            satellite: Satellite with a native_handler
+            parameters: Mission parameters
+            bypass_shield: Skip safety checks
+
+        Returns:
+            Mission result
+        """
+        self._check_mission(satellite, parameters, bypass_shield)
+        return self._parse_result(satellite, satellite.native_handler(parameters))
+
+    def _prepare_script(
+        self, satellite: Satellite, parameters: dict, bypass_shield: bool
+    ) -> str:
+        """Validate a mission and render its AppleScript.
+
+        Args:
+            satellite: The satellite to launch
+            parameters: Mission parameters
+            bypass_shield: Skip safety checks
+
+        Returns:
+            Rendered script
+
+        Raises:
+            ParameterValidationError: If parameters are invalid
+            ShieldError: If safety check fails
+            TemplateRenderingError: If rendering failed
+        """
+        self._check_mission(satellite, parameters, bypass_shield)
+
+        # Render AppleScript template (compiled once per satellite); path
+        # parameters are expanded by their preprocess functions
+        return satellite.render(parameters)
+
+    def _check_mission(
+        self, satellite: Satellite, parameters: dict, bypass_shield: bool
+    ) -> None:
+        """Validate a mission's parameters and run the safety shield.
+
+        Args:
+            satellite: The satellite to launch
+            parameters: Mission parameters
+            bypass_shield: Skip safety checks
+
+        Raises:
+            ParameterValidationError: If parameters are invalid
+            ShieldError: If safety check fails
+        """
         # Validate parameters
         satellite.validate_parameters(parameters)
 
@@ -64,92 +154,160 @@ class Launcher:
         if not bypass_shield and self.safety_shield:
             self.safety_shield.validate(satellite, parameters)
 
-        # Render AppleScript template
-        script = self._render_template(satellite.applescript_template, parameters)
+    def launch_many(
+        self,
+        calls: List[Tuple[Satellite, dict]],
+        bypass_shield: bool = False,
+    ) -> List[Any]:
+        """Launch several missions in a single osascript process.
+
+        Every template is rendered and wrapped in its own AppleScript
+        ``script`` object, so top-level ``return`` statements and handlers
+        keep working. The combined script runs once and its output is split
+        back into per-call results on delimiter markers, saving one process
+        spawn per additional call.
+
+        Args:
+            calls: List of (satellite, parameters) pairs
+            bypass_shield: Skip safety checks (not recommended)
+
+        Returns:
+            List of mission results in call order. A call that failed inside
+            the batch yields an AppleScriptError instance in its slot instead
+            of aborting the remaining calls.
+
+        Raises:
+            ShieldError: If any safety check fails (nothing is executed)
+            AppleScriptError: If the combined script cannot be executed
+        """
+        if not calls:
+            return []
+
+        # Validate everything up front so a rejected call blocks the batch
+        scripts = [
+            self._prepare_script(satellite, parameters, bypass_shield)
+            for satellite, parameters in calls
+        ]
+
+        batch_script = self._build_batch_script(scripts)
+        output = self._execute_with_retry(batch_script)
+
+        outputs = self._split_batch_output(output, len(calls))
+        results = []
+        for (satellite, _), (failed, raw) in zip(calls, outputs):
+            if failed:
+                results.append(
+                    AppleScriptError(
+                        f"AppleScript execution failed: {raw}", script=None
+                    )
+                )
+            else:
+                results.append(self._parse_result(satellite, raw))
+        return results
+
+    def _execute_with_retry(
+        self, script: str, satellite: Optional[Satellite] = None
+    ) -> str:
+        """Execute a script, retrying on failure when enabled.
+
+        Args:
+            script: AppleScript to execute
+            satellite: The satellite being executed (for error messages)
+
+        Returns:
+            Script output
 
-        # Execute with retry logic
+        Raises:
+            AppleScriptError: If execution fails
+        """
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                result = self._execute_applescript(script, satellite)
-                break
+                return self._execute_applescript(script, satellite)
             except AppleScriptError as e:
                 last_error = e
                 if attempt == self.max_retries - 1:
                     raise
                 if not self.retry_on_failure:
                     raise
-        else:
-            if last_error:
-                raise last_error
+        raise last_error
+
+    def _parse_result(self, satellite: Satellite, result: str) -> Any:
+        """Apply the satellite's result parser, if any.
 
-        # Parse result
+        Args:
+            satellite: The satellite that produced the output
+            result: Raw script output
+
+        Returns:
+            Parsed result
+        """
         if satellite.result_parser:
             return satellite.result_parser.parse(result) if hasattr(
                 satellite.result_parser, "parse"
             ) else satellite.result_parser(result)
         return result
 
-    def _render_template(self, template: str, parameters: dict) -> str:
-        """Render AppleScript template using Jinja2.
+    def _build_batch_script(self, scripts: List[str]) -> str:
+        """Combine rendered scripts into a single batch script.
 
         Args:
-            template: Template string
-            parameters: Template parameters
+            scripts: Rendered AppleScript sources
 
         Returns:
-            Rendered script
-
-        Raises:
-            TemplateRenderingError: If rendering failed
+            Batch AppleScript emitting one marker-delimited block per script
         """
-        # Pre-process parameters to expand paths
-        processed_params = self._expand_paths(parameters)
-
-        if not HAS_JINJA2:
-            # Fallback to simple string formatting
-            try:
-                return template.format(**processed_params)
-            except KeyError as e:
-                raise TemplateRenderingError(f"Missing parameter: {e}")
-            except Exception as e:
-                raise TemplateRenderingError(f"Template rendering failed: {e}")
-
-        try:
-            jinja_template = Template(template)
-            return jinja_template.render(**processed_params)
-        except Exception as e:
-            raise TemplateRenderingError(f"Template rendering failed: {e}")
+        parts = []
+        for index, script in enumerate(scripts):
+            parts.append(f"script orbitCall{index}\n{script}\nend script")
+
+        parts.append('set AppleScript\'s text item delimiters to ", "')
+        parts.append('set orbitOutput to ""')
+        for index in range(len(scripts)):
+            parts.append(
+                f"""try
+    set orbitText to ""
+    set orbitResult to run orbitCall{index}
+    try
+        set orbitText to orbitResult as text
+    end try
+    set orbitOutput to orbitOutput & "{BATCH_DELIMITER}{index}__" & linefeed & orbitText & linefeed
+on error orbitError
+    set orbitOutput to orbitOutput & "{BATCH_ERROR}{index}__" & linefeed & orbitError & linefeed
+end try"""
+            )
+        parts.append("return orbitOutput")
+        return "\n".join(parts)
 
-    def _expand_paths(self, parameters: dict) -> dict:
-        """Expand relative paths and ~ in parameters.
+    def _split_batch_output(self, output: str, count: int) -> List[Tuple[bool, str]]:
+        """Split batch script output into per-call results.
 
         Args:
-            parameters: Original parameters
+            output: Raw output of the batch script
+            count: Number of calls in the batch
 
         Returns:
-            Parameters with expanded paths
-        """
-        import os
-        from pathlib import Path
-
-        expanded = {}
-        for key, value in parameters.items():
-            # Expand path-like parameters
-            if isinstance(value, str) and key in ['path', 'dir', 'directory', 'folder', 'file']:
-                try:
-                    # Expand ~ and relative paths
-                    expanded_path = Path(value).expanduser().resolve()
-                    expanded[key] = str(expanded_path)
-                except (OSError, ValueError):
-                    # If path expansion fails, keep original value
-                    expanded[key] = value
-            else:
-                expanded[key] = value
+            List of (failed, raw_output) pairs in call order
 
-        return expanded
+        Raises:
+            AppleScriptError: If a call's output is missing
+        """
+        pieces = _BATCH_MARKER_RE.split(output)
+        # re.split yields [prefix, marker, index, body, marker, index, body, ...]
+        outputs = {}
+        for i in range(1, len(pieces) - 2, 3):
+            marker, index, body = pieces[i], int(pieces[i + 1]), pieces[i + 2]
+            outputs[index] = (marker == BATCH_ERROR, body.strip(_OUTPUT_WHITESPACE))
+
+        if len(outputs) != count:
+            raise AppleScriptError(
+                f"Batch output incomplete: expected {count} results, got {len(outputs)}"
+            )
+        return [outputs[index] for index in range(count)]
 
-    def _execute_applescript(self, script: str, satellite: Satellite) -> str:
+    def _execute_applescript(
+        self, script: str, satellite: Optional[Satellite] = None
+    ) -> str:
         """Execute AppleScript via osascript.
 
         Args:
@@ -162,6 +320,9 @@ class Launcher:
         Raises:
             AppleScriptError: If execution fails
         """
+        if self._interpreter is not None:
+            return self._execute_in_interpreter(script, satellite)
+
         try:
             result = subprocess.run(
                 ["osascript", "-e", script],
@@ -171,26 +332,11 @@ class Launcher:
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip()
-                # Try to provide helpful permission hints
-                from orbit.core.permissions import format_error_with_hint
-                enhanced_error = format_error_with_hint(error_msg, satellite.name)
-
-                # If we got an enhanced error, use it; otherwise use standard error
-                if enhanced_error != f"❌ Error: {error_msg}":
-                    raise AppleScriptError(
-                        enhanced_error.strip(),
-                        script=script,
-                        return_code=result.returncode,
-                    )
-                else:
-                    raise AppleScriptError(
-                        f"AppleScript execution failed: {error_msg}",
-                        script=script,
-                        return_code=result.returncode,
-                    )
+                raise self._execution_error(
+                    result.stderr.strip(), result.returncode, script, satellite
+                )
 
-            return result.stdout.strip()
+            return result.stdout.strip(_OUTPUT_WHITESPACE)
 
         except subprocess.TimeoutExpired:
             raise AppleScriptError(
@@ -199,16 +345,182 @@ class Launcher:
         except Exception as e:
             raise AppleScriptError(f"Unexpected error: {str(e)}")
 
-    async def launch_async(self, satellite: Satellite, parameters: dict) -> Any:
+    def _execute_in_interpreter(
+        self, script: str, satellite: Optional[Satellite] = None
+    ) -> str:
+        """Execute AppleScript in the persistent interpreter process.
+
+        Args:
+            script: AppleScript to execute
+            satellite: The satellite being executed (for error messages)
+
+        Returns:
+            Script output
+
+        Raises:
+            AppleScriptError: If execution fails
+        """
+        try:
+            failed, output = self._interpreter.run(script, self.timeout)
+        except TimeoutError:
+            raise AppleScriptError(
+                f"Script execution timed out after {self.timeout}s"
+            )
+        except OSError as e:
+            raise AppleScriptError(f"Unexpected error: {str(e)}")
+
+        if failed:
+            raise self._execution_error(output.strip(), 1, script, satellite)
+        return output.strip(_OUTPUT_WHITESPACE)
+
+    def _execution_error(
+        self,
+        error_msg: str,
+        return_code: int,
+        script: str,
+        satellite: Optional[Satellite],
+    ) -> AppleScriptError:
+        """Build the error raised for a failed osascript run.
+
+        Args:
+            error_msg: osascript stderr output
+            return_code: osascript exit status
+            script: The script that failed
+            satellite: The satellite being executed (for permission hints)
+
+        Returns:
+            AppleScriptError with a permission hint when one applies
+        """
+        # Try to provide helpful permission hints
+        satellite_name = satellite.name if satellite else ""
+        enhanced_error = format_error_with_hint(error_msg, satellite_name)
+
+        # If we got an enhanced error, use it; otherwise use standard error
+        if enhanced_error != f"❌ Error: {error_msg}":
+            return AppleScriptError(
+                enhanced_error.strip(),
+                script=script,
+                return_code=return_code,
+            )
+        return AppleScriptError(
+            f"AppleScript execution failed: {error_msg}",
+            script=script,
+            return_code=return_code,
+        )
+
+    async def launch_async(
+        self, satellite: Satellite, parameters: dict, bypass_shield: bool = False
+    ) -> Any:
         """Launch a mission asynchronously.
 
+        The osascript process is driven by asyncio directly, so concurrent
+        launches do not occupy executor threads while they wait.
+
         Args:
             satellite: The satellite to launch
             parameters: Mission parameters
+            bypass_shield: Skip safety checks (not recommended)
 
         Returns:
             Mission result
+
+        Raises:
+            ShieldError: If safety check fails
+            AppleScriptError: If execution fails
+        """
+        if satellite.native_handler is not None:
+            return self._launch_native(satellite, parameters, bypass_shield)
+
+        script = self._prepare_script(satellite, parameters, bypass_shield)
+
+        last_error = None
+        for attempt in range(self.max_retries):
+            try:
+                result = await self._execute_applescript_async(script, satellite)
+                break
+            except AppleScriptError as e:
+                last_error = e
+                if attempt == self.max_retries - 1 or not self.retry_on_failure:
+                    raise
+        else:
+            raise last_error
+
+        return self._parse_result(satellite, result)
+
+    async def _execute_applescript_async(
+        self, script: str, satellite: Optional[Satellite] = None
+    ) -> str:
+        """Execute AppleScript via an asyncio-managed osascript process.
+
+        Args:
+            script: AppleScript to execute
+            satellite: The satellite being executed (for error messages)
+
+        Returns:
+            Script output
+
+        Raises:
+            AppleScriptError: If execution fails
         """
-        import asyncio
+        async with self._launch_slot():
+            return await self._run_osascript_async(script, satellite)
+
+    def _launch_slot(self):
+        """Get the concurrency limiter for the running event loop.
+
+        Returns:
+            Async context manager that holds a launch slot while entered
+        """
+        if self.max_concurrent_launches is None:
+            return nullcontext()
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._launch_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_launches)
+            self._launch_semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run_osascript_async(
+        self, script: str, satellite: Optional[Satellite] = None
+    ) -> str:
+        """Run one osascript process and collect its output.
+
+        Args:
+            script: AppleScript to execute
+            satellite: The satellite being executed (for error messages)
+
+        Returns:
+            Script output
+
+        Raises:
+            AppleScriptError: If execution fails
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "osascript",
+                "-e",
+                script,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            raise AppleScriptError(f"Unexpected error: {str(e)}")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise AppleScriptError(
+                f"Script execution timed out after {self.timeout}s"
+            )
+
+        if proc.returncode != 0:
+            raise self._execution_error(
+                stderr.decode().strip(), proc.returncode, script, satellite
+            )
 
-        return await asyncio.to_thread(self.launch, satellite, parameters)
+        return stdout.decode().strip(_OUTPUT_WHITESPACE)
@@ -1,18 +1,19 @@
 """Mission Control - main entry point for Orbit."""
 
-from typing import List, Optional, Any
+from typing import Iterable, List, Optional, Any, Tuple
+import json
 
 try:
-    from jinja2 import Template
-    HAS_JINJA2 = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    HAS_JINJA2 = False
+    _json_loads = json.loads
 
 from orbit.core.constellation import Constellation
 from orbit.core.satellite import Satellite
 from orbit.core.launcher import Launcher
 from orbit.core.shield import SafetyShield, SafetyLevel
-from orbit.core.exceptions import ShieldError, AppleScriptError
+from orbit.core.exceptions import ShieldError, AppleScriptError, SatelliteNotFoundError
 
 
 class MissionControl:
@@ -45,11 +46,11 @@ class MissionControl:
         """
         self.constellation.register(satellite)
 
-    def register_constellation(self, satellites: List[Satellite]) -> None:
+    def register_constellation(self, satellites: Iterable[Satellite]) -> None:
         """Register multiple satellites at once.
 
         Args:
-            satellites: List of satellites to register
+            satellites: Satellites to register (list, tuple or any iterable)
         """
         for satellite in satellites:
             self.register(satellite)
@@ -74,11 +75,36 @@ class MissionControl:
         """
         satellite = self.constellation.get(satellite_name)
         if not satellite:
-            from orbit.core.exceptions import SatelliteNotFoundError
             raise SatelliteNotFoundError(f"Satellite '{satellite_name}' not found")
 
         return self.launcher.launch(satellite, parameters, bypass_shield=bypass_shield)
 
+    def launch_many(
+        self, calls: List[Tuple[str, dict]], bypass_shield: bool = False
+    ) -> List[Any]:
+        """Launch several missions in one osascript process.
+
+        Args:
+            calls: List of (satellite_name, parameters) pairs
+            bypass_shield: Skip safety checks (not recommended)
+
+        Returns:
+            List of mission results in call order (see Launcher.launch_many)
+
+        Raises:
+            SatelliteNotFoundError: If any satellite is not found
+            ShieldError: If any safety check fails
+            AppleScriptError: If the batch script cannot be executed
+        """
+        resolved = []
+        for satellite_name, parameters in calls:
+            satellite = self.constellation.get(satellite_name)
+            if not satellite:
+                raise SatelliteNotFoundError(f"Satellite '{satellite_name}' not found")
+            resolved.append((satellite, parameters))
+
+        return self.launcher.launch_many(resolved, bypass_shield=bypass_shield)
+
     def export_openai_functions(self) -> List[dict]:
         """Export all registered satellites to OpenAI Functions format.
 
@@ -87,6 +113,17 @@ class MissionControl:
         """
         return self.constellation.to_openai_functions()
 
+    def export_openai_functions_json(self) -> bytes:
+        """Export all registered satellites as a pre-serialized JSON payload.
+
+        Suitable for embedding directly in an LLM request body. The bytes
+        are cached and rebuilt only after the constellation changes.
+
+        Returns:
+            Compact UTF-8 encoded JSON array of OpenAI Function dicts
+        """
+        return self.constellation.to_openai_functions_json()
+
     def execute_function_call(self, function_call: dict) -> Any:
         """Execute an OpenAI function call response.
 
@@ -96,10 +133,27 @@ class MissionControl:
         Returns:
             Mission result
         """
-        import json
-
         name = function_call.get("name")
         arguments_str = function_call.get("arguments", "{}")
-        arguments = json.loads(arguments_str) if isinstance(arguments_str, str) else arguments_str
+        arguments = _json_loads(arguments_str) if isinstance(arguments_str, str) else arguments_str
 
         return self.launch(name, arguments)
+
+    def execute_function_calls(self, function_calls: List[dict]) -> List[Any]:
+        """Execute parallel OpenAI function calls as a single batch.
+
+        Args:
+            function_calls: OpenAI function_call dicts from one response
+
+        Returns:
+            Mission results in call order
+        """
+        calls = []
+        for function_call in function_calls:
+            arguments_str = function_call.get("arguments", "{}")
+            arguments = (
+                _json_loads(arguments_str) if isinstance(arguments_str, str) else arguments_str
+            )
+            calls.append((function_call.get("name"), arguments))
+
+        return self.launch_many(calls)
@@ -1,24 +1,11 @@
 """Permission checking and helpful error messages for Orbit."""
 
+import re
 from typing import Optional
 
 
-def get_permission_hint(error_message: str, satellite_name: str) -> Optional[str]:
-    """
-    Get helpful permission hint based on error message and satellite name.
-
-    Args:
-        error_message: The error message from AppleScript
-        satellite_name: Name of the satellite being executed
-
-    Returns:
-        Helpful hint message or None
-    """
-    error_lower = error_message.lower()
-
-    # Safari automation permissions
-    if "safari" in satellite_name.lower() or "不允许访问" in error_message or "not allowed" in error_lower:
-        return """
+# Safari automation permissions
+_SAFARI_HINT = """
 🔐 Safari Automation Permission Required:
 
 To use Safari automation, you need to grant permissions:
@@ -29,12 +16,14 @@ To use Safari automation, you need to grant permissions:
 4. Find Terminal (终端) or your IDE
 5. Enable Safari (Safari 浏览器) in the list
 
+Satellites that read or control pages also need Safari's
+Develop > Allow JavaScript from Apple Events setting.
+
 Then try again.
 """
 
-    # System Events permissions
-    if "system events" in error_lower or "system events" in error_message:
-        return """
+# System Events permissions
+_SYSTEM_EVENTS_HINT = """
 🔐 System Events Permission Required:
 
 To use system automation, you need to grant permissions:
@@ -48,9 +37,8 @@ To use system automation, you need to grant permissions:
 Then try again.
 """
 
-    # Finder permissions
-    if "finder" in satellite_name.lower() and "finder" in error_lower:
-        return """
+# Finder permissions
+_FINDER_HINT = """
 🔐 Finder Permission Required:
 
 To use Finder automation, you need to grant permissions:
@@ -64,9 +52,8 @@ To use Finder automation, you need to grant permissions:
 Then try again.
 """
 
-    # File access permissions
-    if "file_" in satellite_name.lower() and ("access" in error_lower or "permission" in error_lower):
-        return """
+# File access permissions
+_FILE_ACCESS_HINT = """
 🔐 File Access Permission Required:
 
 To access files, you may need to grant Full Disk Access:
@@ -80,6 +67,45 @@ To access files, you may need to grant Full Disk Access:
 Then try again.
 """
 
+
+# One case-insensitive scan of the error message; each alternative is a
+# named group so matches can be dispatched on m.lastgroup
+_HINT_RE = re.compile(
+    r"(?P<safari>不允许访问|not allowed)"
+    r"|(?P<system_events>system events)"
+    r"|(?P<finder>finder)"
+    r"|(?P<file_access>access|permission)",
+    re.IGNORECASE,
+)
+
+
+def get_permission_hint(error_message: str, satellite_name: str) -> Optional[str]:
+    """
+    Get helpful permission hint based on error message and satellite name.
+
+    Args:
+        error_message: The error message from AppleScript
+        satellite_name: Name of the satellite being executed
+
+    Returns:
+        Helpful hint message or None
+    """
+    matched = {m.lastgroup for m in _HINT_RE.finditer(error_message)}
+    name_lower = satellite_name.lower()
+
+    # Checks keep their original priority regardless of match position
+    if "safari" in name_lower or "safari" in matched:
+        return _SAFARI_HINT
+
+    if "system_events" in matched:
+        return _SYSTEM_EVENTS_HINT
+
+    if "finder" in name_lower and "finder" in matched:
+        return _FINDER_HINT
+
+    if "file_" in name_lower and "file_access" in matched:
+        return _FILE_ACCESS_HINT
+
     return None
 
 
@@ -1,10 +1,118 @@
 """Satellite base class and data structures."""
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
 from typing import Any, Callable, Optional
 from enum import Enum
 
-from orbit.core.exceptions import ParameterValidationError
+from jinja2 import Template, TemplateError
+
+from orbit.core.exceptions import ParameterValidationError, TemplateRenderingError
+from orbit.core.templating import TEMPLATE_ENV, compact_applescript, escape_parameters
+
+# Bare "{{ name }}" substitution, the only Jinja syntax str.format_map can replace
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+# "{% if name %}...[{% else %}...]{% endif %}" with a bare variable test and
+# no nested tags. trim_blocks makes Jinja drop one newline after each tag.
+_FLAG_BLOCK_RE = re.compile(
+    r"\{%\s*if\s+([A-Za-z_]\w*)\s*%\}\n?((?:(?!\{%).)*?)"
+    r"(?:\{%\s*else\s*%\}\n?((?:(?!\{%).)*?))?"
+    r"\{%\s*endif\s*%\}\n?",
+    re.DOTALL,
+)
+_FLAG_IF_RE = re.compile(r"\{%\s*if\s+([A-Za-z_]\w*)\s*%\}")
+
+# Templates testing more flags than this keep Jinja (2**n variants)
+_MAX_FLAGS = 3
+
+# Text spellings of a false boolean parameter, e.g. from "key=false" CLI args
+_FALSE_TEXT = frozenset(("", "0", "false", "False", "FALSE", "no", "No", "NO"))
+
+# Interned SatelliteParameter instances, see SatelliteParameter.get()
+_PARAM_POOL: dict = {}
+
+
+class _FormatParameters(dict):
+    """Parameter mapping that renders missing keys empty, like Jinja."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _to_format_string(template: str) -> Optional[str]:
+    """Translate a substitution-only Jinja template to a str.format string.
+
+    Args:
+        template: Jinja2 template source
+
+    Returns:
+        Equivalent format string, or None if the template needs Jinja
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    literals = parts[::2]
+    if any("{{" in text or "{%" in text or "{#" in text for text in literals):
+        return None
+
+    # Jinja drops a single trailing newline; match it exactly
+    if literals[-1].endswith("\n"):
+        parts[-1] = literals[-1][:-1]
+    return "".join(
+        "{%s}" % part if i % 2 else part.replace("{", "{{").replace("}", "}}")
+        for i, part in enumerate(parts)
+    )
+
+
+def _resolve_flags(template: str, outcome: dict) -> str:
+    """Replace "{% if flag %}" blocks with the branch the outcome selects.
+
+    Blocks are resolved innermost first, so nested blocks are handled.
+
+    Args:
+        template: Compacted Jinja2 template source
+        outcome: Truth value of each flag
+
+    Returns:
+        Template with every flag block resolved
+    """
+    def branch(match: re.Match) -> str:
+        return match.group(2) if outcome[match.group(1)] else match.group(3) or ""
+
+    while True:
+        resolved = _FLAG_BLOCK_RE.sub(branch, template)
+        if resolved == template:
+            return resolved
+        template = resolved
+
+
+def _specialize_flags(template: str) -> Optional[tuple]:
+    """Split a template branching on flags into one format string per outcome.
+
+    Handles templates whose only control flow is "{% if flag %}" blocks
+    (with an optional else, possibly nested) testing bare variables, such
+    as an optional "folder". Each combination of flag values leaves a
+    substitution-only template, which is translated with
+    _to_format_string().
+
+    Args:
+        template: Compacted Jinja2 template source
+
+    Returns:
+        (flags, variants) with variants keyed by the tuple of flag truth
+        values in flags order, or None if the template needs Jinja
+    """
+    flags = tuple(sorted(set(_FLAG_IF_RE.findall(template))))
+    if not flags or len(flags) > _MAX_FLAGS:
+        return None
+    variants = {}
+    for outcome in product((False, True), repeat=len(flags)):
+        variant = _to_format_string(_resolve_flags(template, dict(zip(flags, outcome))))
+        if variant is None:
+            return None
+        variants[outcome] = variant
+    return flags, variants
 
 
 class SafetyLevel(Enum):
@@ -23,10 +131,13 @@ class SafetyLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SatelliteParameter:
     """Parameter definition for a satellite.
 
+    Instances are immutable so one definition can be shared by several
+    satellites.
+
     Attributes:
         name: Parameter name
         type: Parameter type (string, integer, boolean, object, array)
@@ -34,6 +145,8 @@ class SatelliteParameter:
         required: Whether parameter is required
         default: Default value
         enum: Optional list of allowed values
+        preprocess: Optional function applied to the value before the
+            template is rendered (after validation), e.g. path expansion
     """
 
     name: str
@@ -42,9 +155,54 @@ class SatelliteParameter:
     required: bool = True
     default: Any = None
     enum: Optional[list] = None
+    preprocess: Optional[Callable[[Any], Any]] = None
 
+    @classmethod
+    def get(
+        cls,
+        name: str,
+        type: str,
+        description: str,
+        required: bool = True,
+        default: Any = None,
+        enum: Optional[list] = None,
+        preprocess: Optional[Callable[[Any], Any]] = None,
+    ) -> "SatelliteParameter":
+        """Return a shared parameter instance for these field values.
+
+        Satellite modules repeat the same parameter shapes (an optional
+        "folder", a required "subject"), so identical definitions are
+        interned in a module-level pool. Definitions with unhashable
+        defaults are not pooled.
+
+        Args:
+            name: Parameter name
+            type: Parameter type
+            description: Parameter description
+            required: Whether parameter is required
+            default: Default value
+            enum: Optional list of allowed values
+            preprocess: Optional function applied to the value before rendering
 
-@dataclass
+        Returns:
+            SatelliteParameter instance
+        """
+        # default's class is part of the key so that 1 and True stay apart
+        key = (
+            name, type, description, required,
+            default.__class__, default, tuple(enum) if enum else None, preprocess,
+        )
+        args = (name, type, description, required, default, enum, preprocess)
+        try:
+            param = _PARAM_POOL.get(key)
+        except TypeError:
+            return cls(*args)
+        if param is None:
+            param = _PARAM_POOL[key] = cls(*args)
+        return param
+
+
+@dataclass(slots=True)
 class Satellite:
     """Base satellite (tool) class.
 
@@ -62,6 +220,13 @@ class Satellite:
         examples: Optional list of usage examples
         version: Satellite version
         author: Satellite author
+        native_handler: Optional in-process implementation taking the
+            parameters and returning raw output like the script's; the
+            launcher calls it instead of osascript when set
+        validator: Optional check of the whole parameter dict, run by
+            validate_parameters() after the built-in checks; it raises
+            ParameterValidationError for rules a single parameter cannot
+            express
     """
 
     name: str
@@ -74,10 +239,274 @@ class Satellite:
     examples: list[dict] = field(default_factory=list)
     version: str = "1.0.0"
     author: str = ""
+    native_handler: Optional[Callable[[dict], str]] = None
+    validator: Optional[Callable[[dict], None]] = None
+
+    # Lazily built exports, see to_openai_function() and to_dict()
+    _openai_function: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Compiled applescript_template, built in __post_init__ when Jinja is needed
+    _compiled_template: Optional[Template] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Compacted applescript_template that is actually rendered
+    _source: str = field(default="", init=False, repr=False, compare=False)
+    # Rendered form of templates without Jinja syntax, set in __post_init__
+    _static_body: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # str.format_map form of substitution-only templates, set in __post_init__
+    _format_body: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Templates branching on flags: the flag names, which of them are
+    # boolean parameters (also tracked for Jinja-rendered templates), and
+    # the format string for each tuple of flag truth values, set in
+    # __post_init__
+    _flags: tuple = field(default=(), init=False, repr=False, compare=False)
+    _boolean_flags: frozenset = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _variants: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Validation schema, precomputed in __post_init__
+    _required: tuple = field(default=(), init=False, repr=False, compare=False)
+    _enums: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _required_set: frozenset = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _defaults: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _types: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _preprocessors: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Rendered scripts of SAFE satellites keyed by the frozenset of
+    # (name, type(value), value) triples; the type keeps 1, 1.0 and True,
+    # which compare and hash equal, from sharing one entry
+    _render_cached: Optional[Callable] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Precompile the template and precompute the validation schema."""
+        template = self._source = compact_applescript(self.applescript_template)
+        if "{{" not in template and "{%" not in template and "{#" not in template:
+            self._static_body = template
+        else:
+            self._format_body = _to_format_string(template)
+            if self._format_body is None:
+                specialized = _specialize_flags(template)
+                if specialized is not None:
+                    self._flags, self._variants = specialized
+                flags = self._flags or frozenset(_FLAG_IF_RE.findall(template))
+                self._boolean_flags = frozenset(
+                    p.name
+                    for p in self.parameters
+                    if p.type == "boolean" and p.name in flags
+                )
+        if (
+            self._static_body is None
+            and self._format_body is None
+            and self._variants is None
+        ):
+            try:
+                self._compiled_template = TEMPLATE_ENV.from_string(template)
+            except TemplateError:
+                # Left to render(), which reports it as TemplateRenderingError
+                pass
+
+        self._required = tuple(p.name for p in self.parameters if p.required)
+        self._required_set = frozenset(self._required)
+        self._defaults = {
+            p.name: p.default for p in self.parameters if p.default is not None
+        }
+        self._types = {p.name: p.type for p in self.parameters}
+        self._enums = {
+            p.name: (frozenset(p.enum), p.enum) for p in self.parameters if p.enum
+        }
+        self._preprocessors = {
+            p.name: p.preprocess for p in self.parameters if p.preprocess is not None
+        }
+        if (
+            self._compiled_template is not None
+            and self.safety_level == SafetyLevel.SAFE
+        ):
+            self._render_cached = lru_cache(maxsize=128)(self._render_frozen)
+
+    @property
+    def required_params(self) -> frozenset:
+        """Names of required parameters, computed once at construction."""
+        return self._required_set
+
+    @property
+    def param_defaults(self) -> dict:
+        """Default values of parameters that declare one (do not mutate)."""
+        return self._defaults
+
+    @property
+    def param_types(self) -> dict:
+        """Parameter types keyed by parameter name (do not mutate)."""
+        return self._types
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "Satellite":
+        """Build a satellite from a plain dict specification.
+
+        Lets satellite modules (or JSON/YAML definitions) declare satellites
+        as data. Parameters may be SatelliteParameter instances or dicts of
+        their fields, and safety_level may be a SafetyLevel or its value.
+
+        Args:
+            spec: Satellite fields keyed by name
+
+        Returns:
+            Satellite instance
+        """
+        spec = dict(spec)
+        spec["parameters"] = [
+            param if isinstance(param, SatelliteParameter) else SatelliteParameter(**param)
+            for param in spec.get("parameters", ())
+        ]
+        if not isinstance(spec["safety_level"], SafetyLevel):
+            spec["safety_level"] = SafetyLevel(spec["safety_level"])
+        return cls(**spec)
+
+    def render(self, parameters: dict) -> str:
+        """Render the AppleScript template.
+
+        Templates without Jinja syntax are returned as-is, and templates
+        that only substitute "{{ name }}" placeholders are rendered with
+        str.format_map; neither touches Jinja. Templates branching on up
+        to three bare "{% if flag %}" tests are split into one format
+        string per combination of flag values when the satellite is
+        defined. Others are compiled when the satellite is defined and the
+        compiled form is reused for every render. String parameters are
+        escaped for AppleScript string literals before rendering.
+        Read-only (SAFE) satellites also cache Jinja-rendered scripts per
+        parameter set, unless a parameter value is unhashable. Declared
+        parameter defaults fill in omitted parameters, and parameter
+        preprocess functions run before escaping.
+
+        Args:
+            parameters: Template parameters
+
+        Returns:
+            Rendered script
+
+        Raises:
+            ParameterValidationError: If a preprocess function rejects a value
+            TemplateRenderingError: If rendering failed
+        """
+        if self._static_body is not None:
+            return self._static_body
+
+        if self._defaults:
+            parameters = {**self._defaults, **parameters}
+
+        if self._preprocessors:
+            parameters = self._preprocess(parameters)
+
+        if self._format_body is not None:
+            return self._format_body.format_map(
+                _FormatParameters(escape_parameters(parameters))
+            )
+
+        if self._variants is not None:
+            return self._variants[self._flag_outcome(parameters)].format_map(
+                _FormatParameters(escape_parameters(parameters))
+            )
+
+        if self._boolean_flags:
+            parameters = self._flags_to_bool(parameters)
+
+        if self._render_cached is not None:
+            try:
+                frozen = frozenset(
+                    (name, value.__class__, value) for name, value in parameters.items()
+                )
+            except TypeError:
+                pass
+            else:
+                return self._render_cached(frozen)
+
+        return self._render(parameters)
+
+    def _preprocess(self, parameters: dict) -> dict:
+        """Apply parameter preprocess functions.
+
+        Raises:
+            ParameterValidationError: If a preprocess function rejects a value
+        """
+        parameters = dict(parameters)
+        for name, preprocess in self._preprocessors.items():
+            if name in parameters:
+                try:
+                    parameters[name] = preprocess(parameters[name])
+                except (TypeError, ValueError) as e:
+                    raise ParameterValidationError(
+                        f"Invalid value for parameter '{name}' of satellite "
+                        f"'{self.name}': {e}"
+                    )
+        return parameters
+
+    def _flag_outcome(self, parameters: dict) -> tuple:
+        """Truth values of the template flags, keying _variants.
+
+        Boolean parameters given as text ("false", "0", ...) count as false.
+        """
+        outcome = []
+        for flag in self._flags:
+            value = parameters.get(flag)
+            if isinstance(value, str) and flag in self._boolean_flags:
+                outcome.append(value not in _FALSE_TEXT)
+            else:
+                outcome.append(bool(value))
+        return tuple(outcome)
+
+    def _flags_to_bool(self, parameters: dict) -> dict:
+        """Convert boolean flags given as text to bools for Jinja.
+
+        Matches _flag_outcome(), so "{% if read %}" treats "false" as false
+        whichever way the template is rendered.
+        """
+        text_flags = [
+            name
+            for name in self._boolean_flags
+            if isinstance(parameters.get(name), str)
+        ]
+        if not text_flags:
+            return parameters
+        parameters = dict(parameters)
+        for name in text_flags:
+            parameters[name] = parameters[name] not in _FALSE_TEXT
+        return parameters
+
+    def _render_frozen(self, frozen_parameters: frozenset) -> str:
+        """Render from a frozen parameter set (cache entry point)."""
+        return self._render({name: value for name, _, value in frozen_parameters})
+
+    def _render(self, parameters: dict) -> str:
+        """Render the compiled template with escaped parameters."""
+        try:
+            if self._compiled_template is None:
+                self._compiled_template = TEMPLATE_ENV.from_string(self._source)
+            return self._compiled_template.render(escape_parameters(parameters))
+        except Exception as e:
+            raise TemplateRenderingError(f"Template rendering failed: {e}")
 
     def to_openai_function(self) -> dict:
         """Export to OpenAI Function Calling format.
 
+        The result is built once and the same dict is returned on every
+        later call, so callers must treat it as read-only.
+
+        Returns:
+            OpenAI Function format dict
+        """
+        if self._openai_function is None:
+            self._openai_function = self._build_openai_function()
+        return self._openai_function
+
+    def _build_openai_function(self) -> dict:
+        """Build the OpenAI Function Calling dict.
+
         Returns:
             OpenAI Function format dict
         """
@@ -103,7 +532,7 @@ class Satellite:
                 "parameters": {
                     "type": "object",
                     "properties": properties,
-                    "required": [p.name for p in self.parameters if p.required],
+                    "required": list(self._required),
                 },
             },
         }
@@ -111,6 +540,19 @@ class Satellite:
     def to_dict(self) -> dict:
         """Export to dictionary format.
 
+        The result is built once and the same dict is returned on every
+        later call, so callers must treat it as read-only.
+
+        Returns:
+            Satellite data dict
+        """
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict
+
+    def _build_dict(self) -> dict:
+        """Build the dictionary export.
+
         Returns:
             Satellite data dict
         """
@@ -146,19 +588,27 @@ class Satellite:
             ParameterValidationError: If validation fails
         """
         # Check required parameters
-        for param in self.parameters:
-            if param.required and param.name not in parameters:
+        for name in self._required:
+            if name not in parameters:
                 raise ParameterValidationError(
-                    f"Missing required parameter '{param.name}' for satellite '{self.name}'"
+                    f"Missing required parameter '{name}' for satellite '{self.name}'"
                 )
 
-        # Check enum values
-        for param in self.parameters:
-            if param.enum and param.name in parameters:
-                value = parameters[param.name]
-                if value not in param.enum:
+        # Check enum values (frozenset membership instead of a list scan)
+        for name, (allowed, enum) in self._enums.items():
+            if name in parameters:
+                value = parameters[name]
+                try:
+                    valid = value in allowed
+                except TypeError:
+                    # Unhashable values can never match
+                    valid = False
+                if not valid:
                     raise ParameterValidationError(
-                        f"Parameter '{param.name}' must be one of {param.enum}, got '{value}'"
+                        f"Parameter '{name}' must be one of {enum}, got '{value}'"
                     )
 
+        if self.validator is not None:
+            self.validator(parameters)
+
         return True
@@ -1,8 +1,10 @@
 """Safety shield - validates and controls mission execution."""
 
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Pattern, Sequence, Tuple
 from pathlib import Path
 from enum import Enum
+import os
+import re
 
 from orbit.core.satellite import Satellite, SafetyLevel
 from orbit.core.exceptions import ShieldError
@@ -66,8 +68,14 @@ class SafetyShield:
         """
         self.rules = rules or self.DEFAULT_RULES
         self.confirmation_callback = confirmation_callback
-        self.protected_paths = protected_paths or self.PROTECTED_PATHS
-        self.dangerous_commands = dangerous_commands or self.DANGEROUS_COMMANDS
+        self.protected_paths = list(protected_paths or self.PROTECTED_PATHS)
+        # Prefixes are cached against the protected_paths list and its
+        # length, see _prefixes()
+        self._prefix_list: Optional[List[Path]] = None
+        self._prefix_count = 0
+        self._protected_prefixes: Tuple[str, ...] = ()
+        self.dangerous_commands = list(dangerous_commands or self.DANGEROUS_COMMANDS)
+        self._dangerous_re = self._compile_commands(self.dangerous_commands)
 
     def validate(self, satellite: Satellite, parameters: dict) -> bool:
         """Validate mission safety.
@@ -118,15 +126,54 @@ class SafetyShield:
         Raises:
             ShieldError: If path is protected
         """
-        resolved_path = Path(path).expanduser().resolve()
+        path = str(path)
+        prefixes = self._prefixes()
 
-        for protected in self.protected_paths:
-            try:
-                if resolved_path.is_relative_to(protected):
-                    raise ShieldError(f"Protected path detected: {path}")
-            except ValueError:
-                # Different drives on Windows, not applicable for macOS
-                pass
+        # A path lexically inside a protected root is rejected without a
+        # syscall. Resolving first would miss it on macOS, where /etc and
+        # /var are symlinks into /private.
+        if os.path.isabs(path) and self._is_under(os.path.normpath(path), prefixes):
+            raise ShieldError(f"Protected path detected: {path}")
+
+        # Anything else may still reach a protected root through a symlink
+        # or "..", so it is only allowed once resolved
+        if self._is_under(str(Path(path).expanduser().resolve()), prefixes):
+            raise ShieldError(f"Protected path detected: {path}")
+
+    def _prefixes(self) -> Tuple[str, ...]:
+        """Return the prefix tuple for the current protected_paths.
+
+        The cache is keyed on the list object and its length, so replacing
+        the list or appending to / removing from it directly is picked up
+        without comparing every entry on each check.
+
+        Returns:
+            Prefixes built by _build_prefixes(), rebuilt if the list changed
+        """
+        paths = self.protected_paths
+        if paths is not self._prefix_list or len(paths) != self._prefix_count:
+            self._prefix_list = paths
+            self._prefix_count = len(paths)
+            self._protected_prefixes = self._build_prefixes(paths)
+        return self._protected_prefixes
+
+    @staticmethod
+    def _is_under(path: str, prefixes: Tuple[str, ...]) -> bool:
+        """Check whether a normalized path is at or below any prefix."""
+        return (path.rstrip(os.sep) + os.sep).startswith(prefixes)
+
+    @staticmethod
+    def _build_prefixes(paths: Sequence[Path]) -> Tuple[str, ...]:
+        """Build the prefix tuple used by _check_path.
+
+        Args:
+            paths: Protected paths
+
+        Returns:
+            Path strings terminated by a separator, so "/usr" does not
+            match "/usrlocal"
+        """
+        return tuple(str(p).rstrip(os.sep) + os.sep for p in paths)
 
     def _check_command(self, command: str) -> None:
         """Check if command is dangerous.
@@ -137,9 +184,43 @@ class SafetyShield:
         Raises:
             ShieldError: If command is dangerous
         """
-        for dangerous in self.dangerous_commands:
-            if dangerous in command:
-                raise ShieldError(f"Dangerous command detected: {command}")
+        if self._dangerous_re is not None and self._dangerous_re.search(command):
+            raise ShieldError(f"Dangerous command detected: {command}")
+
+    @staticmethod
+    def _compile_commands(commands: List[str]) -> Optional[Pattern]:
+        """Compile command patterns into a single alternation regex.
+
+        Args:
+            commands: Literal dangerous command substrings
+
+        Returns:
+            Compiled pattern, or None if there are no commands
+        """
+        if not commands:
+            return None
+        # Longest first so overlapping literals report the most specific match
+        ordered = sorted(commands, key=len, reverse=True)
+        return re.compile("|".join(re.escape(c) for c in ordered))
+
+    def add_dangerous_command(self, command: str) -> None:
+        """Add a dangerous command pattern.
+
+        Args:
+            command: Literal command substring to block
+        """
+        self.dangerous_commands.append(command)
+        self._dangerous_re = self._compile_commands(self.dangerous_commands)
+
+    def remove_dangerous_command(self, command: str) -> None:
+        """Remove a dangerous command pattern.
+
+        Args:
+            command: Command substring to unblock
+        """
+        if command in self.dangerous_commands:
+            self.dangerous_commands.remove(command)
+            self._dangerous_re = self._compile_commands(self.dangerous_commands)
 
     def add_protected_path(self, path: str) -> None:
         """Add a protected path.
@@ -148,6 +229,7 @@ class SafetyShield:
             path: Path string to protect
         """
         self.protected_paths.append(Path(path).expanduser().resolve())
+        self._prefix_list = None
 
     def remove_protected_path(self, path: str) -> None:
         """Remove a protected path.
@@ -158,3 +240,4 @@ class SafetyShield:
         path_obj = Path(path).expanduser().resolve()
         if path_obj in self.protected_paths:
             self.protected_paths.remove(path_obj)
+            self._prefix_list = None
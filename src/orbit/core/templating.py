@@ -0,0 +1,186 @@
+"""Shared Jinja2 environment for AppleScript templates."""
+
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment
+
+# str.translate table escaping backslashes and quotes in AppleScript literals
+_AS_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# Indentation/trailing blanks and runs of newlines, see compact_applescript()
+_LINE_PADDING_RE = re.compile(r"^[ \t]+|[ \t]+$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+# ASCII record/unit separators between and within rows of list results.
+# Unlike "," and "|" they do not occur in note bodies, subjects or names,
+# so field values cannot break the row structure.
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+
+# AppleScript expressions for delimiters that have no string literal form
+_DELIMITER_LITERALS = {
+    "\n": "linefeed",
+    RECORD_SEPARATOR: "(character id 30)",
+    FIELD_SEPARATOR: "(character id 31)",
+}
+
+# Accepted date formats for the applescript_date filter
+_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+def compact_applescript(source: str) -> str:
+    """Strip indentation, trailing blanks and empty lines from a template.
+
+    AppleScript does not care about indentation, so osascript gets a smaller
+    script to read and lex. Only line edges are touched: spacing inside a
+    line may be part of a string literal.
+
+    Args:
+        source: AppleScript template source
+
+    Returns:
+        Compacted source
+    """
+    return _BLANK_LINES_RE.sub("\n", _LINE_PADDING_RE.sub("", source)).strip("\n")
+
+
+def _escape_value(value: Any) -> Any:
+    """Escape a string, or the strings of a list, for AppleScript literals."""
+    if isinstance(value, str):
+        return value.translate(_AS_ESCAPE)
+    if isinstance(value, (list, tuple)):
+        return [
+            item.translate(_AS_ESCAPE) if isinstance(item, str) else item
+            for item in value
+        ]
+    return value
+
+
+def escape_parameters(parameters: dict) -> dict:
+    """Escape string parameters for AppleScript string literals.
+
+    Templates interpolate parameters inside "..." literals, so a quote or
+    backslash in user input would otherwise end the literal early. The
+    translation table is applied in C by str.translate. Strings inside
+    list parameters are escaped too, for templates that loop over them.
+
+    Args:
+        parameters: Template parameters
+
+    Returns:
+        Copy of the parameters with string values escaped
+    """
+    return {key: _escape_value(value) for key, value in parameters.items()}
+
+
+def expand_path(value: Any) -> Any:
+    """Expand ~ and relative segments of a filesystem path parameter.
+
+    Used as the preprocess function of parameters that hold paths, so
+    templates can use them directly without a POSIX path coercion.
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        Absolute path string, or the value unchanged if it is not a
+        string or cannot be expanded
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        return str(Path(value).expanduser().resolve())
+    except (OSError, ValueError):
+        return value
+
+
+def applescript_date(value: str, variable: str) -> str:
+    """Render AppleScript statements that set a variable to a date.
+
+    The date string is parsed in Python, so the script only assigns
+    integer components instead of splitting strings at run time. The day
+    is reset to 1 before the month changes so e.g. the 31st of the
+    current month cannot overflow into the next one.
+
+    Args:
+        value: Date as "YYYY-MM-DD" or "YYYY-MM-DD HH:MM"
+        variable: AppleScript variable name to assign
+
+    Returns:
+        AppleScript statements, one per line
+
+    Raises:
+        ValueError: If the date string is in neither format
+    """
+    for date_format in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value.strip(), date_format)
+            break
+        except ValueError:
+            continue
+    else:
+        raise ValueError(
+            f"Invalid date '{value}', expected YYYY-MM-DD or YYYY-MM-DD HH:MM"
+        )
+
+    seconds = parsed.hour * 3600 + parsed.minute * 60
+    return "\n".join(
+        (
+            f"set {variable} to current date",
+            f"set day of {variable} to 1",
+            f"set year of {variable} to {parsed.year}",
+            f"set month of {variable} to {parsed.month}",
+            f"set day of {variable} to {parsed.day}",
+            f"set time of {variable} to {seconds}",
+        )
+    )
+
+
+def applescript_join(list_variable: str, delimiter: str = ",") -> str:
+    """Build AppleScript that returns a list joined by a delimiter.
+
+    Satellites append rows to a list and join them once at the end with
+    text item delimiters instead of checking the list length per row.
+    The snippet is plain AppleScript, so it can be concatenated into a
+    template when the satellite is defined without making it dynamic.
+
+    Args:
+        list_variable: AppleScript list variable to join
+        delimiter: Separator placed between items; "\n" and the record
+            and field separators use AppleScript constants/expressions
+
+    Returns:
+        AppleScript statements ending in a return of the joined text
+    """
+    delimiter_literal = _DELIMITER_LITERALS.get(delimiter)
+    if delimiter_literal is None:
+        delimiter_literal = f'"{delimiter.translate(_AS_ESCAPE)}"'
+    return (
+        "set savedDelimiters to AppleScript's text item delimiters\n"
+        f"set AppleScript's text item delimiters to {delimiter_literal}\n"
+        f"set output to {list_variable} as string\n"
+        "set AppleScript's text item delimiters to savedDelimiters\n"
+        "return output\n"
+    )
+
+
+# Single environment shared by every render so Jinja's per-environment
+# caches and configuration live in one place.
+#
+# - autoescape is off: templates produce AppleScript, not HTML
+# - auto_reload is off and cache_size=-1 keeps every compiled template
+#   resident without mtime checks or LRU eviction
+# - trim_blocks/lstrip_blocks drop the blank lines and indentation left
+#   behind by {% %} tags, keeping the script sent to osascript small
+TEMPLATE_ENV = Environment(
+    autoescape=False,
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    optimized=True,
+)
+TEMPLATE_ENV.filters["applescript_date"] = applescript_date
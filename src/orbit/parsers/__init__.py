@@ -2,12 +2,17 @@
 
 from orbit.parsers.json import JSONResultParser
 from orbit.parsers.delimited import DelimitedResultParser
+from orbit.parsers.records import RecordResultParser
 from orbit.parsers.regex import RegexResultParser
 from orbit.parsers.boolean import BooleanResultParser
+from orbit.parsers.cache import cached_parser, clear_parser_cache
 
 __all__ = [
     "JSONResultParser",
     "DelimitedResultParser",
+    "RecordResultParser",
     "RegexResultParser",
     "BooleanResultParser",
+    "cached_parser",
+    "clear_parser_cache",
 ]
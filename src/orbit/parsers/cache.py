@@ -0,0 +1,5 @@
+"""Parse result caching."""
+
+from orbit.parsers.json import cached_parser, clear_parser_cache
+
+__all__ = ["cached_parser", "clear_parser_cache"]
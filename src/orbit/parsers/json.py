@@ -1,10 +1,40 @@
 """Result parser base classes and implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from functools import lru_cache, wraps
+from itertools import repeat
+from typing import Any, Callable, Sequence
+import csv
 import json
 import re
 
+from orbit.core.templating import FIELD_SEPARATOR, RECORD_SEPARATOR
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Truthy boolean spellings; the cased variants are what AppleScript and
+# shell commands actually emit, so most results skip the .lower() call
+_TRUTHY = frozenset(("true", "yes", "1"))
+_TRUTHY_CASED = _TRUTHY | frozenset(("True", "TRUE", "Yes", "YES"))
+
+# Interned DelimitedResultParser instances, see DelimitedResultParser.get()
+_DELIMITED_POOL: dict = {}
+
+# Memoized parse functions created by cached_parser(), see clear_parser_cache()
+_PARSER_CACHES: list = []
+
+# re flags expressed as inline modifiers, which RE2 also understands
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
 
 class ResultParser(ABC):
     """Base result parser."""
@@ -38,23 +68,59 @@ class JSONResultParser(ResultParser):
             ValueError: If JSON is invalid
         """
         try:
-            return json.loads(raw_output)
+            return _json_loads(raw_output)
         except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ValueError(f"Failed to parse JSON: {raw_output}")
 
 
 class DelimitedResultParser(ResultParser):
     """Parse delimited output (e.g., 'value1|value2|value3')."""
 
-    def __init__(self, delimiter: str = "|", field_names: list[str] = None):
+    def __init__(
+        self,
+        delimiter: str = "|",
+        field_names: Sequence[str] = None,
+        multiline: bool = False,
+    ):
         """Initialize parser.
 
         Args:
             delimiter: Delimiter character
-            field_names: Optional field names for dict output
+            field_names: Optional field names for dict output. Stored as a
+                tuple; tuples are kept as-is, so satellites sharing a
+                module-level schema share one key tuple.
+            multiline: Treat each output line as a separate record
         """
         self.delimiter = delimiter
-        self.field_names = field_names
+        self.field_names = tuple(field_names) if field_names else None
+        self.multiline = multiline
+
+    @classmethod
+    def get(
+        cls,
+        delimiter: str = "|",
+        field_names: Sequence[str] = None,
+        multiline: bool = False,
+    ) -> "DelimitedResultParser":
+        """Return a shared parser for this delimiter and field schema.
+
+        Parsers hold no per-call state, so satellites using the same
+        schema can share one instance.
+
+        Args:
+            delimiter: Delimiter character
+            field_names: Optional field names for dict output
+            multiline: Treat each output line as a separate record
+
+        Returns:
+            DelimitedResultParser instance
+        """
+        key = (delimiter, tuple(field_names) if field_names else None, multiline)
+        parser = _DELIMITED_POOL.get(key)
+        if parser is None:
+            parser = _DELIMITED_POOL[key] = cls(delimiter, key[1], multiline)
+        return parser
 
     def parse(self, raw_output: str) -> dict | list:
         """Parse delimited output.
@@ -63,25 +129,127 @@ class DelimitedResultParser(ResultParser):
             raw_output: Delimited string
 
         Returns:
-            Dict if field_names provided, list otherwise
+            Dict if field_names provided, list otherwise. With multiline,
+            a list with one such record per non-empty line.
         """
+        if self.multiline:
+            return self._parse_rows(raw_output)
+
         parts = raw_output.split(self.delimiter)
         if self.field_names:
             return dict(zip(self.field_names, parts))
         return parts
 
+    def _parse_rows(self, raw_output: str) -> list:
+        """Parse one record per line.
 
-class RegexResultParser(ResultParser):
-    """Parse output using regex patterns."""
+        Args:
+            raw_output: Newline-separated delimited records
+
+        Returns:
+            List of dicts if field_names provided, list of lists otherwise
+        """
+        # Every stage is a C iterator, so no Python frame runs per row
+        lines = filter(None, raw_output.splitlines())
+        if len(self.delimiter) == 1:
+            # csv.reader splits in C; QUOTE_NONE keeps quotes in values
+            rows = csv.reader(lines, delimiter=self.delimiter, quoting=csv.QUOTE_NONE)
+        else:
+            rows = map(str.split, lines, repeat(self.delimiter))
+
+        if self.field_names:
+            return list(map(dict, map(zip, repeat(self.field_names), rows)))
+        return list(rows)
+
+
+class RecordResultParser(ResultParser):
+    """Parse records joined with the ASCII record and field separators.
+
+    Satellites build each row with ``& (character id 31) &`` between
+    fields and join rows with ``applescript_join(..., RECORD_SEPARATOR)``.
+    The separators never occur in user text, so values may contain
+    commas, pipes or newlines. Other separators can be passed for output
+    that uses printable delimiters.
+    """
+
+    def __init__(
+        self,
+        field_names: Sequence[str],
+        record_separator: str = RECORD_SEPARATOR,
+        field_separator: str = FIELD_SEPARATOR,
+    ):
+        """Initialize parser.
+
+        Args:
+            field_names: Field names of each record, in output order
+            record_separator: String between records
+            field_separator: String between fields of a record
+        """
+        self.field_names = tuple(field_names)
+        self.record_separator = record_separator
+        self.field_separator = field_separator
+
+    def parse(self, raw_output: str) -> list:
+        """Parse separator-delimited records.
+
+        Args:
+            raw_output: Records separated by record_separator, fields by
+                field_separator
 
-    def __init__(self, pattern: str, group_names: list[str] = None):
+        Returns:
+            List of dicts keyed by field_names
+        """
+        if not raw_output:
+            return []
+        field_names = self.field_names
+        field_separator = self.field_separator
+        maxsplit = len(field_names) - 1
+        return [
+            dict(zip(field_names, record.split(field_separator, maxsplit)))
+            for record in raw_output.split(self.record_separator)
+        ]
+
+
+class RegexResultParser(ResultParser):
+    """Parse output using regex patterns.
+
+    The pattern is compiled once at construction. The default ``re`` engine
+    backtracks, so nested quantifiers such as ``(a+)+`` can take exponential
+    time on large or adversarial output. Use ``engine="re2"`` (requires the
+    google-re2 package) for linear-time matching; RE2 does not support
+    backreferences or lookaround.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        group_names: list[str] = None,
+        flags: int = 0,
+        engine: str = "re",
+    ):
         """Initialize parser.
 
         Args:
             pattern: Regex pattern
             group_names: Optional group names for dict output
+            flags: re flags; only IGNORECASE, MULTILINE and DOTALL are
+                honoured by the re2 engine
+            engine: Regex engine, "re" or "re2"
+
+        Raises:
+            ImportError: If engine is "re2" and google-re2 is not installed
+            ValueError: If engine is unknown
         """
-        self.pattern = re.compile(pattern)
+        if engine == "re":
+            self.pattern = re.compile(pattern, flags)
+        elif engine == "re2":
+            if re2 is None:
+                raise ImportError("engine='re2' requires the google-re2 package")
+            inline = "".join(char for flag, char in _INLINE_FLAGS if flags & flag)
+            self.pattern = re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        else:
+            raise ValueError(f"Unknown regex engine: {engine}")
+        self.engine = engine
         self.group_names = group_names
 
     def parse(self, raw_output: str) -> dict | list:
@@ -118,4 +286,45 @@ class BooleanResultParser(ResultParser):
         Returns:
             Boolean value
         """
-        return raw_output.strip().lower() in ("true", "yes", "1")
+        value = raw_output.strip()
+        return value in _TRUTHY_CASED or value.lower() in _TRUTHY
+
+
+def _copy_result(result: Any) -> Any:
+    """Copy a parsed result down to its records, whose values are immutable."""
+    if isinstance(result, dict):
+        return dict(result)
+    if isinstance(result, list):
+        return [dict(item) if isinstance(item, dict) else item for item in result]
+    return result
+
+
+def cached_parser(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Memoize a parse function by raw output.
+
+    Polling callers usually see unchanged output, so repeated parses are
+    served from a small cache. Each call returns a fresh copy, so callers
+    may mutate the result without corrupting later ones.
+
+    Args:
+        parse: Function parsing raw output into dicts, lists or scalars
+
+    Returns:
+        Memoized parse function
+    """
+    cached = lru_cache(maxsize=32)(parse)
+    _PARSER_CACHES.append(cached)
+
+    @wraps(parse)
+    def wrapper(raw_output: str) -> Any:
+        return _copy_result(cached(raw_output))
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+def clear_parser_cache() -> None:
+    """Clear every cache created by cached_parser()."""
+    for cached in _PARSER_CACHES:
+        cached.cache_clear()
@@ -0,0 +1,5 @@
+"""Record result parser."""
+
+from orbit.parsers.json import RecordResultParser
+
+__all__ = ["RecordResultParser"]
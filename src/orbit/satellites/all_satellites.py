@@ -1,180 +1,302 @@
-"""Update all_satellites to include Phase 5-6 satellites."""
-
-from orbit.satellites import (
-    system,
-    system_enhanced,
-    files,
-    notes,
-    reminders,
-    calendar,
-    mail,
-    safari,
-    music,
-    finder,
-    contacts,
-    wifi,
-    apps,
-)
-
-# Import all satellites
-basic_system_satellites = [
-    system.system_get_info,
-    system.system_get_clipboard,
-    system.system_set_clipboard,
-    system.system_send_notification,
-    system.system_take_screenshot,
-    system.system_get_volume,
-    system.system_set_volume,
-    system.system_get_brightness,
-    system.system_set_brightness,
-]
+"""Registry of all built-in satellites.
 
-enhanced_system_satellites = [
-    system_enhanced.system_get_detailed_info,
-    system_enhanced.system_get_clipboard_history,
-    system_enhanced.system_clear_clipboard,
-    system_enhanced.system_send_notification_with_sound,
-    system_enhanced.system_take_screenshot_selection,
-    system_enhanced.system_take_screenshot_window,
-    system_enhanced.system_mute_volume,
-    system_enhanced.system_unmute_volume,
-    system_enhanced.system_volume_up,
-    system_enhanced.system_volume_down,
-    system_enhanced.system_brightness_up,
-    system_enhanced.system_brightness_down,
-    system_enhanced.system_sleep,
-    system_enhanced.system_reboot,
-    system_enhanced.system_shutdown,
-]
+Satellite modules are imported lazily (PEP 562): the group lists and
+``all_satellites`` are built on first attribute access, and
+``all_satellites_by_category`` loads only the modules a category needs.
+``load_satellite`` resolves a single name through a static index, importing
+just the module that defines it.
+"""
 
-file_satellites = [
-    files.file_list,
-    files.file_read,
-    files.file_write,
-    files.file_delete,
-    files.file_move,
-    files.file_copy,
-    files.file_search,
-    files.file_empty_trash,
-    files.file_create_directory,
-    files.file_get_info,
-]
+import importlib
+from functools import partial
+from typing import Callable, Dict, List, Tuple
 
-notes_satellites = [
-    notes.notes_list,
-    notes.notes_get,
-    notes.notes_create,
-    notes.notes_update,
-    notes.notes_delete,
-    notes.notes_search,
-    notes.notes_list_folders,
-]
+from orbit.core.satellite import Satellite
 
-reminders_satellites = [
-    reminders.reminders_list,
-    reminders.reminders_create,
-    reminders.reminders_complete,
-    reminders.reminders_uncomplete,
-    reminders.reminders_delete,
-    reminders.reminders_list_lists,
-]
+# Group name -> (module in orbit.satellites, satellite attribute names)
+_SATELLITE_GROUPS = {
+    "basic_system_satellites": (
+        "system",
+        (
+            "system_get_info",
+            "system_get_clipboard",
+            "system_set_clipboard",
+            "system_send_notification",
+            "system_take_screenshot",
+            "system_get_volume",
+            "system_set_volume",
+            "system_get_brightness",
+            "system_set_brightness",
+        ),
+    ),
+    "enhanced_system_satellites": (
+        "system_enhanced",
+        (
+            "system_get_detailed_info",
+            "system_get_clipboard_history",
+            "system_clear_clipboard",
+            "system_send_notification_with_sound",
+            "system_take_screenshot_selection",
+            "system_take_screenshot_window",
+            "system_mute_volume",
+            "system_unmute_volume",
+            "system_volume_up",
+            "system_volume_down",
+            "system_brightness_up",
+            "system_brightness_down",
+            "system_sleep",
+            "system_reboot",
+            "system_shutdown",
+        ),
+    ),
+    "file_satellites": (
+        "files",
+        (
+            "file_list",
+            "file_read",
+            "file_write",
+            "file_delete",
+            "file_move",
+            "file_copy",
+            "file_search",
+            "file_empty_trash",
+            "file_create_directory",
+            "file_get_info",
+        ),
+    ),
+    "notes_satellites": (
+        "notes",
+        (
+            "notes_list",
+            "notes_get",
+            "notes_create",
+            "notes_update",
+            "notes_delete",
+            "notes_search",
+            "notes_list_folders",
+        ),
+    ),
+    "reminders_satellites": (
+        "reminders",
+        (
+            "reminders_list",
+            "reminders_create",
+            "reminders_complete",
+            "reminders_uncomplete",
+            "reminders_delete",
+            "reminders_list_lists",
+        ),
+    ),
+    "calendar_satellites": (
+        "calendar",
+        (
+            "calendar_list_calendars",
+            "calendar_get_events",
+            "calendar_create_event",
+            "calendar_delete_event",
+        ),
+    ),
+    "mail_satellites": (
+        "mail",
+        (
+            "mail_send",
+            "mail_list_inbox",
+            "mail_get",
+            "mail_delete",
+            "mail_mark_as_read",
+            "mail_mark_as_unread",
+            "mail_batch_mark",
+            "mail_batch_delete",
+        ),
+    ),
+    "safari_satellites": (
+        "safari",
+        (
+            "safari_open",
+            "safari_get_url",
+            "safari_get_text",
+            "safari_snapshot",
+            "safari_list_tabs",
+            "safari_close_tab",
+            "safari_search",
+            "safari_new_tab",
+            "safari_go_back",
+            "safari_go_forward",
+            "safari_refresh",
+            "safari_zoom_in",
+            "safari_zoom_out",
+        ),
+    ),
+    "music_satellites": (
+        "music",
+        (
+            "music_play",
+            "music_pause",
+            "music_next",
+            "music_previous",
+            "music_get_current",
+            "music_set_volume",
+            "music_get_volume",
+            "music_play_track",
+            "music_search",
+            "music_get_playlists",
+            "music_shuffle",
+        ),
+    ),
+    "finder_satellites": (
+        "finder",
+        (
+            "finder_open_folder",
+            "finder_new_folder",
+            "finder_reveal",
+            "finder_get_selection",
+            "finder_empty_trash",
+            "finder_get_trash_info",
+        ),
+    ),
+    "contacts_satellites": (
+        "contacts",
+        (
+            "contacts_search",
+            "contacts_get",
+            "contacts_create",
+            "contacts_list_all",
+        ),
+    ),
+    "wifi_satellites": (
+        "wifi",
+        (
+            "wifi_connect",
+            "wifi_disconnect",
+            "wifi_list",
+            "wifi_current",
+            "wifi_turn_on",
+            "wifi_turn_off",
+        ),
+    ),
+    "app_satellites": (
+        "apps",
+        (
+            "app_list",
+            "app_launch",
+            "app_quit",
+            "app_activate",
+            "app_get_running",
+            "app_force_quit",
+            "app_hide",
+            "app_show",
+        ),
+    ),
+}
 
-calendar_satellites = [
-    calendar.calendar_list_calendars,
-    calendar.calendar_get_events,
-    calendar.calendar_create_event,
-    calendar.calendar_delete_event,
-]
+# Satellite category -> groups providing it
+_CATEGORY_GROUPS = {
+    "system": ("basic_system_satellites", "enhanced_system_satellites"),
+    "files": ("file_satellites",),
+    "notes": ("notes_satellites",),
+    "reminders": ("reminders_satellites",),
+    "calendar": ("calendar_satellites",),
+    "mail": ("mail_satellites",),
+    "safari": ("safari_satellites",),
+    "music": ("music_satellites",),
+    "finder": ("finder_satellites",),
+    "contacts": ("contacts_satellites",),
+    "wifi": ("wifi_satellites",),
+    "apps": ("app_satellites",),
+}
 
-mail_satellites = [
-    mail.mail_send,
-    mail.mail_list_inbox,
-    mail.mail_get,
-    mail.mail_delete,
-    mail.mail_mark_as_read,
-    mail.mail_mark_as_unread,
-]
+# Satellite name -> module in orbit.satellites, built from the static tables
+# above so single-satellite lookups need no imports
+_MODULE_BY_NAME = {
+    name: module_name
+    for module_name, names in _SATELLITE_GROUPS.values()
+    for name in names
+}
 
-safari_satellites = [
-    safari.safari_open,
-    safari.safari_get_url,
-    safari.safari_get_text,
-    safari.safari_list_tabs,
-    safari.safari_close_tab,
-    safari.safari_search,
-    safari.safari_new_tab,
-    safari.safari_go_back,
-    safari.safari_go_forward,
-    safari.safari_refresh,
-    safari.safari_zoom_in,
-    safari.safari_zoom_out,
-]
 
-music_satellites = [
-    music.music_play,
-    music.music_pause,
-    music.music_next,
-    music.music_previous,
-    music.music_get_current,
-    music.music_set_volume,
-    music.music_get_volume,
-    music.music_play_track,
-    music.music_search,
-    music.music_get_playlists,
-    music.music_shuffle,
-]
+def _load_group(group: str) -> List[Satellite]:
+    """Import a satellite module and collect one group's satellites.
 
-finder_satellites = [
-    finder.finder_open_folder,
-    finder.finder_new_folder,
-    finder.finder_reveal,
-    finder.finder_get_selection,
-    finder.finder_empty_trash,
-    finder.finder_get_trash_info,
-]
+    The list is cached as a module attribute, so each group is built once.
+    Modules exporting a SATELLITES mapping are read from it in one pass;
+    otherwise the group's names are looked up as module attributes.
 
-contacts_satellites = [
-    contacts.contacts_search,
-    contacts.contacts_get,
-    contacts.contacts_create,
-    contacts.contacts_list_all,
-]
+    Args:
+        group: Group name, e.g. "file_satellites"
 
-wifi_satellites = [
-    wifi.wifi_connect,
-    wifi.wifi_disconnect,
-    wifi.wifi_list,
-    wifi.wifi_current,
-    wifi.wifi_turn_on,
-    wifi.wifi_turn_off,
-]
+    Returns:
+        List of satellites in the group
+    """
+    satellites = globals().get(group)
+    if satellites is None:
+        module_name, names = _SATELLITE_GROUPS[group]
+        module = importlib.import_module(f"orbit.satellites.{module_name}")
+        mapping = getattr(module, "SATELLITES", None)
+        if mapping is not None:
+            satellites = list(mapping.values())
+        else:
+            satellites = [getattr(module, name) for name in names]
+        globals()[group] = satellites
+    return satellites
 
-app_satellites = [
-    apps.app_list,
-    apps.app_launch,
-    apps.app_quit,
-    apps.app_activate,
-    apps.app_get_running,
-    apps.app_force_quit,
-    apps.app_hide,
-    apps.app_show,
-]
 
-# All satellites combined
-all_satellites = (
-    basic_system_satellites +
-    enhanced_system_satellites +
-    file_satellites +
-    notes_satellites +
-    reminders_satellites +
-    calendar_satellites +
-    mail_satellites +
-    safari_satellites +
-    music_satellites +
-    finder_satellites +
-    contacts_satellites +
-    wifi_satellites +
-    app_satellites
-)
-
-__all__ = ["all_satellites"]
+def load_category(category: str) -> List[Satellite]:
+    """Load the satellites of a single category.
+
+    Args:
+        category: Satellite category, e.g. "safari"
+
+    Returns:
+        List of satellites in the category
+
+    Raises:
+        KeyError: If the category is unknown
+    """
+    return [sat for group in _CATEGORY_GROUPS[category] for sat in _load_group(group)]
+
+
+def load_satellite(name: str) -> Satellite:
+    """Load a single satellite by name.
+
+    Only the module defining the satellite is imported.
+
+    Args:
+        name: Satellite name, e.g. "safari_open"
+
+    Returns:
+        The satellite
+
+    Raises:
+        KeyError: If the satellite is unknown
+    """
+    module = importlib.import_module(f"orbit.satellites.{_MODULE_BY_NAME[name]}")
+    return module.SATELLITES[name]
+
+
+# Category -> loader, so callers can register only what they need
+all_satellites_by_category: Dict[str, Callable[[], List[Satellite]]] = {
+    category: partial(load_category, category) for category in _CATEGORY_GROUPS
+}
+
+
+def __getattr__(name: str):
+    """Build group lists and all_satellites on first access."""
+    if name in _SATELLITE_GROUPS:
+        return _load_group(name)
+    if name == "all_satellites":
+        # Flat, immutable registry built in one pass
+        value: Tuple[Satellite, ...] = tuple(
+            sat for group in _SATELLITE_GROUPS for sat in _load_group(group)
+        )
+        # Cache as a real module attribute so later lookups bypass __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "all_satellites",
+    "all_satellites_by_category",
+    "load_category",
+    "load_satellite",
+]
@@ -1,26 +1,47 @@
 """Application control satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser, JSONResultParser
+from orbit.core.templating import applescript_join, expand_path
+from orbit.parsers import DelimitedResultParser, JSONResultParser, cached_parser
 import json
+from types import MappingProxyType
 
 
-# List applications
-app_list = Satellite(
-    name="app_list",
-    description="List installed applications",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="path",
-            type="string",
-            description="Path to search (default: /Applications)",
-            required=False,
-            default="/Applications"
-        )
-    ],
-    safety_level=SafetyLevel.SAFE,
-    applescript_template="""
+# Polling callers usually see unchanged output, so parsed results are
+# memoized by raw string.
+@cached_parser
+def _parse_app_list(output: str) -> list:
+    """Parse a comma-separated application list into a sorted list."""
+    return sorted(name for name in output.split(",") if name)
+
+
+# Shared by every satellite that targets a single application by name
+_APP_NAME_PARAM = SatelliteParameter(
+    name="name",
+    type="string",
+    description="Application name",
+    required=True
+)
+
+# Satellite specifications, built into module-level satellites below
+_SPECS = (
+    # List applications
+    {
+        "name": "app_list",
+        "description": "List installed applications",
+        "category": "apps",
+        "parameters": [
+            SatelliteParameter(
+                name="path",
+                type="string",
+                description="Path to search (default: /Applications)",
+                required=False,
+                default="/Applications",
+                preprocess=expand_path
+            )
+        ],
+        "safety_level": SafetyLevel.SAFE,
+        "applescript_template": """
     set searchPath to POSIX path of "{{ path }}"
 
     tell application "System Events"
@@ -40,114 +61,88 @@ app_list = Satellite(
         end repeat
     end tell
 
-    return my list(appList)
-    """,
-    result_parser=lambda x: sorted(x.split(",") if x else []),
-    examples=[
-        {
-            "input": {},
-            "output": {"apps": ["Safari", "Notes", "Calendar", "Mail"]}
-        }
-    ]
-)
-
-# Launch application
-app_launch = Satellite(
-    name="app_launch",
-    description="Launch application",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.MODERATE,
-    applescript_template="""
+    """ + applescript_join("appList"),
+        "result_parser": _parse_app_list,
+        "examples": [
+            {
+                "input": {},
+                "output": {"apps": ["Safari", "Notes", "Calendar", "Mail"]}
+            }
+        ]
+    },
+    # Launch application
+    {
+        "name": "app_launch",
+        "description": "Launch application",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.MODERATE,
+        "applescript_template": """
     tell application "{{ name }}"
         activate
     end tell
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Safari"},
-            "output": "success"
-        }
-    ]
-)
-
-# Quit application
-app_quit = Satellite(
-    name="app_quit",
-    description="Quit application",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.MODERATE,
-    applescript_template="""
+        "examples": [
+            {
+                "input": {"name": "Safari"},
+                "output": "success"
+            }
+        ]
+    },
+    # Quit application
+    {
+        "name": "app_quit",
+        "description": "Quit application",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.MODERATE,
+        "applescript_template": """
     tell application "{{ name }}"
         quit
     end tell
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Music"},
-            "output": "success"
-        }
-    ]
-)
-
-# Activate application
-app_activate = Satellite(
-    name="app_activate",
-    description="Bring application to front",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.SAFE,
-    applescript_template="""
+        "examples": [
+            {
+                "input": {"name": "Music"},
+                "output": "success"
+            }
+        ]
+    },
+    # Activate application
+    {
+        "name": "app_activate",
+        "description": "Bring application to front",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.SAFE,
+        "applescript_template": """
     tell application "{{ name }}"
         activate
     end tell
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Safari"},
-            "output": "success"
-        }
-    ]
-)
-
-# Get running applications
-app_get_running = Satellite(
-    name="app_get_running",
-    description="Get list of running applications",
-    category="apps",
-    parameters=[],
-    safety_level=SafetyLevel.SAFE,
-    applescript_template="""
+        "examples": [
+            {
+                "input": {"name": "Safari"},
+                "output": "success"
+            }
+        ]
+    },
+    # Get running applications
+    {
+        "name": "app_get_running",
+        "description": "Get list of running applications",
+        "category": "apps",
+        "parameters": [],
+        "safety_level": SafetyLevel.SAFE,
+        "applescript_template": """
     tell application "System Events"
-        set runningApps = {}
+        set runningApps to {}
         set allProcesses to every process
 
         repeat with currentProcess in allProcesses
@@ -160,116 +155,83 @@ app_get_running = Satellite(
         end repeat
     end tell
 
-    return my list(runningApps)
-    """,
-    result_parser=lambda x: sorted(x.split(",") if x and x != "my list()" else []),
-    examples=[
-        {
-            "input": {},
-            "output": {"apps": ["Finder", "Safari", "Music"]}
-        }
-    ]
-)
-
-# Force quit application
-app_force_quit = Satellite(
-    name="app_force_quit",
-    description="Force quit application",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.MODERATE,
-    applescript_template="""
+    """ + applescript_join("runningApps"),
+        "result_parser": _parse_app_list,
+        "examples": [
+            {
+                "input": {},
+                "output": {"apps": ["Finder", "Safari", "Music"]}
+            }
+        ]
+    },
+    # Force quit application
+    {
+        "name": "app_force_quit",
+        "description": "Force quit application",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.MODERATE,
+        "applescript_template": """
     tell application "{{ name }}"
     quit
     end tell
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Calculator"},
-            "output": "success"
-        }
-    ]
-)
-
-# Hide application
-app_hide = Satellite(
-    name="app_hide",
-    description="Hide application",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.MODERATE,
-    applescript_template="""
-    tell application "{{ name }}"
-    activate
-    tell application "System Events"
-        set visible of process (first process whose name is "{{ name }}") to false
-    end tell
+        "examples": [
+            {
+                "input": {"name": "Calculator"},
+                "output": "success"
+            }
+        ]
+    },
+    # Hide application
+    {
+        "name": "app_hide",
+        "description": "Hide application",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.MODERATE,
+        "applescript_template": """
+    tell application "{{ name }}" to activate
+    tell application "System Events" to set visible of (first process whose name is "{{ name }}") to false
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Safari"},
-            "output": "success"
-        }
-    ]
-)
-
-# Show application
-app_show = Satellite(
-    name="app_show",
-    description="Show hidden application",
-    category="apps",
-    parameters=[
-        SatelliteParameter(
-            name="name",
-            type="string",
-            description="Application name",
-            required=True
-        )
-    ],
-    safety_level=SafetyLevel.MODERATE,
-    applescript_template="""
-    tell application "{{ name }}"
-    activate
-    tell application "System Events"
-        set visible of process (first process whose name is "{{ name }}") to true
-    end tell
+        "examples": [
+            {
+                "input": {"name": "Safari"},
+                "output": "success"
+            }
+        ]
+    },
+    # Show application
+    {
+        "name": "app_show",
+        "description": "Show hidden application",
+        "category": "apps",
+        "parameters": [_APP_NAME_PARAM],
+        "safety_level": SafetyLevel.MODERATE,
+        "applescript_template": """
+    tell application "{{ name }}" to activate
+    tell application "System Events" to set visible of (first process whose name is "{{ name }}") to true
 
     return "success"
     """,
-    examples=[
-        {
-            "input": {"name": "Safari"},
-            "output": "success"
-        }
-    ]
+        "examples": [
+            {
+                "input": {"name": "Safari"},
+                "output": "success"
+            }
+        ]
+    },
 )
 
+for _spec in _SPECS:
+    globals()[_spec["name"]] = Satellite.from_spec(_spec)
+
 # Export all app satellites
-__all__ = [
-    "app_list",
-    "app_launch",
-    "app_quit",
-    "app_activate",
-    "app_get_running",
-    "app_force_quit",
-    "app_hide",
-    "app_show",
-]
+__all__ = [_spec["name"] for _spec in _SPECS]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,8 +1,47 @@
 """Calendar station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser
-import json
+from orbit.core.templating import FIELD_SEPARATOR, RECORD_SEPARATOR, applescript_join
+from orbit.parsers import RecordResultParser, cached_parser
+from types import MappingProxyType
+
+# Polling callers usually see unchanged output, so parsed results are
+# memoized by raw string. Dates contain commas, so records are joined
+# with RECORD_SEPARATOR and fields with FIELD_SEPARATOR.
+_parse_calendars = cached_parser(
+    RecordResultParser(("name", "writable", "subscribed")).parse
+)
+_EVENT_FIELDS = ("summary", "start", "end", "location", "status", "calendar")
+
+
+def _iter_rows(output: str, sep: str = RECORD_SEPARATOR):
+    """Yield separator-delimited rows without materializing a split list.
+
+    Args:
+        output: Raw script output
+        sep: Row separator
+
+    Yields:
+        Each row in order
+    """
+    start = 0
+    end = len(output)
+    while start < end:
+        index = output.find(sep, start)
+        if index == -1:
+            index = end
+        yield output[start:index]
+        start = index + 1
+
+
+@cached_parser
+def _parse_events(output: str) -> list:
+    """Parse six-field event records."""
+    # Event lists can be large, so rows are consumed lazily
+    return [
+        dict(zip(_EVENT_FIELDS, row.split(FIELD_SEPARATOR, 5)))
+        for row in _iter_rows(output)
+    ]
 
 
 # List calendars
@@ -32,17 +71,12 @@ calendar_list_calendars = Satellite(
                 set isSubscribed to isSubscribed as string
             end if
 
-            if (count of calendarList) = 0 then
-                set end of calendarList to (calendarName & "|" & (isWritable as string) & "|" & isSubscribed)
-            else
-                set end of calendarList to "," & (calendarName & "|" & (isWritable as string) & "|" & isSubscribed)
-            end if
+            set end of calendarList to (calendarName & (character id 31) & (isWritable as string) & (character id 31) & isSubscribed)
         end repeat
     end tell
 
-    return calendarList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "writable", "subscribed"], item.split("|"))) for item in x.split(",")] if x else [],
+    """ + applescript_join("calendarList", RECORD_SEPARATOR),
+    result_parser=_parse_calendars,
     examples=[
         {
             "input": {},
@@ -82,11 +116,11 @@ calendar_get_events = Satellite(
     ],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
-    -- Parse date string in a locale-independent way
-    set startDate to parseISODate("{{ start_date }}")
+    -- Dates are parsed in Python and assigned component-wise
+    {{ start_date | applescript_date("startDate") }}
 
     {% if end_date %}
-    set endDate to parseISODate("{{ end_date }}")
+    {{ end_date | applescript_date("endDate") }}
     {% else %}
     set endDate to startDate + (7 * days)
     {% endif %}
@@ -102,62 +136,34 @@ calendar_get_events = Satellite(
         {% endif %}
 
         repeat with currentCalendar in allCalendars
-            set allEvents to every event of currentCalendar
+            -- Let Calendar evaluate the date range instead of fetching
+            -- and comparing every event with separate Apple events
+            set matchingEvents to (every event of currentCalendar whose start date is greater than or equal to startDate and start date is less than or equal to endDate)
 
-            repeat with currentEvent in allEvents
+            repeat with currentEvent in matchingEvents
                 set eventStart to start date of currentEvent
+                set eventName to summary of currentEvent
+                set eventEnd to end date of currentEvent
+                set eventLocation to location of currentEvent
+                set eventStatus to status of currentEvent
 
-                -- Manual date comparison (more reliable)
-                if (eventStart is greater than or equal to startDate) and (eventStart is less than or equal to endDate) then
-                    set eventName to summary of currentEvent
-                    set eventEnd to end date of currentEvent
-                    set eventLocation to location of currentEvent
-                    set eventStatus to status of currentEvent
-
-                    -- Get calendar name with error handling
-                    try
-                        set eventCalendar to name of calendar of currentEvent
-                    on error
-                        set eventCalendar to name of currentCalendar
-                    end try
-
-                    set eventLocation to eventLocation & ""
-                    set eventStatus to eventStatus & ""
-
-                    if (count of eventList) = 0 then
-                        set end of eventList to (eventName & "|" & (eventStart as string) & "|" & (eventEnd as string) & "|" & eventLocation & "|" & eventStatus & "|" & eventCalendar)
-                    else
-                        set end of eventList to "," & (eventName & "|" & (eventStart as string) & "|" & (eventEnd as string) & "|" & eventLocation & "|" & eventStatus & "|" & eventCalendar)
-                    end if
-                end if
+                -- Get calendar name with error handling
+                try
+                    set eventCalendar to name of calendar of currentEvent
+                on error
+                    set eventCalendar to name of currentCalendar
+                end try
+
+                set eventLocation to eventLocation & ""
+                set eventStatus to eventStatus & ""
+
+                set end of eventList to (eventName & (character id 31) & (eventStart as string) & (character id 31) & (eventEnd as string) & (character id 31) & eventLocation & (character id 31) & eventStatus & (character id 31) & eventCalendar)
             end repeat
         end repeat
     end tell
 
-    return eventList as string
-
-    on parseISODate(isoDate)
-        -- Parse YYYY-MM-DD format and create a date object
-        -- This method uses current date and modifies it, which is more reliable
-        set savedDelimiters to AppleScript's text item delimiters
-        set AppleScript's text item delimiters to "-"
-        set dateParts to text items of isoDate
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set y to item 1 of dateParts as integer
-        set m to item 2 of dateParts as integer
-        set d to item 3 of dateParts as integer
-
-        set newDate to current date
-        set newDate's year to y
-        set newDate's month to m
-        set newDate's day to d
-        set newDate's time to 0
-
-        return newDate
-    end parseISODate
-    """,
-    result_parser=lambda x: [dict(zip(["summary", "start", "end", "location", "status", "calendar"], item.split("|", 5))) for item in x.split(",")] if x else [],
+    """ + applescript_join("eventList", RECORD_SEPARATOR),
+    result_parser=_parse_events,
     examples=[
         {
             "input": {"start_date": "2026-01-27"},
@@ -222,9 +228,9 @@ calendar_create_event = Satellite(
     ],
     safety_level=SafetyLevel.MODERATE,
     applescript_template="""
-    -- Parse date strings in a locale-independent way
-    set startDate to parseDateTime("{{ start_date }}")
-    set endDate to parseDateTime("{{ end_date }}")
+    -- Dates are parsed in Python and assigned component-wise
+    {{ start_date | applescript_date("startDate") }}
+    {{ end_date | applescript_date("endDate") }}
 
     tell application "Calendar"
         {% if calendar %}
@@ -245,44 +251,6 @@ calendar_create_event = Satellite(
 
         return "success"
     end tell
-
-    on parseDateTime(dateTimeStr)
-        -- Parse YYYY-MM-DD HH:MM format and create a date object
-        set savedDelimiters to AppleScript's text item delimiters
-        set AppleScript's text item delimiters to " "
-        set dateTimeParts to text items of dateTimeStr
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set datePart to item 1 of dateTimeParts
-        set timePart to item 2 of dateTimeParts
-
-        -- Parse date
-        set AppleScript's text item delimiters to "-"
-        set dateParts to text items of datePart
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set y to item 1 of dateParts as integer
-        set m to item 2 of dateParts as integer
-        set d to item 3 of dateParts as integer
-
-        -- Parse time
-        set AppleScript's text item delimiters to ":"
-        set timeParts to text items of timePart
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set hr to item 1 of timeParts as integer
-        set mn to item 2 of timeParts as integer
-
-        set newDate to current date
-        set newDate's year to y
-        set newDate's month to m
-        set newDate's day to d
-        set newDate's hours to hr
-        set newDate's minutes to mn
-        set newDate's seconds to 0
-
-        return newDate
-    end parseDateTime
     """,
     examples=[
         {
@@ -318,8 +286,8 @@ calendar_delete_event = Satellite(
     ],
     safety_level=SafetyLevel.DANGEROUS,
     applescript_template="""
-    -- Parse date string in a locale-independent way
-    set startDate to parseDateTime("{{ start_date }}")
+    -- Date is parsed in Python and assigned component-wise
+    {{ start_date | applescript_date("startDate") }}
 
     tell application "Calendar"
         set targetEvent to missing value
@@ -354,44 +322,6 @@ calendar_delete_event = Satellite(
             return "Error: Event not found"
         end if
     end tell
-
-    on parseDateTime(dateTimeStr)
-        -- Parse YYYY-MM-DD HH:MM format and create a date object
-        set savedDelimiters to AppleScript's text item delimiters
-        set AppleScript's text item delimiters to " "
-        set dateTimeParts to text items of dateTimeStr
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set datePart to item 1 of dateTimeParts
-        set timePart to item 2 of dateTimeParts
-
-        -- Parse date
-        set AppleScript's text item delimiters to "-"
-        set dateParts to text items of datePart
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set y to item 1 of dateParts as integer
-        set m to item 2 of dateParts as integer
-        set d to item 3 of dateParts as integer
-
-        -- Parse time
-        set AppleScript's text item delimiters to ":"
-        set timeParts to text items of timePart
-        set AppleScript's text item delimiters to savedDelimiters
-
-        set hr to item 1 of timeParts as integer
-        set mn to item 2 of timeParts as integer
-
-        set newDate to current date
-        set newDate's year to y
-        set newDate's month to m
-        set newDate's day to d
-        set newDate's hours to hr
-        set newDate's minutes to mn
-        set newDate's seconds to 0
-
-        return newDate
-    end parseDateTime
     """,
     examples=[
         {
@@ -408,3 +338,6 @@ __all__ = [
     "calendar_create_event",
     "calendar_delete_event",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
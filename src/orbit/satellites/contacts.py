@@ -1,8 +1,39 @@
 """Contacts station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser
-import json
+from orbit.core.templating import applescript_join
+from types import MappingProxyType
+
+# Field names of the "|"-separated record returned by contacts_get
+_CONTACT_FIELDS = ("name", "email", "phone1", "phone2", "company", "address", "birthday", "note")
+
+
+def _parse_contacts_search(output: str) -> list:
+    """Parse newline-separated five-field contact records."""
+    contacts = []
+    # Lines, not commas, separate records: company names may contain commas
+    for line in output.splitlines():
+        name, _, rest = line.partition("|")
+        email, _, rest = rest.partition("|")
+        phone1, _, rest = rest.partition("|")
+        phone2, _, company = rest.partition("|")
+        contacts.append({
+            "name": name,
+            "email": email,
+            "phone1": phone1,
+            "phone2": phone2,
+            "company": company,
+        })
+    return contacts
+
+
+def _parse_contacts_get(output: str) -> dict:
+    """Parse a single "|"-separated contact record or an error message."""
+    # The template only emits errors as an "Error: ..." prefix; avoid
+    # scanning long note fields for the marker
+    if output.startswith("Error:"):
+        return {"error": output}
+    return dict(zip(_CONTACT_FIELDS, output.split("|", 7)))
 
 
 # Search contacts
@@ -21,34 +52,36 @@ contacts_search = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Contacts"
-        set results to {}
-        set allPeople to every person
-
-        repeat with currentPerson in allPeople
-            set personName to name of currentPerson
-            if personName contains "{{ query }}" then
-                set personEmail to value of email of currentPerson
-                set personPhone1 to value of phone 1 of currentPerson
-                set personPhone2 to value of phone 2 of currentPerson
-                set personCompany to organization of currentPerson
-
-                set personEmail to personEmail & ""
-                set personPhone1 to personPhone1 & ""
-                set personPhone2 to personPhone2 & ""
-                set personCompany to personCompany & ""
-
-                if (count of results) = 0 then
-                    set end of results to (personName & "|" & personEmail & "|" & personPhone1 & "|" & personPhone2 & "|" & personCompany)
-                else
-                    set end of results to "," & (personName & "|" & personEmail & "|" & personPhone1 & "|" & personPhone2 & "|" & personCompany)
-                end if
-            end if
-        end repeat
+        set matches to a reference to (every person whose name contains "{{ query }}")
+
+        -- One Apple event per column instead of per person and property
+        set nameList to name of matches
+        set emailList to value of emails of matches
+        set phoneList to value of phones of matches
+        set companyList to organization of matches
     end tell
 
-    return results as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "email", "phone1", "phone2", "company"], item.split("|", 4))) for item in x.split(",")] if x else [],
+    set results to {}
+    set savedRecordDelimiters to AppleScript's text item delimiters
+    set AppleScript's text item delimiters to "|"
+    repeat with k from 1 to count of nameList
+        set personEmails to item k of emailList
+        set personPhones to item k of phoneList
+        set personEmail to ""
+        set personPhone1 to ""
+        set personPhone2 to ""
+        if (count of personEmails) > 0 then set personEmail to item 1 of personEmails
+        if (count of personPhones) > 0 then set personPhone1 to item 1 of personPhones
+        if (count of personPhones) > 1 then set personPhone2 to item 2 of personPhones
+        set personCompany to item k of companyList
+        if personCompany is missing value then set personCompany to ""
+
+        set end of results to ({item k of nameList, personEmail, personPhone1, personPhone2, personCompany} as string)
+    end repeat
+    set AppleScript's text item delimiters to savedRecordDelimiters
+
+    """ + applescript_join("results", "\n"),
+    result_parser=_parse_contacts_search,
     examples=[
         {
             "input": {"query": "John"},
@@ -80,22 +113,41 @@ contacts_get = Satellite(
         set targetPerson to first person whose name is "{{ name }}"
 
         if targetPerson exists then
-            set personName to name of targetPerson
-            set personEmail to value of email of targetPerson
-            set personPhone1 to value of phone 1 of targetPerson
-            set personPhone2 to value of phone 2 of targetPerson
-            set personCompany to organization of targetPerson
-            set personAddress to postal address of targetPerson
-            set personBirthday to birthday of targetPerson
-            set personNote = note of targetPerson
-
-            set personEmail to personEmail & ""
-            set personPhone1 to personPhone1 & ""
-            set personPhone2 to personPhone2 & ""
-            set personCompany to personCompany & ""
-            set personAddress to personAddress & ""
-            set personBirthday to personBirthday as string & ""
-            set personNote to personNote & ""
+            -- One Apple event for all plain properties of the person
+            set personProps to properties of targetPerson
+            set personName to name of personProps
+
+            -- Missing elements raise, missing properties are missing value
+            try
+                set personEmail to value of email 1 of targetPerson
+            on error
+                set personEmail to ""
+            end try
+            try
+                set personPhone1 to value of phone 1 of targetPerson
+            on error
+                set personPhone1 to ""
+            end try
+            try
+                set personPhone2 to value of phone 2 of targetPerson
+            on error
+                set personPhone2 to ""
+            end try
+            try
+                set personAddress to formatted address of address 1 of targetPerson
+            on error
+                set personAddress to ""
+            end try
+            set personCompany to organization of personProps
+            if personCompany is missing value then set personCompany to ""
+            set personBirthday to birth date of personProps
+            if personBirthday is missing value then
+                set personBirthday to ""
+            else
+                set personBirthday to personBirthday as string
+            end if
+            set personNote to note of personProps
+            if personNote is missing value then set personNote to ""
 
             return personName & "|" & personEmail & "|" & personPhone1 & "|" & personPhone2 & "|" & personCompany & "|" & personAddress & "|" & personBirthday & "|" & personNote
         else
@@ -103,7 +155,7 @@ contacts_get = Satellite(
         end if
     end tell
     """,
-    result_parser=lambda x: dict(zip(["name", "email", "phone1", "phone2", "company", "address", "birthday", "note"], x.split("|", 7))) if "Error:" not in x else {"error": x},
+    result_parser=_parse_contacts_get,
     examples=[
         {
             "input": {"name": "John Doe"},
@@ -202,29 +254,23 @@ contacts_list_all = Satellite(
             type="integer",
             description="Maximum number of contacts",
             required=False,
-            default=50
+            default=50,
+            preprocess=int
         )
     ],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Contacts"
-        set contactList to {}
         set limitCount to {{ limit }}
+        set totalCount to count of people
+        if limitCount > totalCount then set limitCount to totalCount
+        if limitCount < 1 then return ""
 
-        set allContacts to every person
-        repeat with i from 1 to limitCount
-            if i > count of allContacts then
-                exit repeat
-            end if
-
-            set personName to name of currentPerson
-            set end of contactList to personName
-        end repeat
+        set contactList to name of people 1 thru limitCount
     end tell
 
-    return my list(contactList)
-    """,
-    result_parser=lambda x: x.split(",") if x and x != "my list()" else [],
+    """ + applescript_join("contactList"),
+    result_parser=lambda x: x.split(",") if x else [],
     examples=[
         {
             "input": {"limit": 10},
@@ -240,3 +286,6 @@ __all__ = [
     "contacts_create",
     "contacts_list_all",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,9 +1,48 @@
 """File communication satellites."""
 
-from typing import Optional
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import JSONResultParser, DelimitedResultParser
-import json
+from orbit.core.templating import applescript_join, expand_path
+from orbit.parsers import DelimitedResultParser
+from types import MappingProxyType
+
+# Field names of the "|"-separated record returned by file_get_info
+_FILE_INFO_FIELDS = ("name", "type", "size", "created", "modified")
+
+
+def _iter_file_list(output: str):
+    """Yield file records from newline-separated "name|path|type|size" rows.
+
+    The output is walked once with str.find/str.partition, without building
+    intermediate split lists, so streaming consumers never hold more than
+    the raw output and the current record.
+
+    Args:
+        output: Raw file_list script output
+
+    Yields:
+        Dict with name, path, type and size for each row
+    """
+    start = 0
+    end = len(output)
+    while start < end:
+        index = output.find("\n", start)
+        if index == -1:
+            index = end
+        name, _, rest = output[start:index].partition("|")
+        path, _, rest = rest.partition("|")
+        kind, _, size = rest.partition("|")
+        yield {"name": name, "path": path, "type": kind, "size": size}
+        start = index + 1
+
+
+def _parse_file_list(output: str) -> list:
+    """Parse file_list output into a list of file records."""
+    return list(_iter_file_list(output))
+
+
+def _parse_file_search(output: str) -> list:
+    """Parse the newline-separated path list."""
+    return output.splitlines()
 
 
 # List files
@@ -16,7 +55,8 @@ file_list = Satellite(
             name="path",
             type="string",
             description="Directory path (supports ~ for home directory)",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="recursive",
@@ -56,19 +96,14 @@ file_list = Satellite(
                     set filePath to POSIX path of fileRef
                     set fileType to kind of fileRef
                     set fileSize to size of fileRef
-                    if (count of fileList) = 0 then
-                        set end of fileList to (fileName & "|" & filePath & "|" & fileType & "|" & (fileSize as string))
-                    else
-                        set end of fileList to "," & (fileName & "|" & filePath & "|" & fileType & "|" & (fileSize as string))
-                    end if
+                    set end of fileList to (fileName & "|" & filePath & "|" & fileType & "|" & (fileSize as string))
                 end if
             end try
         end repeat
     end tell
 
-    return fileList as string
-    """,
-    result_parser=lambda x: json.dumps([dict(zip(["name", "path", "type", "size"], item.split("|"))) for item in x.split(",")]),
+    """ + applescript_join("fileList", "\n"),
+    result_parser=_parse_file_list,
     examples=[
         {
             "input": {"path": "~", "recursive": False},
@@ -91,7 +126,8 @@ file_read = Satellite(
             name="path",
             type="string",
             description="File path to read",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="encoding",
@@ -132,7 +168,8 @@ file_write = Satellite(
             name="path",
             type="string",
             description="File path to write",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="content",
@@ -157,7 +194,7 @@ file_write = Satellite(
     ],
     safety_level=SafetyLevel.MODERATE,
     applescript_template="""
-    set filePath to POSIX path of (POSIX file "{{ path }}")
+    set filePath to "{{ path }}"
     set contentText to "{{ content }}"
 
     tell application "System Events"
@@ -191,12 +228,13 @@ file_delete = Satellite(
             name="path",
             type="string",
             description="File path to delete",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.DANGEROUS,
     applescript_template="""
-    set filePath to POSIX path of "{{ path }}"
+    set filePath to "{{ path }}"
 
     tell application "Finder"
         try
@@ -225,19 +263,21 @@ file_move = Satellite(
             name="source",
             type="string",
             description="Source file path",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="destination",
             type="string",
             description="Destination path",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.MODERATE,
     applescript_template="""
-    set sourcePath to POSIX path of "{{ source }}"
-    set destPath to POSIX path of "{{ destination }}"
+    set sourcePath to "{{ source }}"
+    set destPath to "{{ destination }}"
 
     tell application "Finder"
         try
@@ -266,19 +306,21 @@ file_copy = Satellite(
             name="source",
             type="string",
             description="Source file path",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="destination",
             type="string",
             description="Destination path",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.MODERATE,
     applescript_template="""
-    set sourcePath to POSIX path of "{{ source }}"
-    set destPath to POSIX path of "{{ destination }}"
+    set sourcePath to "{{ source }}"
+    set destPath to "{{ destination }}"
 
     tell application "Finder"
         try
@@ -300,14 +342,15 @@ file_copy = Satellite(
 # Search files
 file_search = Satellite(
     name="file_search",
-    description="Search files by name in a directory",
+    description="Search files by name in a directory using the Spotlight index",
     category="files",
     parameters=[
         SatelliteParameter(
             name="path",
             type="string",
             description="Directory to search in",
-            required=True
+            required=True,
+            preprocess=expand_path
         ),
         SatelliteParameter(
             name="query",
@@ -324,33 +367,18 @@ file_search = Satellite(
     ],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
-    set folderPath to POSIX path of "{{ path }}"
+    set folderPath to "{{ path }}"
     set searchQuery to "{{ query }}"
-    set results to {}
 
-    tell application "Finder"
-        set folderRef to folder folderPath
-        set fileRefs to every file of entire contents of folderRef
-
-        repeat with fileRef in fileRefs
-            try
-                set fileName to name of fileRef
-                if fileName contains searchQuery then
-                    {% if file_type %}
-                    if fileName ends with ".{{ file_type }}" then
-                        set end of results to (POSIX path of (fileRef as alias))
-                    end if
-                    {% else %}
-                    set end of results to (POSIX path of (fileRef as alias))
-                    {% endif %}
-                end if
-            end try
-        end repeat
-    end tell
+    -- Spotlight's index answers name queries without walking the tree
+    set shellCommand to "mdfind -onlyin " & quoted form of folderPath & " -name " & quoted form of searchQuery
+    {% if file_type %}
+    set shellCommand to shellCommand & " | grep -i -e " & quoted form of "[.]{{ file_type }}$" & " || true"
+    {% endif %}
 
-    return (my list results) as string
+    return do shell script shellCommand without altering line endings
     """,
-    result_parser=lambda x: json.dumps(x.split(", ")) if x else json.dumps([]),
+    result_parser=_parse_file_search,
     examples=[
         {
             "input": {"path": "~", "query": "orbit", "file_type": "txt"},
@@ -394,12 +422,13 @@ file_create_directory = Satellite(
             name="path",
             type="string",
             description="Directory path to create",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.MODERATE,
     applescript_template="""
-    set dirPath to POSIX path of "{{ path }}"
+    set dirPath to "{{ path }}"
 
     tell application "Finder"
         try
@@ -428,12 +457,13 @@ file_get_info = Satellite(
             name="path",
             type="string",
             description="File path",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
-    set filePath to POSIX path of "{{ path }}"
+    set filePath to "{{ path }}"
 
     tell application "System Events"
         try
@@ -450,10 +480,7 @@ file_get_info = Satellite(
         end try
     end tell
     """,
-    result_parser=DelimitedResultParser(
-        delimiter="|",
-        field_names=["name", "type", "size", "created", "modified"]
-    ),
+    result_parser=DelimitedResultParser.get(delimiter="|", field_names=_FILE_INFO_FIELDS),
     examples=[
         {
             "input": {"path": "~/Documents/file.txt"},
@@ -481,3 +508,6 @@ __all__ = [
     "file_create_directory",
     "file_get_info",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,8 +1,9 @@
 """Finder operation satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
+from orbit.core.templating import applescript_join, expand_path
 from orbit.parsers import DelimitedResultParser
-import json
+from types import MappingProxyType
 
 
 # Open folder in Finder
@@ -15,7 +16,8 @@ finder_open_folder = Satellite(
             name="path",
             type="string",
             description="Folder path to open",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -27,7 +29,7 @@ finder_open_folder = Satellite(
         open folderPath
     end tell
 
-    return "success
+    return "success"
     """,
     examples=[
         {
@@ -54,7 +56,8 @@ finder_new_folder = Satellite(
             type="string",
             description="Parent folder path (default: Desktop)",
             required=False,
-            default="~/Desktop"
+            default="~/Desktop",
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.MODERATE,
@@ -86,7 +89,8 @@ finder_reveal = Satellite(
             name="path",
             type="string",
             description="File path to reveal",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -117,7 +121,7 @@ finder_get_selection = Satellite(
     applescript_template="""
     tell application "Finder"
         set selectionList to {}
-        set selectedItems = selection
+        set selectedItems to selection
 
         repeat with selectedItem in selectedItems
             set itemPath to POSIX path of (selectedItem as alias)
@@ -125,9 +129,8 @@ finder_get_selection = Satellite(
         end repeat
     end tell
 
-    return my list(selectionList)
-    """,
-    result_parser=lambda x: x.split(",") if x and x != "my list()" else [],
+    """ + applescript_join("selectionList", "\n"),
+    result_parser=str.splitlines,
     examples=[
         {
             "input": {},
@@ -171,18 +174,19 @@ finder_get_trash_info = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Finder"
-        set trashCount to count of items in trash
-        set trashSize = 0
+        set trashCount to count of items of trash
+        -- One Apple event for every size; summed locally below
+        set sizeList to physical size of every item of trash
+    end tell
 
-        repeat with item in (every item of trash)
-            try
-                set trashSize to trashSize + (physical size of item)
-            end try
-        end repeat
+    set trashSize to 0
+    repeat with itemSize in sizeList
+        if contents of itemSize is not missing value then set trashSize to trashSize + itemSize
+    end repeat
 
-        return trashCount & "|" & (trashSize as string)
+    return (trashCount as string) & "|" & (trashSize as string)
     """,
-    result_parser=DelimitedResultParser(delimiter="|", field_names=["count", "size"]),
+    result_parser=DelimitedResultParser.get(delimiter="|", field_names=["count", "size"]),
     examples=[
         {
             "input": {},
@@ -200,3 +204,6 @@ __all__ = [
     "finder_empty_trash",
     "finder_get_trash_info",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,6 +1,83 @@
 """Mail station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
+from orbit.core.exceptions import ParameterValidationError
+from orbit.core.templating import RECORD_SEPARATOR, applescript_join
+from orbit.parsers import RecordResultParser, cached_parser
+from types import MappingProxyType
+
+# Field names of the "|"-separated record returned by mail_get
+_MESSAGE_FIELDS = ("content", "sender")
+
+# Polling callers usually see unchanged output, so parsed results are
+# memoized by raw string.
+_parse_inbox = cached_parser(
+    RecordResultParser(("subject", "sender", "date", "read")).parse
+)
+
+
+@cached_parser
+def _parse_message(output: str) -> dict:
+    """Parse a "content|sender" record or an error message.
+
+    Failures are reported with a leading "Error:", so the check stays O(1)
+    however long the message body is. The sender is split off the end, as
+    the body itself may contain "|".
+    """
+    if output.startswith("Error:"):
+        return {"error": output}
+    return dict(zip(_MESSAGE_FIELDS, output.rsplit("|", 1)))
+
+
+_parse_batch_records = RecordResultParser(("subject", "status")).parse
+
+
+def _parse_batch_results(output: str) -> list:
+    """Parse the subject and "ok" or error message records of a batch operation."""
+    results = []
+    for record in _parse_batch_records(output):
+        status = record.get("status", "")
+        if status == "ok":
+            results.append({"subject": record["subject"], "ok": True})
+        else:
+            results.append({"subject": record["subject"], "ok": False, "error": status})
+    return results
+
+
+# Most subjects accepted by one batch call
+_MAX_BATCH_SUBJECTS = 500
+
+
+def _validate_subjects(parameters: dict) -> None:
+    """Check that "subjects" is a list of 1 to 500 subject strings.
+
+    A plain string would otherwise be iterated per character, and subjects
+    over the limit must be rejected rather than silently dropped.
+
+    Raises:
+        ParameterValidationError: If "subjects" has the wrong shape
+    """
+    subjects = parameters.get("subjects")
+    if not isinstance(subjects, (list, tuple)):
+        raise ParameterValidationError(
+            f"Parameter 'subjects' must be a list of strings, got {type(subjects).__name__}"
+        )
+    if not 1 <= len(subjects) <= _MAX_BATCH_SUBJECTS:
+        raise ParameterValidationError(
+            f"Parameter 'subjects' must have 1 to {_MAX_BATCH_SUBJECTS} entries, "
+            f"got {len(subjects)}"
+        )
+    if not all(isinstance(subject, str) for subject in subjects):
+        raise ParameterValidationError("Parameter 'subjects' must only contain strings")
+
+
+# Builds subjectList from the requested subjects, see _validate_subjects()
+_SUBJECT_LIST = """
+    set subjectList to {}
+    {% for subject in subjects %}
+    set end of subjectList to "{{ subject }}"
+    {% endfor %}
+"""
 
 
 # Send email
@@ -9,31 +86,31 @@ mail_send = Satellite(
     description="Send an email",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="to",
             type="string",
             description="Recipient email address",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="subject",
             type="string",
             description="Email subject",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="body",
             type="string",
             description="Email body content",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="cc",
             type="string",
             description="CC recipients (comma-separated)",
             required=False
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="bcc",
             type="string",
             description="BCC recipients (comma-separated)",
@@ -78,12 +155,13 @@ mail_list_inbox = Satellite(
     description="List emails in inbox",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="limit",
             type="integer",
             description="Maximum number of emails to return",
             required=False,
-            default=10
+            default=10,
+            preprocess=int
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -103,20 +181,15 @@ mail_list_inbox = Satellite(
             set currentMessage to item i of allMessages
             set messageSubject to subject of currentMessage
             set messageSender to sender of currentMessage
-            set messageDate = date received of currentMessage
-            set messageRead (read status of currentMessage as string)
+            set messageDate to date received of currentMessage
+            set messageRead to (read status of currentMessage as string)
 
-            if (count of inboxMessages) = 0 then
-                set end of inboxMessages to (messageSubject & "|" & messageSender & "|" & messageDate & "|" & messageRead)
-            else
-                set end of inboxMessages to "," & (messageSubject & "|" & messageSender & "|" & messageDate & "|" & messageRead)
-            end if
+            set end of inboxMessages to (messageSubject & (character id 31) & messageSender & (character id 31) & messageDate & (character id 31) & messageRead)
         end repeat
     end tell
 
-    return inboxMessages as string
-    """,
-    result_parser=lambda x: [dict(zip(["subject", "sender", "date", "read"], item.split("|", 3))) for item in x.split(",")] if x else [],
+    """ + applescript_join("inboxMessages", RECORD_SEPARATOR),
+    result_parser=_parse_inbox,
     examples=[
         {
             "input": {"limit": 5},
@@ -135,7 +208,7 @@ mail_get = Satellite(
     description="Get email content by subject",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="subject",
             type="string",
             description="Email subject to retrieve",
@@ -156,7 +229,7 @@ mail_get = Satellite(
         end if
     end tell
     """,
-    result_parser=lambda x: dict(zip(["content", "sender"], x.split("|", 1))) if "Error:" not in x else {"error": x},
+    result_parser=_parse_message,
     examples=[
         {
             "input": {"subject": "Meeting Notes"},
@@ -171,7 +244,7 @@ mail_delete = Satellite(
     description="Delete an email",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="subject",
             type="string",
             description="Subject of email to delete",
@@ -205,7 +278,7 @@ mail_mark_as_read = Satellite(
     description="Mark email as read",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="subject",
             type="string",
             description="Subject of email to mark",
@@ -238,7 +311,7 @@ mail_mark_as_unread = Satellite(
     description="Mark email as unread",
     category="mail",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="subject",
             type="string",
             description="Subject of email to mark",
@@ -266,6 +339,104 @@ mail_mark_as_unread = Satellite(
     ]
 )
 
+# Batch operations: one osascript run for many messages. Each subject gets
+# its own try block so partial failures are reported per message.
+mail_batch_mark = Satellite(
+    name="mail_batch_mark",
+    description="Mark several inbox emails as read or unread in one call (up to 500)",
+    category="mail",
+    parameters=[
+        SatelliteParameter.get(
+            name="subjects",
+            type="array",
+            description="Subjects of the emails to mark (1 to 500)",
+            required=True
+        ),
+        SatelliteParameter.get(
+            name="read",
+            type="boolean",
+            description="Mark as read (true) or unread (false)",
+            required=False,
+            default=True
+        )
+    ],
+    safety_level=SafetyLevel.MODERATE,
+    validator=_validate_subjects,
+    applescript_template=_SUBJECT_LIST + """
+    {% if read %}
+    set readStatus to true
+    {% else %}
+    set readStatus to false
+    {% endif %}
+    set results to {}
+    tell application "Mail"
+        set inboxRef to mailbox "INBOX"
+        repeat with subjectItem in subjectList
+            set subjectText to contents of subjectItem
+            try
+                set read status of (first message of inboxRef whose subject is subjectText) to readStatus
+                set end of results to (subjectText & (character id 31) & "ok")
+            on error errMsg
+                set end of results to (subjectText & (character id 31) & errMsg)
+            end try
+        end repeat
+    end tell
+
+    """ + applescript_join("results", RECORD_SEPARATOR),
+    result_parser=_parse_batch_results,
+    examples=[
+        {
+            "input": {"subjects": ["Meeting Update", "Weekly Report"], "read": True},
+            "output": [
+                {"subject": "Meeting Update", "ok": True},
+                {"subject": "Weekly Report", "ok": False, "error": "Can't get message 1 ..."}
+            ]
+        }
+    ]
+)
+
+mail_batch_delete = Satellite(
+    name="mail_batch_delete",
+    description="Delete several inbox emails in one call (up to 500)",
+    category="mail",
+    parameters=[
+        SatelliteParameter.get(
+            name="subjects",
+            type="array",
+            description="Subjects of the emails to delete (1 to 500)",
+            required=True
+        )
+    ],
+    safety_level=SafetyLevel.DANGEROUS,
+    validator=_validate_subjects,
+    applescript_template=_SUBJECT_LIST + """
+    set results to {}
+    tell application "Mail"
+        set inboxRef to mailbox "INBOX"
+        repeat with subjectItem in subjectList
+            set subjectText to contents of subjectItem
+            try
+                delete (first message of inboxRef whose subject is subjectText)
+                set end of results to (subjectText & (character id 31) & "ok")
+            on error errMsg
+                set end of results to (subjectText & (character id 31) & errMsg)
+            end try
+        end repeat
+    end tell
+
+    """ + applescript_join("results", RECORD_SEPARATOR),
+    result_parser=_parse_batch_results,
+    examples=[
+        {
+            "input": {"subjects": ["Old Email", "Spam"]},
+            "output": [
+                {"subject": "Old Email", "ok": True},
+                {"subject": "Spam", "ok": True}
+            ]
+        }
+    ]
+)
+
 # Export all mail satellites
 __all__ = [
     "mail_send",
@@ -274,4 +445,9 @@ __all__ = [
     "mail_delete",
     "mail_mark_as_read",
     "mail_mark_as_unread",
+    "mail_batch_mark",
+    "mail_batch_delete",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,8 +1,28 @@
 """Music station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser, JSONResultParser
-import json
+from orbit.core.templating import RECORD_SEPARATOR, applescript_join
+from orbit.parsers import RecordResultParser, cached_parser
+from types import MappingProxyType
+
+# Field names of the "|"-separated record returned by music_get_current
+_TRACK_FIELDS = ("name", "artist", "album", "duration", "position")
+
+
+# Polling callers usually see unchanged output, so parsed results are
+# memoized by raw string.
+@cached_parser
+def _parse_current_track(output: str) -> dict:
+    """Parse the current track record, or report a stopped player."""
+    if "No track" in output:
+        return {"status": "stopped"}
+    return dict(zip(_TRACK_FIELDS, output.split("|", 4)))
+
+
+_parse_search_results = cached_parser(
+    RecordResultParser(("name", "album", "artist")).parse
+)
+_parse_playlists = cached_parser(RecordResultParser(("name", "count")).parse)
 
 
 # Play
@@ -106,14 +126,13 @@ music_get_current = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Music"
-        activate
         set currentTrack to current track
         if exists currentTrack then
             set trackName to name of currentTrack
-            set trackArtist = artist of currentTrack
-            set trackAlbum = album of currentTrack
-            set trackDuration = duration of currentTrack
-            set trackPosition = player position of currentTrack
+            set trackArtist to artist of currentTrack
+            set trackAlbum to album of currentTrack
+            set trackDuration to duration of currentTrack
+            set trackPosition to player position of currentTrack
 
             return trackName & "|" & trackArtist & "|" & trackAlbum & "|" & trackDuration & "|" & trackPosition
         else
@@ -121,7 +140,7 @@ music_get_current = Satellite(
         end if
     end tell
     """,
-    result_parser=lambda x: dict(zip(["name", "artist", "album", "duration", "position"], x.split("|", 4))) if "No track" not in x else {"status": "stopped"},
+    result_parser=_parse_current_track,
     examples=[
         {
             "input": {},
@@ -142,7 +161,7 @@ music_set_volume = Satellite(
     description="Set Music app volume (0-100)",
     category="music",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="level",
             type="integer",
             description="Volume level (0-100)",
@@ -175,7 +194,6 @@ music_get_volume = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Music"
-        activate
         set soundVolume to sound volume
         return soundVolume as string
     end tell
@@ -194,7 +212,7 @@ music_play_track = Satellite(
     description="Play specific track by name",
     category="music",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="name",
             type="string",
             description="Track name to play",
@@ -228,35 +246,36 @@ music_search = Satellite(
     description="Search for tracks by name",
     category="music",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="query",
             type="string",
             description="Search query",
             required=True
+        ),
+        SatelliteParameter.get(
+            name="limit",
+            type="integer",
+            description="Maximum number of results, the first matches in library order",
+            required=False,
+            default=50,
+            preprocess=int
         )
     ],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Music"
-        activate
         set trackList to {}
-        set allTracks to every track
+        -- Music evaluates the whose clause itself, with substring semantics
+        set foundTracks to every track of library playlist 1 whose name contains "{{ query }}"
 
-        repeat with currentTrack in allTracks
-            set trackName to name of currentTrack
-            if trackName contains "{{ query }}" then
-                if (count of trackList) = 0 then
-                    set end of trackList to (trackName & "|" & (album of currentTrack) & "|" & (artist of currentTrack))
-                else
-                    set end of trackList to "," & (trackName & "|" & (album of currentTrack) & "|" & (artist of currentTrack))
-                end if
-            end if
+        repeat with currentTrack in foundTracks
+            if (count of trackList) >= {{ limit }} then exit repeat
+            set end of trackList to ((name of currentTrack) & (character id 31) & (album of currentTrack) & (character id 31) & (artist of currentTrack))
         end repeat
     end tell
 
-    return trackList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "album", "artist"], item.split("|", 2))) for item in x.split(",")] if x else [],
+    """ + applescript_join("trackList", RECORD_SEPARATOR),
+    result_parser=_parse_search_results,
     examples=[
         {
             "input": {"query": "love"},
@@ -278,24 +297,18 @@ music_get_playlists = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Music"
-        activate
-        set playlistList = {}
-        set allPlaylists = every playlist
+        set playlistList to {}
+        set allPlaylists to every playlist
 
         repeat with currentPlaylist in allPlaylists
-            set playlistName = name of currentPlaylist
-            set trackCount = count of tracks in currentPlaylist
-            if (count of playlistList) = 0 then
-                set end of playlistList to (playlistName & "|" & (trackCount as string))
-            else
-                set end of playlistList to "," & (playlistName & "|" & (trackCount as string))
-            end if
+            set playlistName to name of currentPlaylist
+            set trackCount to count of tracks in currentPlaylist
+            set end of playlistList to (playlistName & (character id 31) & (trackCount as string))
         end repeat
     end tell
 
-    return playlistList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "count"], item.split("|"))) for item in x.split(",")] if x else [],
+    """ + applescript_join("playlistList", RECORD_SEPARATOR),
+    result_parser=_parse_playlists,
     examples=[
         {
             "input": {},
@@ -345,3 +358,6 @@ __all__ = [
     "music_get_playlists",
     "music_shuffle",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,7 +1,38 @@
 """Notes station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser
+from orbit.core.templating import RECORD_SEPARATOR, applescript_join
+from orbit.parsers import RecordResultParser, cached_parser
+from types import MappingProxyType
+
+# Field names of the "|"-separated record returned by notes_get
+_NOTE_FIELDS = ("body", "created", "modified")
+
+# Polling callers usually see unchanged output, so parsed results are
+# memoized by raw string.
+_parse_notes = cached_parser(RecordResultParser(("name", "body", "id")).parse)
+_parse_search_results = cached_parser(
+    RecordResultParser(("name", "folder")).parse
+)
+
+
+@cached_parser
+def _parse_note(output: str) -> dict:
+    """Parse a "body|created|modified" record or an error message.
+
+    Failures are reported with a leading "Error:", so the check stays O(1)
+    however long the note is. The dates are split off the end, as the body
+    itself may contain "|".
+    """
+    if output.startswith("Error:"):
+        return {"error": output}
+    return dict(zip(_NOTE_FIELDS, output.rsplit("|", 2)))
+
+
+@cached_parser
+def _parse_folders(output: str) -> list:
+    """Parse the RECORD_SEPARATOR-joined folder name list."""
+    return output.split(RECORD_SEPARATOR) if output else []
 
 
 # List notes
@@ -10,11 +41,19 @@ notes_list = Satellite(
     description="List all notes in a folder",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder name (default: first folder if not specified)",
             required=False
+        ),
+        SatelliteParameter.get(
+            name="limit",
+            type="integer",
+            description="Maximum number of results, the first matches in folder order",
+            required=False,
+            default=50,
+            preprocess=int
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -30,21 +69,17 @@ notes_list = Satellite(
         if targetFolder exists then
             set allNotes to every note in targetFolder
             repeat with currentNote in allNotes
+                if (count of noteList) >= {{ limit }} then exit repeat
                 set noteName to name of currentNote
                 set noteBody to body of currentNote
                 set noteId to id of currentNote
-                if (count of noteList) = 0 then
-                    set end of noteList to (noteName & "|" & noteBody & "|" & noteId)
-                else
-                    set end of noteList to "," & (noteName & "|" & noteBody & "|" & noteId)
-                end if
+                set end of noteList to (noteName & (character id 31) & noteBody & (character id 31) & noteId)
             end repeat
         end if
     end tell
 
-    return noteList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "body", "id"], note.split("|", 2))) for note in x.split(",")],
+    """ + applescript_join("noteList", RECORD_SEPARATOR),
+    result_parser=_parse_notes,
     examples=[
         {
             "input": {"folder": "Notes"},
@@ -63,13 +98,13 @@ notes_get = Satellite(
     description="Get note content by name",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="name",
             type="string",
             description="Note name",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder name (default: first folder)",
@@ -86,17 +121,14 @@ notes_get = Satellite(
         if targetNote exists then
             set noteBody to body of targetNote
             set noteCreationDate to creation date of targetNote
-            set noteModDate = modification date of targetNote
+            set noteModDate to modification date of targetNote
             return noteBody & "|" & (noteCreationDate as string) & "|" & (noteModDate as string)
         else
             return "Error: Note not found"
         end if
     end tell
     """,
-    result_parser=DelimitedResultParser(
-        delimiter="|",
-        field_names=["body", "created", "modified"]
-    ),
+    result_parser=_parse_note,
     examples=[
         {
             "input": {"name": "Meeting Notes"},
@@ -115,19 +147,19 @@ notes_create = Satellite(
     description="Create a new note",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="title",
             type="string",
             description="Note title",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="body",
             type="string",
             description="Note content (supports HTML)",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder name (default: first folder if not specified)",
@@ -166,19 +198,19 @@ notes_update = Satellite(
     description="Update an existing note",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="name",
             type="string",
             description="Note name to update",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="body",
             type="string",
             description="New note content",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder name (default: first folder if not specified)",
@@ -217,13 +249,13 @@ notes_delete = Satellite(
     description="Delete a note",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="name",
             type="string",
             description="Note name to delete",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder name (default: first folder if not specified)",
@@ -238,7 +270,7 @@ notes_delete = Satellite(
         {% else %}
         set targetFolder to first folder
         {% endif %}
-        set targetNote to first note of targetFolder whose name is "{{ name }}""
+        set targetNote to first note of targetFolder whose name is "{{ name }}"
 
         if targetNote exists then
             delete targetNote
@@ -262,17 +294,25 @@ notes_search = Satellite(
     description="Search notes by query",
     category="notes",
     parameters=[
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="query",
             type="string",
             description="Search query",
             required=True
         ),
-        SatelliteParameter(
+        SatelliteParameter.get(
             name="folder",
             type="string",
             description="Folder to search in (default: all folders)",
             required=False
+        ),
+        SatelliteParameter.get(
+            name="limit",
+            type="integer",
+            description="Maximum number of results, the first matches in Notes order",
+            required=False,
+            default=50,
+            preprocess=int
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -280,30 +320,22 @@ notes_search = Satellite(
     tell application "Notes"
         set results to {}
 
+        -- Notes evaluates the filter itself, so bodies never cross Apple Events
         {% if folder %}
         set targetFolder to first folder whose name is "{{ folder }}"
-        set allNotes to every note in targetFolder
+        set matchingNotes to every note in targetFolder whose name contains "{{ query }}" or body contains "{{ query }}"
         {% else %}
-        set allNotes to every note
+        set matchingNotes to every note whose name contains "{{ query }}" or body contains "{{ query }}"
         {% endif %}
 
-        repeat with currentNote in allNotes
-            set noteName to name of currentNote
-            set noteBody to body of currentNote
-
-            if noteName contains "{{ query }}" or noteBody contains "{{ query }}" then
-                if (count of results) = 0 then
-                    set end of results to (noteName & "|" & (name of container of currentNote))
-                else
-                    set end of results to "," & (noteName & "|" & (name of container of currentNote))
-                end if
-            end if
+        repeat with currentNote in matchingNotes
+            if (count of results) >= {{ limit }} then exit repeat
+            set end of results to ((name of currentNote) & (character id 31) & (name of container of currentNote))
         end repeat
     end tell
 
-    return results as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "folder"], item.split("|"))) for item in x.split(",")],
+    """ + applescript_join("results", RECORD_SEPARATOR),
+    result_parser=_parse_search_results,
     examples=[
         {
             "input": {"query": "meeting"},
@@ -325,22 +357,11 @@ notes_list_folders = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Notes"
-        set folderList to {}
-        set allFolders to every folder
-
-        repeat with currentFolder in allFolders
-            set folderName to name of currentFolder
-            if (count of folderList) = 0 then
-                set end of folderList to folderName
-            else
-                set end of folderList to "," & folderName
-            end if
-        end repeat
+        set folderList to name of every folder
     end tell
 
-    return folderList as string
-    """,
-    result_parser=lambda x: x.split(",") if x else [],
+    """ + applescript_join("folderList", RECORD_SEPARATOR),
+    result_parser=_parse_folders,
     examples=[
         {
             "input": {},
@@ -359,3 +380,6 @@ __all__ = [
     "notes_search",
     "notes_list_folders",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,8 +1,24 @@
 """Reminders station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser
+from orbit.core.exceptions import ParameterValidationError
+from orbit.core.templating import RECORD_SEPARATOR, applescript_join
+from orbit.parsers import RecordResultParser
 from datetime import datetime
+from types import MappingProxyType
+
+_parse_reminders = RecordResultParser(("name", "due_date", "completed", "id")).parse
+_parse_lists = RecordResultParser(("name", "count")).parse
+
+
+def _require_id_or_name(parameters: dict) -> None:
+    """Check that a reminder is targeted by a non-empty id or name.
+
+    Raises:
+        ParameterValidationError: If neither "id" nor "name" is given
+    """
+    if not parameters.get("id") and not parameters.get("name"):
+        raise ParameterValidationError("Either 'id' or 'name' is required")
 
 
 # List reminders
@@ -32,13 +48,13 @@ reminders_list = Satellite(
 
         {% if list_name %}
         set targetList to first list whose name is "{{ list_name }}"
-        {% if include_completed|lower %}
+        {% if include_completed %}
         set allReminders to every reminder in targetList
         {% else %}
         set allReminders to every reminder in targetList whose completed is false
         {% endif %}
         {% else %}
-        {% if include_completed|lower %}
+        {% if include_completed %}
         set allReminders to every reminder
         {% else %}
         set allReminders to every reminder whose completed is false
@@ -50,17 +66,12 @@ reminders_list = Satellite(
             set reminderDue to due date of currentReminder
             set isCompleted to completed of currentReminder as string
             set reminderId to id of currentReminder
-            if (count of reminderList) = 0 then
-                set end of reminderList to (reminderName & "|" & reminderDue & "|" & isCompleted & "|" & reminderId)
-            else
-                set end of reminderList to "," & (reminderName & "|" & reminderDue & "|" & isCompleted & "|" & reminderId)
-            end if
+            set end of reminderList to (reminderName & (character id 31) & reminderDue & (character id 31) & isCompleted & (character id 31) & reminderId)
         end repeat
     end tell
 
-    return reminderList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "due_date", "completed", "id"], item.split("|", 3))) for item in x.split(",")] if x else [],
+    """ + applescript_join("reminderList", RECORD_SEPARATOR),
+    result_parser=_parse_reminders,
     examples=[
         {
             "input": {"include_completed": False},
@@ -142,17 +153,38 @@ reminders_complete = Satellite(
     description="Mark reminder as completed",
     category="reminders",
     parameters=[
+        SatelliteParameter(
+            name="id",
+            type="string",
+            description="Reminder id from reminders_list (preferred, avoids a name search); id or name is required",
+            required=False
+        ),
         SatelliteParameter(
             name="name",
             type="string",
-            description="Reminder name to complete",
-            required=True
+            description="Reminder name to complete, used when id is not given; id or name is required",
+            required=False
+        ),
+        SatelliteParameter(
+            name="list_name",
+            type="string",
+            description="List to search by name (default: all lists)",
+            required=False
         )
     ],
     safety_level=SafetyLevel.MODERATE,
+    validator=_require_id_or_name,
     applescript_template="""
     tell application "Reminders"
+        {% if id %}
+        set targetReminder to reminder id "{{ id }}"
+        {% else %}
+        {% if list_name %}
+        set targetReminder to first reminder of list "{{ list_name }}" whose name is "{{ name }}"
+        {% else %}
         set targetReminder to first reminder whose name is "{{ name }}"
+        {% endif %}
+        {% endif %}
 
         if targetReminder exists then
             set completed of targetReminder to true
@@ -176,17 +208,38 @@ reminders_uncomplete = Satellite(
     description="Mark reminder as incomplete",
     category="reminders",
     parameters=[
+        SatelliteParameter(
+            name="id",
+            type="string",
+            description="Reminder id from reminders_list (preferred, avoids a name search); id or name is required",
+            required=False
+        ),
         SatelliteParameter(
             name="name",
             type="string",
-            description="Reminder name to uncomplete",
-            required=True
+            description="Reminder name to uncomplete, used when id is not given; id or name is required",
+            required=False
+        ),
+        SatelliteParameter(
+            name="list_name",
+            type="string",
+            description="List to search by name (default: all lists)",
+            required=False
         )
     ],
     safety_level=SafetyLevel.MODERATE,
+    validator=_require_id_or_name,
     applescript_template="""
     tell application "Reminders"
+        {% if id %}
+        set targetReminder to reminder id "{{ id }}"
+        {% else %}
+        {% if list_name %}
+        set targetReminder to first reminder of list "{{ list_name }}" whose name is "{{ name }}"
+        {% else %}
         set targetReminder to first reminder whose name is "{{ name }}"
+        {% endif %}
+        {% endif %}
 
         if targetReminder exists then
             set completed of targetReminder to false
@@ -210,17 +263,38 @@ reminders_delete = Satellite(
     description="Delete a reminder",
     category="reminders",
     parameters=[
+        SatelliteParameter(
+            name="id",
+            type="string",
+            description="Reminder id from reminders_list (preferred, avoids a name search); id or name is required",
+            required=False
+        ),
         SatelliteParameter(
             name="name",
             type="string",
-            description="Reminder name to delete",
-            required=True
+            description="Reminder name to delete, used when id is not given; id or name is required",
+            required=False
+        ),
+        SatelliteParameter(
+            name="list_name",
+            type="string",
+            description="List to search by name (default: all lists)",
+            required=False
         )
     ],
     safety_level=SafetyLevel.DANGEROUS,
+    validator=_require_id_or_name,
     applescript_template="""
     tell application "Reminders"
+        {% if id %}
+        set targetReminder to reminder id "{{ id }}"
+        {% else %}
+        {% if list_name %}
+        set targetReminder to first reminder of list "{{ list_name }}" whose name is "{{ name }}"
+        {% else %}
         set targetReminder to first reminder whose name is "{{ name }}"
+        {% endif %}
+        {% endif %}
 
         if targetReminder exists then
             delete targetReminder
@@ -253,17 +327,12 @@ reminders_list_lists = Satellite(
         repeat with currentList in allLists
             set listName to name of currentList
             set listCount to count of reminders of currentList
-            if (count of listList) = 0 then
-                set end of listList to (listName & "|" & (listCount as string))
-            else
-                set end of listList to "," & (listName & "|" & (listCount as string))
-            end if
+            set end of listList to (listName & (character id 31) & (listCount as string))
         end repeat
     end tell
 
-    return listList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "count"], item.split("|"))) for item in x.split(",")] if x else [],
+    """ + applescript_join("listList", RECORD_SEPARATOR),
+    result_parser=_parse_lists,
     examples=[
         {
             "input": {},
@@ -286,3 +355,6 @@ __all__ = [
     "reminders_delete",
     "reminders_list_lists",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,7 +1,12 @@
 """Safari station satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
-from orbit.parsers import DelimitedResultParser
+from orbit.core.templating import FIELD_SEPARATOR, RECORD_SEPARATOR, applescript_join
+from orbit.parsers import DelimitedResultParser, RecordResultParser
+from types import MappingProxyType
+from urllib.parse import quote_plus
+
+_parse_tabs = RecordResultParser(("name", "url")).parse
 
 
 # Open URL
@@ -65,13 +70,7 @@ safari_get_text = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        tell front document
-            if (do JavaScript "document.body.innerText" in front document) then
-                set pageText to (do JavaScript "document.body.innerText" in front document)
-            else
-                set pageText to ""
-            end if
-        end tell
+        set pageText to do JavaScript "(document.body && document.body.innerText) || ''" in front document
     end tell
 
     return pageText
@@ -84,6 +83,35 @@ safari_get_text = Satellite(
     ]
 )
 
+# Get URL, title and text of the current page in one call
+safari_snapshot = Satellite(
+    name="safari_snapshot",
+    description="Get current page URL, title and text content",
+    category="safari",
+    parameters=[],
+    safety_level=SafetyLevel.SAFE,
+    applescript_template="""
+    tell application "Safari"
+        tell front document
+            set pageURL to URL
+            set pageTitle to name
+        end tell
+        set pageText to do JavaScript "(document.body && document.body.innerText) || ''" in front document
+    end tell
+
+    return pageURL & (character id 31) & pageTitle & (character id 31) & pageText
+    """,
+    result_parser=DelimitedResultParser.get(
+        delimiter=FIELD_SEPARATOR, field_names=["url", "title", "text"]
+    ),
+    examples=[
+        {
+            "input": {},
+            "output": {"url": "https://github.com", "title": "GitHub", "text": "Page text content..."}
+        }
+    ]
+)
+
 # List tabs
 safari_list_tabs = Satellite(
     name="safari_list_tabs",
@@ -104,19 +132,13 @@ safari_list_tabs = Satellite(
                 set currentTab to tab j of currentWindow
                 set tabName to name of currentTab
                 set tabURL to URL of currentTab
-
-                if (count of tabList) = 0 then
-                    set end of tabList to (tabName & "|" & tabURL)
-                else
-                    set end of tabList to "," & (tabName & "|" & tabURL)
-                end if
+                set end of tabList to (tabName & (character id 31) & tabURL)
             end repeat
         end repeat
     end tell
 
-    return tabList as string
-    """,
-    result_parser=lambda x: [dict(zip(["name", "url"], item.split("|", 1))) for item in x.split(",")] if x else [],
+    """ + applescript_join("tabList", RECORD_SEPARATOR),
+    result_parser=_parse_tabs,
     examples=[
         {
             "input": {},
@@ -173,7 +195,9 @@ safari_search = Satellite(
             name="query",
             type="string",
             description="Search query",
-            required=True
+            required=True,
+            # URL-encoded here; the result has no characters to escape
+            preprocess=quote_plus
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -237,10 +261,7 @@ safari_go_back = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        activate
-        tell application "System Events"
-            keystroke "[" using {command down}
-        end tell
+        do JavaScript "history.back()" in front document
     end tell
 
     return "success"
@@ -262,10 +283,7 @@ safari_go_forward = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        activate
-        tell application "System Events"
-            keystroke "]" using {command down}
-        end tell
+        do JavaScript "history.forward()" in front document
     end tell
 
     return "success"
@@ -287,10 +305,7 @@ safari_refresh = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        activate
-        tell application "System Events"
-            keystroke "r" using {command down}
-        end tell
+        do JavaScript "location.reload()" in front document
     end tell
 
     return "success"
@@ -312,10 +327,7 @@ safari_zoom_in = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        activate
-        tell application "System Events"
-            keystroke "+" using {command down}
-        end tell
+        do JavaScript "document.body.style.zoom = (parseFloat(document.body.style.zoom || '1') + 0.1)" in front document
     end tell
 
     return "success"
@@ -336,10 +348,7 @@ safari_zoom_out = Satellite(
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
     tell application "Safari"
-        activate
-        tell application "System Events"
-            keystroke "-" using {command down}
-        end tell
+        do JavaScript "document.body.style.zoom = Math.max(parseFloat(document.body.style.zoom || '1') - 0.1, 0.1)" in front document
     end tell
 
     return "success"
@@ -357,6 +366,7 @@ __all__ = [
     "safari_open",
     "safari_get_url",
     "safari_get_text",
+    "safari_snapshot",
     "safari_list_tabs",
     "safari_close_tab",
     "safari_search",
@@ -367,3 +377,6 @@ __all__ = [
     "safari_zoom_in",
     "safari_zoom_out",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -2,7 +2,29 @@
 
 from typing import Optional
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
+from orbit.core.templating import expand_path
 from orbit.parsers import DelimitedResultParser
+from types import MappingProxyType
+
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+except ImportError:
+    NSPasteboard = None
+
+
+def _get_clipboard(parameters: dict) -> str:
+    """Read clipboard text in-process via NSPasteboard."""
+    text = NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString)
+    return text or ""
+
+
+def _set_clipboard(parameters: dict) -> str:
+    """Replace clipboard contents in-process via NSPasteboard."""
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    pasteboard.setString_forType_(parameters["content"], NSPasteboardTypeString)
+    return "success"
+
 
 # System info satellite
 system_get_info = Satellite(
@@ -12,14 +34,9 @@ system_get_info = Satellite(
     parameters=[],
     safety_level=SafetyLevel.SAFE,
     applescript_template="""
-    set systemInfo to do shell script "sw_vers -productVersion"
-    set hostInfo to do shell script "hostname"
-    set userInfo to do shell script "whoami"
-    set archInfo to do shell script "uname -m"
-
-    return systemInfo & "|" & hostInfo & "|" & userInfo & "|" & archInfo
+    return do shell script "{ sw_vers -productVersion; hostname; whoami; uname -m; } | paste -sd '|' -"
     """,
-    result_parser=DelimitedResultParser(
+    result_parser=DelimitedResultParser.get(
         delimiter="|", field_names=["version", "hostname", "username", "architecture"]
     ),
     examples=[
@@ -46,6 +63,8 @@ system_get_clipboard = Satellite(
     set theClipboard to the clipboard as string
     return theClipboard
     """,
+    # AppKit (pyobjc) skips osascript; the script is the fallback
+    native_handler=_get_clipboard if NSPasteboard is not None else None,
     examples=[
         {
             "input": {},
@@ -71,6 +90,7 @@ system_set_clipboard = Satellite(
     set the clipboard to "{{ content }}" as string
     return "success"
     """,
+    native_handler=_set_clipboard if NSPasteboard is not None else None,
     examples=[
         {
             "input": {"content": "Hello from Orbit 🛸"},
@@ -121,7 +141,8 @@ system_take_screenshot = Satellite(
             name="path",
             type="string",
             description="Path to save screenshot (supports ~ for home directory)",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -245,3 +266,6 @@ __all__ = [
     "system_get_brightness",
     "system_set_brightness",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -1,8 +1,10 @@
 """Enhanced system telemetry satellites."""
 
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
+from orbit.core.templating import expand_path
 from orbit.parsers import DelimitedResultParser, JSONResultParser
 import json
+from types import MappingProxyType
 
 # System info satellite (enhanced)
 system_get_detailed_info = Satellite(
@@ -32,7 +34,7 @@ system_get_detailed_info = Satellite(
 
     return systemVersion & "|" & hostName & "|" & userName & "|" & appleArchitecture & "|" & physicalMemory & "|" & (totalGB as string) & "|" & (freeGB as string)
     """,
-    result_parser=DelimitedResultParser(
+    result_parser=DelimitedResultParser.get(
         delimiter="|",
         field_names=["version", "hostname", "username", "architecture", "memory", "disk_total", "disk_free"]
     ),
@@ -77,7 +79,7 @@ system_get_clipboard_history = Satellite(
 
     return clipboardType & "|" & theClipboard
     """,
-    result_parser=DelimitedResultParser(delimiter="|", field_names=["type", "content"]),
+    result_parser=DelimitedResultParser.get(delimiter="|", field_names=["type", "content"]),
     examples=[
         {
             "input": {},
@@ -154,7 +156,8 @@ system_take_screenshot_selection = Satellite(
             name="path",
             type="string",
             description="Path to save screenshot",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -181,7 +184,8 @@ system_take_screenshot_window = Satellite(
             name="path",
             type="string",
             description="Path to save screenshot",
-            required=True
+            required=True,
+            preprocess=expand_path
         )
     ],
     safety_level=SafetyLevel.SAFE,
@@ -395,3 +399,6 @@ __all__ = [
     "system_reboot",
     "system_shutdown",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
@@ -3,6 +3,7 @@
 from orbit.core import Satellite, SatelliteParameter, SafetyLevel
 from orbit.parsers import DelimitedResultParser, JSONResultParser
 import json
+from types import MappingProxyType
 
 
 # Connect to WiFi
@@ -100,7 +101,7 @@ wifi_current = Satellite(
 
     return ssid & "|" & wifiInfo
     """,
-    result_parser=DelimitedResultParser(delimiter="|", field_names=["ssid", "signal_strength"]),
+    result_parser=DelimitedResultParser.get(delimiter="|", field_names=["ssid", "signal_strength"]),
     examples=[
         {
             "input": {},
@@ -155,3 +156,6 @@ __all__ = [
     "wifi_turn_on",
     "wifi_turn_off",
 ]
+
+# Read-only name -> satellite mapping, used by the registry
+SATELLITES = MappingProxyType({name: globals()[name] for name in __all__})
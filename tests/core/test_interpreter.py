@@ -0,0 +1,128 @@
+"""Tests for the persistent AppleScript interpreter."""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from orbit.core.exceptions import AppleScriptError
+from orbit.core.interpreter import AppleScriptInterpreter
+from orbit.core.launcher import Launcher
+
+# Stand-in server speaking the interpreter protocol: echoes scripts upper-cased,
+# reports scripts starting with "fail" as errors, hangs on "sleep" and exits
+# on "exit".
+_FAKE_SERVER = r"""
+import sys, time
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    header = stdin.readline()
+    if not header:
+        break
+    script = stdin.read(int(header)).decode()
+    if script == "exit":
+        sys.exit(1)
+    if script == "sleep":
+        time.sleep(60)
+    status = b"1" if script.startswith("fail") else b"0"
+    body = script.upper().encode()
+    stdout.write(status + b" %d\n" % len(body) + body)
+    stdout.flush()
+"""
+
+
+class FakeInterpreter(AppleScriptInterpreter):
+    """Interpreter running the Python stand-in server."""
+
+    command = (sys.executable, "-c", _FAKE_SERVER)
+
+
+@pytest.fixture
+def interpreter():
+    """Create an interpreter and stop its process afterwards."""
+    interpreter = FakeInterpreter()
+    yield interpreter
+    interpreter.close()
+
+
+class TestAppleScriptInterpreter:
+    """Tests for AppleScriptInterpreter."""
+
+    def test_run_reuses_one_process(self, interpreter):
+        """Test consecutive scripts are answered by the same process."""
+        assert interpreter.run("return 1", timeout=10) == (False, "RETURN 1")
+        process = interpreter._process
+
+        assert interpreter.run('return "é\n|x"', timeout=10) == (False, 'RETURN "É\n|X"')
+        assert interpreter._process is process
+
+    def test_run_reports_script_errors(self, interpreter):
+        """Test error replies are flagged as failed."""
+        assert interpreter.run("fail here", timeout=10) == (True, "FAIL HERE")
+
+    def test_run_restarts_after_crash(self, interpreter):
+        """Test a crashed process is replaced on the next call."""
+        with pytest.raises(OSError):
+            interpreter.run("exit", timeout=10)
+
+        assert interpreter.run("again", timeout=10) == (False, "AGAIN")
+
+    def test_run_timeout_kills_process(self, interpreter):
+        """Test a timed-out call kills the process."""
+        with pytest.raises(TimeoutError):
+            interpreter.run("sleep", timeout=0.2)
+
+        assert interpreter._process is None
+        assert interpreter.run("ok", timeout=10) == (False, "OK")
+
+
+    def test_run_timeout_covers_sending(self):
+        """Test a process that stops reading cannot block past the timeout."""
+
+        class StalledInterpreter(AppleScriptInterpreter):
+            command = (sys.executable, "-c", "import time; time.sleep(60)")
+
+        interpreter = StalledInterpreter()
+        try:
+            with pytest.raises(TimeoutError):
+                interpreter.run("x" * (1 << 22), timeout=0.2)
+        finally:
+            interpreter.close()
+
+    def test_restart_keeps_one_finalizer(self, interpreter):
+        """Test replacing the process detaches the old finalizer."""
+        interpreter.run("first", timeout=10)
+        finalizer = interpreter._finalizer
+
+        with pytest.raises(OSError):
+            interpreter.run("exit", timeout=10)
+        interpreter.run("again", timeout=10)
+
+        assert not finalizer.alive
+        assert interpreter._finalizer.alive
+        interpreter.close()
+        assert interpreter._finalizer is None
+
+
+class TestLauncherPersistentInterpreter:
+    """Tests for Launcher with persistent_interpreter enabled."""
+
+    def test_default_launcher_has_no_interpreter(self):
+        """Test launchers spawn osascript per call by default."""
+        assert Launcher()._interpreter is None
+
+    def test_execute_uses_interpreter(self):
+        """Test scripts run in the interpreter and errors are mapped."""
+        launcher = Launcher(persistent_interpreter=True)
+        launcher._interpreter = MagicMock()
+        launcher._interpreter.run.return_value = (False, "result\n")
+
+        assert launcher._execute_applescript("return 1") == "result"
+
+        launcher._interpreter.run.return_value = (True, "Syntax error")
+        with pytest.raises(AppleScriptError, match="Syntax error"):
+            launcher._execute_applescript("bad")
+
+        launcher._interpreter.run.side_effect = TimeoutError()
+        with pytest.raises(AppleScriptError, match="timed out"):
+            launcher._execute_applescript("return 1")
@@ -48,6 +48,20 @@ class TestSatellite:
         assert "param1" in openai_func["function"]["parameters"]["properties"]
         assert "param1" in openai_func["function"]["parameters"]["required"]
 
+    def test_satellite_to_openai_function_is_cached(self):
+        """Test that the OpenAI function dict is built only once."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "test"',
+        )
+
+        assert satellite.to_openai_function() is satellite.to_openai_function()
+        assert satellite.to_dict() is satellite.to_dict()
+
     def test_satellite_to_dict(self):
         """Test converting satellite to dictionary."""
         satellite = Satellite(
@@ -145,6 +159,405 @@ class TestSatellite:
         with pytest.raises(ParameterValidationError):
             satellite.validate_parameters({"choice": "invalid"})
 
+        # Unhashable value
+        with pytest.raises(ParameterValidationError):
+            satellite.validate_parameters({"choice": ["option1"]})
+
+    def test_validate_parameters_runs_validator(self):
+        """Test the satellite validator sees the whole parameter dict."""
+        from orbit.core.exceptions import ParameterValidationError
+
+        def validator(parameters):
+            if "a" not in parameters and "b" not in parameters:
+                raise ParameterValidationError("Either 'a' or 'b' is required")
+
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[
+                SatelliteParameter(name="a", type="string", description="A", required=False),
+                SatelliteParameter(name="b", type="string", description="B", required=False),
+            ],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "test"',
+            validator=validator,
+        )
+
+        assert satellite.validate_parameters({"b": "x"}) is True
+        with pytest.raises(ParameterValidationError):
+            satellite.validate_parameters({})
+
+
+    def test_from_spec(self):
+        """Test building a satellite from a dict specification."""
+        satellite = Satellite.from_spec({
+            "name": "spec_satellite",
+            "description": "Spec satellite",
+            "category": "test",
+            "parameters": [
+                {"name": "param1", "type": "string", "description": "Test"},
+                SatelliteParameter(name="param2", type="integer", description="Test", required=False),
+            ],
+            "safety_level": "moderate",
+            "applescript_template": 'return "{{ param1 }}"',
+        })
+
+        assert satellite.safety_level == SafetyLevel.MODERATE
+        assert [p.name for p in satellite.parameters] == ["param1", "param2"]
+        assert isinstance(satellite.parameters[0], SatelliteParameter)
+        assert satellite.render({"param1": "x"}) == 'return "x"'
+
+    def test_derived_parameter_attributes(self):
+        """Test required_params, param_defaults and param_types."""
+        satellite = Satellite.from_spec({
+            "name": "spec_satellite",
+            "description": "Spec satellite",
+            "category": "test",
+            "parameters": [
+                {"name": "title", "type": "string", "description": "Test"},
+                {"name": "limit", "type": "integer", "description": "Test", "required": False, "default": 10},
+            ],
+            "safety_level": "safe",
+            "applescript_template": 'return "{{ title }}"',
+        })
+
+        assert satellite.required_params == frozenset({"title"})
+        assert satellite.param_defaults == {"limit": 10}
+        assert satellite.param_types == {"title": "string", "limit": "integer"}
+        assert satellite.required_params is satellite.required_params
+
+    def test_validation_uses_schema_built_at_definition(self):
+        """Test validate_parameters never walks the parameter list per call."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[
+                SatelliteParameter(name="title", type="string", description="Title"),
+                SatelliteParameter(
+                    name="mode", type="string", description="Mode",
+                    required=False, enum=["a", "b"],
+                ),
+            ],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{{ title }}"',
+        )
+        satellite.parameters = None
+
+        from orbit.core.exceptions import ParameterValidationError
+
+        assert satellite.validate_parameters({"title": "x", "extra": 1, "mode": "a"})
+        with pytest.raises(ParameterValidationError, match="title"):
+            satellite.validate_parameters({})
+        with pytest.raises(ParameterValidationError, match="mode"):
+            satellite.validate_parameters({"title": "x", "mode": "c"})
+
+    def test_render_compiles_once(self):
+        """Test that the template is compiled at definition and reused."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{{ value|lower }}"',
+        )
+
+        compiled = satellite._compiled_template
+        assert compiled is not None
+        assert satellite.render({"value": "a"}) == 'return "a"'
+        assert satellite.render({"value": "b"}) == 'return "b"'
+        assert satellite._compiled_template is compiled
+
+    def test_render_escapes_string_parameters(self):
+        """Test that string parameters are escaped for AppleScript literals."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{{ value }}" & {{ count }}',
+        )
+
+        result = satellite.render({"value": 'a "b" \\c', "count": 2})
+
+        assert result == 'return "a \\"b\\" \\\\c" & 2'
+
+    def test_render_caches_safe_satellite_output(self):
+        """Test that SAFE satellites reuse rendered scripts per parameter set."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{{ value|lower }}"',
+        )
+
+        first = satellite.render({"value": "a"})
+        assert satellite.render({"value": "a"}) is first
+        assert satellite.render({"value": "b"}) == 'return "b"'
+        assert satellite._render_cached.cache_info().hits == 1
+
+    def test_render_cache_distinguishes_equal_values_of_different_types(self):
+        """Test that 1, True and 1.0 do not share a cached rendering."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="return {{ value|string }}",
+        )
+
+        assert satellite.render({"value": True}) == "return True"
+        assert satellite.render({"value": 1}) == "return 1"
+        assert satellite.render({"value": 1.0}) == "return 1.0"
+
+    def test_render_unhashable_parameters_bypass_cache(self):
+        """Test that unhashable parameter values are rendered uncached."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="return {{ items|length }}",
+        )
+
+        assert satellite.render({"items": [1, 2]}) == "return 2"
+        assert satellite._render_cached.cache_info().currsize == 0
+
+    def test_render_does_not_cache_non_safe_satellites(self):
+        """Test that only read-only satellites cache rendered scripts."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.MODERATE,
+            applescript_template='return "{{ value }}"',
+        )
+
+        assert satellite.render({"value": "a"}) == 'return "a"'
+        assert satellite._render_cached is None
+
+    def test_render_substitution_template_uses_format_map(self):
+        """Test that placeholder-only templates render without Jinja."""
+        template = 'set s to {"{{ first }}", {{ count }}}\nreturn s\n'
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template=template,
+        )
+        params = {"first": 'a"b', "count": 2}
+
+        from orbit.core.templating import TEMPLATE_ENV, escape_parameters
+
+        expected = TEMPLATE_ENV.from_string(template).render(escape_parameters(params))
+        assert satellite.render(params) == expected
+        assert satellite.render({}) == TEMPLATE_ENV.from_string(template).render()
+        assert satellite._compiled_template is None
+        assert satellite._render_cached is None
+
+    def test_render_flag_template_uses_specialized_variants(self):
+        """Test a single "{% if flag %}" template renders like Jinja without it."""
+        template = (
+            'tell application "Notes"\n'
+            "{% if folder %}\n"
+            'set f to folder "{{ folder }}"\n'
+            "{% else %}\n"
+            "set f to first folder\n"
+            "{% endif %}\n"
+            'make new note at f with properties {name:"{{ name }}"}\n'
+            "end tell\n"
+        )
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template=template,
+        )
+
+        from orbit.core.templating import TEMPLATE_ENV, escape_parameters
+
+        jinja = TEMPLATE_ENV.from_string(satellite._source)
+        for params in ({"name": 'a"b', "folder": "Work"}, {"name": "x", "folder": ""}, {"name": "y"}):
+            assert satellite.render(params) == jinja.render(escape_parameters(params))
+        assert satellite._flags == ("folder",)
+        assert satellite._compiled_template is None
+
+    def test_render_nested_flags_use_specialized_variants(self):
+        """Test nested blocks on several flags render like Jinja without it."""
+        template = (
+            "{% if a %}\nA\n{% if b %}\nAB {{ x }}\n{% else %}\nA-\n{% endif %}\n"
+            "{% else %}\n{% if b %}\nB\n{% endif %}\n{% endif %}\nend"
+        )
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template=template,
+        )
+
+        from orbit.core.templating import TEMPLATE_ENV
+
+        jinja = TEMPLATE_ENV.from_string(satellite._source)
+        for params in ({}, {"a": 1}, {"b": 1}, {"a": 1, "b": 1, "x": "y"}):
+            assert satellite.render(params) == jinja.render(params)
+        assert len(satellite._variants) == 4
+        assert satellite._compiled_template is None
+
+    def test_render_boolean_flag_text_values(self):
+        """Test boolean flags given as text such as "false" count as false."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[SatelliteParameter("all", "boolean", "All", required=False)],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="{% if all %}every{% else %}first{% endif %}",
+        )
+
+        assert satellite.render({"all": "false"}) == "first"
+        assert satellite.render({"all": "true"}) == "every"
+        assert satellite.render({"all": False}) == "first"
+
+    def test_render_boolean_flag_text_values_in_jinja_templates(self):
+        """Test text-false boolean flags also count as false under Jinja."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[SatelliteParameter("all", "boolean", "All", required=False)],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template=(
+                "{% for i in range(2) %}{{ i }}{% endfor %}"
+                "{% if all %}every{% else %}first{% endif %}"
+            ),
+        )
+
+        assert satellite._variants is None
+        assert satellite.render({"all": "false"}) == "01first"
+        assert satellite.render({"all": "no"}) == "01first"
+        assert satellite.render({"all": "true"}) == "01every"
+
+    def test_render_complex_conditions_keep_jinja(self):
+        """Test filtered or compound conditions are not specialized."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="{% if a|lower %}A{% endif %}{% if a and b %}B{% endif %}",
+        )
+
+        assert satellite._variants is None
+        assert satellite.render({"a": True, "b": True}) == "AB"
+
+    def test_render_applies_parameter_defaults(self):
+        """Test omitted parameters render with their declared defaults."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[
+                SatelliteParameter(
+                    name="limit", type="integer", description="Limit",
+                    required=False, default=10,
+                )
+            ],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="return {{ limit }}",
+        )
+
+        assert satellite.render({}) == "return 10"
+        assert satellite.render({"limit": 3}) == "return 3"
+
+    def test_render_applies_parameter_preprocess(self):
+        """Test preprocess functions run before values are escaped."""
+        from urllib.parse import quote_plus
+
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[
+                SatelliteParameter(
+                    name="q", type="string", description="Query", preprocess=quote_plus,
+                )
+            ],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "?q={{ q }}"',
+        )
+
+        params = {"q": 'a "b"'}
+        assert satellite.render(params) == 'return "?q=a+%22b%22"'
+        assert params == {"q": 'a "b"'}
+
+    def test_render_static_template_skips_jinja(self):
+        """Test that templates without Jinja syntax bypass compilation."""
+        template = 'tell application "Finder"\n    return name\nend tell\n'
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template=template,
+        )
+
+        assert satellite.render({}) == 'tell application "Finder"\nreturn name\nend tell'
+        assert satellite._compiled_template is None
+
+    def test_render_compacts_whitespace(self):
+        """Test that indentation and blank lines are dropped before rendering."""
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="""
+    tell application "Notes"   
+
+        {% if name %}
+        return "{{ name }}  x"
+        {% endif %}
+    end tell
+""",
+        )
+
+        result = satellite.render({"name": "a  b"})
+
+        assert result == 'tell application "Notes"\nreturn "a  b  x"\nend tell'
+
+    def test_render_invalid_template(self):
+        """Test that template errors raise TemplateRenderingError."""
+        from orbit.core.exceptions import TemplateRenderingError
+
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{% if %}"',
+        )
+
+        with pytest.raises(TemplateRenderingError):
+            satellite.render({})
+
 
 class TestSatelliteParameter:
     """Tests for SatelliteParameter class."""
@@ -187,6 +600,42 @@ class TestSatelliteParameter:
 
         assert param.enum == ["a", "b", "c"]
 
+    def test_get_interns_identical_parameters(self):
+        """Test SatelliteParameter.get returns shared instances."""
+        first = SatelliteParameter.get(name="folder", type="string", description="Folder", required=False)
+        second = SatelliteParameter.get(name="folder", type="string", description="Folder", required=False)
+
+        assert first is second
+        assert first == SatelliteParameter(name="folder", type="string", description="Folder", required=False)
+        assert SatelliteParameter.get(name="folder", type="string", description="Other") is not first
+
+    def test_get_keeps_distinct_defaults_and_unhashable_values(self):
+        """Test defaults of different types and unhashable values are not merged."""
+        one = SatelliteParameter.get(name="n", type="integer", description="N", default=1)
+        true = SatelliteParameter.get(name="n", type="integer", description="N", default=True)
+        listed = SatelliteParameter.get(name="n", type="array", description="N", default=[1])
+
+        assert one is not true
+        assert true.default is True
+        assert listed.default == [1]
+        assert SatelliteParameter.get(name="c", type="string", description="C", enum=["a"]).enum == ["a"]
+
+    def test_satellite_classes_use_slots(self):
+        """Test satellites and parameters carry no per-instance __dict__."""
+        param = SatelliteParameter(name="p", type="string", description="P")
+        satellite = Satellite(
+            name="test_satellite",
+            description="Test satellite",
+            category="test",
+            parameters=[param],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template="return 1",
+        )
+
+        assert not hasattr(param, "__dict__")
+        assert not hasattr(satellite, "__dict__")
+        assert satellite.to_dict()["parameters"][0]["name"] == "p"
+
 
 class TestSafetyLevel:
     """Tests for SafetyLevel enum."""
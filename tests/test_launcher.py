@@ -1,9 +1,9 @@
 """Tests for Launcher class."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from orbit.core import Launcher, Satellite, SafetyLevel
-from orbit.core.exceptions import AppleScriptError, TemplateRenderingError
+from orbit.core.exceptions import AppleScriptError
 
 
 class TestLauncherInit:
@@ -71,6 +71,35 @@ class TestLauncherLaunch:
             applescript_template='return "{{ param1 }}"',
         )
 
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_launch_native_handler_skips_osascript(self, mock_run, satellite_with_params):
+        """Test satellites with a native handler run in-process."""
+        from orbit.core.exceptions import ParameterValidationError
+
+        satellite_with_params.native_handler = lambda params: params["param1"].upper()
+        satellite_with_params.result_parser = lambda output: {"value": output}
+        launcher = Launcher()
+
+        assert launcher.launch(satellite_with_params, {"param1": "abc"}) == {"value": "ABC"}
+        mock_run.assert_not_called()
+
+        with pytest.raises(ParameterValidationError):
+            launcher.launch(satellite_with_params, {})
+
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_launch_keeps_edge_field_separators(self, mock_run, sample_satellite):
+        """Test output trimming keeps separators around empty edge fields."""
+        mock_result = MagicMock()
+        mock_result.stdout = "\x1fsender\x1f\n"
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
+
+        launcher = Launcher()
+        result = launcher.launch(sample_satellite, {})
+
+        assert result == "\x1fsender\x1f"
+
     @patch('orbit.core.launcher.subprocess.run')
     def test_launch_basic(self, mock_run, sample_satellite):
         """Test basic satellite launch."""
@@ -256,46 +285,115 @@ class TestLauncherLaunch:
         assert "timed out" in str(exc_info.value).lower()
 
 
-class TestRenderTemplate:
-    """Tests for _render_template method."""
+class TestLaunchMany:
+    """Tests for Launcher.launch_many method."""
+
+    @pytest.fixture
+    def satellites(self):
+        """Create two satellites for batching."""
+        first = Satellite(
+            name="first_sat",
+            description="First satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "first"',
+        )
+        second = Satellite(
+            name="second_sat",
+            description="Second satellite",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "second"',
+            result_parser=lambda x: x.upper(),
+        )
+        return first, second
+
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_launch_many_single_process(self, mock_run, satellites):
+        """Test that a batch runs in one osascript call and is split back."""
+        mock_result = MagicMock()
+        mock_result.stdout = "__ORBIT_DELIM__0__\nfirst\n__ORBIT_DELIM__1__\nsecond\n"
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
 
-    def test_render_template_simple_string(self):
-        """Test template rendering with simple string format."""
         launcher = Launcher()
-        template = "return '{{ param1 }}' & {{ param2 }}"
-        params = {"param1": "hello", "param2": "42"}
+        results = launcher.launch_many([(satellites[0], {}), (satellites[1], {})])
 
-        # This will use fallback formatting if Jinja2 is not available
-        result = launcher._render_template(template, params)
+        assert results == ["first", "SECOND"]
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0][2]
+        assert "script orbitCall0" in script
+        assert "script orbitCall1" in script
 
-        # Result should contain parameter values
-        assert "hello" in result or "hello" in result.lower()
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_launch_many_partial_failure(self, mock_run, satellites):
+        """Test that a failing call does not discard the other results."""
+        mock_result = MagicMock()
+        mock_result.stdout = "__ORBIT_ERROR__0__\nboom\n__ORBIT_DELIM__1__\nsecond\n"
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
 
-    def test_render_template_missing_param(self):
-        """Test template rendering with missing parameter."""
         launcher = Launcher()
-        template = "return '{{ missing_param }}'"
-        params = {}
+        results = launcher.launch_many([(satellites[0], {}), (satellites[1], {})])
+
+        assert isinstance(results[0], AppleScriptError)
+        assert "boom" in str(results[0])
+        assert results[1] == "SECOND"
+
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_launch_many_shield_blocks_whole_batch(self, mock_run, satellites):
+        """Test that a shield rejection prevents any execution."""
+        from orbit.core.exceptions import ShieldError
+
+        mock_shield = MagicMock()
+        mock_shield.validate.side_effect = [True, ShieldError("denied")]
+
+        launcher = Launcher(safety_shield=mock_shield)
+
+        with pytest.raises(ShieldError):
+            launcher.launch_many([(satellites[0], {}), (satellites[1], {})])
+
+        mock_run.assert_not_called()
+
+    def test_launch_many_empty(self):
+        """Test that an empty batch does nothing."""
+        assert Launcher().launch_many([]) == []
+
+
+class TestExpandPaths:
+    """Tests for expansion of declared path parameters."""
+
+    def test_declared_path_parameters_expanded(self):
+        """Test ~ is expanded for parameters declared as paths only."""
+        from pathlib import Path
+        from orbit.satellites import files
 
-        with pytest.raises(TemplateRenderingError) as exc_info:
-            launcher._render_template(template, params)
+        script = files.file_copy.render({"source": "~/a.txt", "destination": "~/b.txt"})
 
-        assert "Missing parameter" in str(exc_info.value) or "rendering failed" in str(exc_info.value).lower()
+        home = str(Path.home().resolve())
+        assert str(Path(home, "a.txt")) in script
+        assert str(Path(home, "b.txt")) in script
 
-    def test_render_template_complex(self):
-        """Test template rendering with complex template."""
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_other_parameters_left_alone(self, mock_run):
+        """Test text parameters named like paths are not turned into paths."""
+        from orbit.satellites import calendar, notes
+
+        mock_run.return_value = MagicMock(stdout="success\n", stderr="", returncode=0)
         launcher = Launcher()
-        template = """
-        set paramName to "{{ name }}"
-        set paramPath to "{{ path }}"
-        return paramName & "|" & paramPath
-        """
-        params = {"name": "Test", "path": "/tmp/test"}
 
-        result = launcher._render_template(template, params)
+        launcher.launch(
+            calendar.calendar_create_event,
+            {"summary": "Sync", "start_date": "2026-01-28 10:00", "end_date": "2026-01-28 11:00", "location": "Conference Room"},
+        )
+        assert 'to "Conference Room"' in mock_run.call_args[0][0][2]
 
-        assert "Test" in result
-        assert "/tmp/test" in result
+        launcher.launch(notes.notes_list, {"folder": "Work"})
+        assert 'folder whose name is "Work"' in mock_run.call_args[0][0][2]
 
 
 class TestExecuteAppleScript:
@@ -368,9 +466,18 @@ class TestExecuteAppleScript:
 class TestLaunchAsync:
     """Tests for launch_async method."""
 
+    @staticmethod
+    def _mock_process(stdout=b"", stderr=b"", returncode=0):
+        """Create a mock asyncio subprocess."""
+        proc = MagicMock()
+        proc.communicate = AsyncMock(return_value=(stdout, stderr))
+        proc.wait = AsyncMock(return_value=returncode)
+        proc.returncode = returncode
+        return proc
+
     @pytest.mark.asyncio
-    @patch('orbit.core.launcher.subprocess.run')
-    async def test_launch_async_basic(self, mock_run):
+    @patch('orbit.core.launcher.asyncio.create_subprocess_exec')
+    async def test_launch_async_basic(self, mock_exec):
         """Test basic async launch."""
         from orbit.core import Satellite
 
@@ -383,16 +490,13 @@ class TestLaunchAsync:
             applescript_template='return "async result"',
         )
 
-        mock_result = MagicMock()
-        mock_result.stdout = "async result"
-        mock_result.stderr = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_exec.return_value = self._mock_process(stdout=b"async result\n")
 
         launcher = Launcher()
         result = await launcher.launch_async(satellite, {})
 
         assert result == "async result"
+        assert mock_exec.call_args[0][:2] == ("osascript", "-e")
 
     @pytest.mark.asyncio
     async def test_launch_async_with_parameters(self):
@@ -415,14 +519,77 @@ class TestLaunchAsync:
             applescript_template='return "{{ param1 }}"',
         )
 
-        with patch('orbit.core.launcher.subprocess.run') as mock_run:
-            mock_result = MagicMock()
-            mock_result.stdout = "test value"
-            mock_result.stderr = ""
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        with patch('orbit.core.launcher.asyncio.create_subprocess_exec') as mock_exec:
+            mock_exec.return_value = self._mock_process(stdout=b"test value")
 
             launcher = Launcher()
             result = await launcher.launch_async(satellite, {"param1": "test value"})
 
             assert result == "test value"
+            assert "test value" in mock_exec.call_args[0][2]
+
+    @pytest.mark.asyncio
+    @patch('orbit.core.launcher.asyncio.create_subprocess_exec')
+    async def test_launch_async_error(self, mock_exec):
+        """Test async launch with AppleScript execution error."""
+        satellite = Satellite(
+            name="test_sat",
+            description="Test",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "test"',
+        )
+
+        mock_exec.return_value = self._mock_process(
+            stderr=b"AppleScript error", returncode=1
+        )
+
+        launcher = Launcher()
+
+        with pytest.raises(AppleScriptError) as exc_info:
+            await launcher.launch_async(satellite, {})
+
+        assert "AppleScript execution failed" in str(exc_info.value)
+        assert exc_info.value.return_code == 1
+
+    @pytest.mark.asyncio
+    @patch('orbit.core.launcher.asyncio.create_subprocess_exec')
+    async def test_launch_async_max_concurrent_launches(self, mock_exec):
+        """Test that concurrent osascript processes are capped per launcher."""
+        import asyncio
+
+        satellite = Satellite(
+            name="test_sat",
+            description="Test",
+            category="test",
+            parameters=[],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "test"',
+        )
+
+        running = 0
+        peak = 0
+
+        async def communicate():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return (b"ok", b"")
+
+        def make_process(*args, **kwargs):
+            proc = self._mock_process(stdout=b"ok")
+            proc.communicate = communicate
+            return proc
+
+        mock_exec.side_effect = make_process
+
+        launcher = Launcher(max_concurrent_launches=2)
+        results = await asyncio.gather(
+            *(launcher.launch_async(satellite, {}) for _ in range(5))
+        )
+
+        assert results == ["ok"] * 5
+        assert peak == 2
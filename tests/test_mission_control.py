@@ -286,6 +286,53 @@ class TestMissionControlExport:
         assert "param2" not in params["required"]
 
 
+    def test_export_openai_functions_json(self):
+        """Test exporting satellites as cached JSON bytes."""
+        import json
+
+        mission = MissionControl()
+        mission.register(
+            Satellite(
+                name="sat_a",
+                description="Satellite A",
+                category="test",
+                parameters=[],
+                safety_level=SafetyLevel.SAFE,
+                applescript_template='return "test"',
+            )
+        )
+
+        blob = mission.export_openai_functions_json()
+
+        assert isinstance(blob, bytes)
+        assert json.loads(blob) == mission.export_openai_functions()
+        assert mission.export_openai_functions_json() is blob
+
+    def test_export_openai_functions_json_invalidated_on_register(self):
+        """Test that registering a satellite refreshes the JSON payload."""
+        import json
+
+        mission = MissionControl()
+        assert json.loads(mission.export_openai_functions_json()) == []
+
+        mission.register(
+            Satellite(
+                name="sat_b",
+                description="Satellite B",
+                category="test",
+                parameters=[],
+                safety_level=SafetyLevel.SAFE,
+                applescript_template='return "test"',
+            )
+        )
+
+        names = [f["function"]["name"] for f in json.loads(mission.export_openai_functions_json())]
+        assert names == ["sat_b"]
+
+        mission.constellation.unregister("sat_b")
+        assert json.loads(mission.export_openai_functions_json()) == []
+
+
 class TestExecuteFunctionCall:
     """Tests for execute_function_call method."""
 
@@ -435,6 +482,55 @@ class TestExecuteFunctionCall:
             mission.execute_function_call(function_call)
 
 
+class TestExecuteFunctionCalls:
+    """Tests for execute_function_calls method."""
+
+    @patch('orbit.core.launcher.subprocess.run')
+    def test_execute_function_calls_batched(self, mock_run):
+        """Test parallel function calls run as a single batch."""
+        from orbit.core import SatelliteParameter
+
+        satellite = Satellite(
+            name="echo_sat",
+            description="Test",
+            category="test",
+            parameters=[
+                SatelliteParameter(
+                    name="message",
+                    type="string",
+                    description="Message",
+                    required=True
+                )
+            ],
+            safety_level=SafetyLevel.SAFE,
+            applescript_template='return "{{ message }}"',
+        )
+
+        mission = MissionControl()
+        mission.register(satellite)
+
+        mock_result = MagicMock()
+        mock_result.stdout = "__ORBIT_DELIM__0__\nhello\n__ORBIT_DELIM__1__\nworld\n"
+        mock_result.stderr = ""
+        mock_result.returncode = 0
+        mock_run.return_value = mock_result
+
+        results = mission.execute_function_calls([
+            {"name": "echo_sat", "arguments": '{"message": "hello"}'},
+            {"name": "echo_sat", "arguments": {"message": "world"}},
+        ])
+
+        assert results == ["hello", "world"]
+        mock_run.assert_called_once()
+
+    def test_execute_function_calls_nonexistent_satellite(self):
+        """Test batch with an unknown satellite fails before execution."""
+        mission = MissionControl()
+
+        with pytest.raises(SatelliteNotFoundError):
+            mission.execute_function_calls([{"name": "missing", "arguments": "{}"}])
+
+
 class TestMissionControlIntegration:
     """Integration tests for MissionControl."""
 
@@ -1,12 +1,18 @@
 """Tests for Result Parsers."""
 
+import re
+from unittest.mock import patch
+
 import pytest
 from orbit.parsers.json import (
     ResultParser,
     JSONResultParser,
     DelimitedResultParser,
+    RecordResultParser,
     RegexResultParser,
     BooleanResultParser,
+    cached_parser,
+    clear_parser_cache,
 )
 
 
@@ -149,6 +155,14 @@ class TestDelimitedResultParser:
         assert result["age"] == "30"
         assert result["city"] == "New York"
 
+    def test_field_names_stored_as_shared_tuple(self):
+        """Test field names are normalized to a tuple without copying tuples."""
+        fields = ("name", "size")
+
+        assert DelimitedResultParser(field_names=fields).field_names is fields
+        assert DelimitedResultParser(field_names=["a", "b"]).field_names == ("a", "b")
+        assert DelimitedResultParser().field_names is None
+
     def test_parse_comma_delimited(self):
         """Test parsing comma-delimited string."""
         parser = DelimitedResultParser(delimiter=",")
@@ -248,6 +262,112 @@ class TestDelimitedResultParser:
         assert result[2] == "123-456-7890"
 
 
+    def test_parse_multiline_with_names(self):
+        """Test parsing one record per line."""
+        parser = DelimitedResultParser(
+            delimiter="|",
+            field_names=["name", "size"],
+            multiline=True,
+        )
+        input_str = 'a.txt|10\nquote "b".txt|20\n'
+
+        result = parser.parse(input_str)
+
+        assert result == [
+            {"name": "a.txt", "size": "10"},
+            {"name": 'quote "b".txt', "size": "20"},
+        ]
+
+    def test_get_shares_parsers_per_schema(self):
+        """Test get() returns one instance per delimiter and field schema."""
+        parser = DelimitedResultParser.get("|", ["name", "size"])
+
+        assert DelimitedResultParser.get("|", ("name", "size")) is parser
+        assert DelimitedResultParser.get(",", ("name", "size")) is not parser
+        assert DelimitedResultParser.get("|", ("name", "size"), multiline=True) is not parser
+        assert parser.parse("a|1") == {"name": "a", "size": "1"}
+
+    def test_parse_multiline_multichar_delimiter(self):
+        """Test multiline parsing with a multi-character delimiter."""
+        parser = DelimitedResultParser(delimiter="||", multiline=True)
+
+        result = parser.parse("a||b\r\nc||d")
+
+        assert result == [["a", "b"], ["c", "d"]]
+
+
+class TestRecordResultParser:
+    """Tests for RecordResultParser."""
+
+    def test_parse_records(self):
+        """Test records split on the ASCII record and field separators."""
+        parser = RecordResultParser(["name", "body"])
+
+        result = parser.parse("a, b|c\x1fline 1\nline 2\x1e\x1fempty name")
+
+        assert result == [
+            {"name": "a, b|c", "body": "line 1\nline 2"},
+            {"name": "", "body": "empty name"},
+        ]
+
+    def test_parse_empty(self):
+        """Test empty output yields no records."""
+        assert RecordResultParser(("name",)).parse("") == []
+
+    def test_last_field_keeps_extra_separators(self):
+        """Test the last field absorbs any further field separators."""
+        parser = RecordResultParser(("name", "rest"))
+
+        assert parser.parse("a\x1fb\x1fc") == [{"name": "a", "rest": "b\x1fc"}]
+
+    def test_custom_separators(self):
+        """Test records with printable separators."""
+        parser = RecordResultParser(("name", "url"), record_separator=",", field_separator="|")
+
+        assert parser.parse("a|x|y,b|z") == [
+            {"name": "a", "url": "x|y"},
+            {"name": "b", "url": "z"},
+        ]
+
+
+class TestCachedParser:
+    """Tests for cached_parser and clear_parser_cache."""
+
+    def test_repeated_output_served_from_cache(self):
+        """Test the wrapped parser runs once per distinct output."""
+        parse = cached_parser(RecordResultParser(("name",)).parse)
+
+        assert parse("a\x1eb") == parse("a\x1eb") == [{"name": "a"}, {"name": "b"}]
+        assert parse.cache_info().hits == 1
+
+    def test_mutating_result_leaves_cache_intact(self):
+        """Test callers receive copies rather than the cached objects."""
+        parse = cached_parser(RecordResultParser(("name",)).parse)
+
+        first = parse("a")
+        first[0]["name"] = "changed"
+        first.append({"name": "extra"})
+
+        assert parse("a") == [{"name": "a"}]
+
+    def test_dict_results_copied(self):
+        """Test dict results are copied on return."""
+        parse = cached_parser(lambda output: {"value": output})
+
+        parse("a")["value"] = "changed"
+
+        assert parse("a") == {"value": "a"}
+
+    def test_clear_parser_cache(self):
+        """Test clear_parser_cache empties every parser cache."""
+        parse = cached_parser(RecordResultParser(("name",)).parse)
+        parse("a")
+
+        clear_parser_cache()
+
+        assert parse.cache_info().currsize == 0
+
+
 class TestRegexResultParser:
     """Tests for RegexResultParser."""
 
@@ -383,6 +503,30 @@ class TestRegexResultParser:
         assert result["text"] == "TEST"
 
 
+    def test_parse_with_flags(self):
+        """Test that flags are applied at compile time."""
+        parser = RegexResultParser(
+            pattern=r'^name: (.+)$',
+            group_names=["name"],
+            flags=re.MULTILINE,
+        )
+
+        result = parser.parse("id: 1\nname: Orbit\nsize: 2")
+
+        assert result["name"] == "Orbit"
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError):
+            RegexResultParser(pattern=r'\d+', engine="pcre")
+
+    def test_re2_engine_not_installed(self):
+        """Test that the re2 engine requires google-re2."""
+        with patch("orbit.parsers.json.re2", None):
+            with pytest.raises(ImportError):
+                RegexResultParser(pattern=r'\d+', engine="re2")
+
+
 class TestBooleanResultParser:
     """Tests for BooleanResultParser."""
 
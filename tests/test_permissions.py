@@ -0,0 +1,61 @@
+"""Tests for permission hints."""
+
+from orbit.core.permissions import get_permission_hint, format_error_with_hint
+
+
+class TestGetPermissionHint:
+    """Tests for get_permission_hint function."""
+
+    def test_safari_by_satellite_name(self):
+        """Test Safari hint selected by satellite name."""
+        hint = get_permission_hint("some error", "safari_get_url")
+
+        assert "Safari Automation" in hint
+
+    def test_not_allowed_error(self):
+        """Test Safari hint selected by 'not allowed' error text."""
+        hint = get_permission_hint("Operation Not Allowed", "system_get_info")
+
+        assert "Safari Automation" in hint
+
+    def test_system_events(self):
+        """Test System Events hint is case-insensitive."""
+        hint = get_permission_hint("System Events got an error", "app_list")
+
+        assert "System Events Permission" in hint
+
+    def test_priority_independent_of_position(self):
+        """Test that earlier rules win even when they match later in the text."""
+        hint = get_permission_hint("System Events: not allowed", "app_list")
+
+        assert "Safari Automation" in hint
+
+    def test_finder_requires_both(self):
+        """Test Finder hint requires satellite name and error text."""
+        assert "Finder Permission" in get_permission_hint("Finder error", "finder_open")
+        assert get_permission_hint("Finder error", "app_list") is None
+
+    def test_file_access(self):
+        """Test file access hint for file satellites."""
+        hint = get_permission_hint("Permission denied", "file_read")
+
+        assert "Full Disk Access" in hint
+
+    def test_no_hint(self):
+        """Test unrelated errors produce no hint."""
+        assert get_permission_hint("syntax error", "app_list") is None
+
+
+class TestFormatErrorWithHint:
+    """Tests for format_error_with_hint function."""
+
+    def test_without_hint(self):
+        """Test formatting when no hint applies."""
+        assert format_error_with_hint("boom", "app_list") == "❌ Error: boom"
+
+    def test_with_hint(self):
+        """Test formatting appends the hint."""
+        output = format_error_with_hint("Permission denied", "file_read")
+
+        assert output.startswith("❌ Error: Permission denied\n")
+        assert "Full Disk Access" in output
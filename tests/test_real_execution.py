@@ -62,12 +62,7 @@ class RealExecutionTester:
             sample_params = self._get_sample_params(satellite)
 
             # This will catch template rendering errors
-            from orbit.core.launcher import Launcher
-            launcher = Launcher(safety_shield=self.shield)
-            script = launcher._render_template(
-                satellite.applescript_template,
-                sample_params
-            )
+            script = satellite.render(sample_params)
 
             # Test if AppleScript can at least parse it
             # Don't wrap with tell block - many scripts have their own tell blocks
@@ -36,6 +36,15 @@ class TestSystemSatellites:
         assert sat.safety_level == SafetyLevel.SAFE
         assert len(sat.parameters) == 0
 
+    def test_system_get_info_single_shell_call(self):
+        """Test system_get_info gathers every field in one shell invocation."""
+        script = system.system_get_info.render({})
+
+        assert script.count("do shell script") == 1
+        assert system.system_get_info.result_parser.parse("14.0|host|user|arm64") == {
+            "version": "14.0", "hostname": "host", "username": "user", "architecture": "arm64"
+        }
+
     def test_system_set_clipboard_satellite(self):
         """Test system_set_clipboard satellite parameters."""
         sat = system.system_set_clipboard
@@ -46,6 +55,22 @@ class TestSystemSatellites:
         assert sat.parameters[0].type == "string"
         assert sat.parameters[0].required is True
 
+    def test_clipboard_native_handlers(self, monkeypatch):
+        """Test the NSPasteboard handlers read and write plain text."""
+        from unittest.mock import MagicMock
+
+        pasteboard = MagicMock()
+        pasteboard.stringForType_.return_value = None
+        appkit = MagicMock()
+        appkit.generalPasteboard.return_value = pasteboard
+        monkeypatch.setattr(system, "NSPasteboard", appkit)
+        monkeypatch.setattr(system, "NSPasteboardTypeString", "public.utf8-plain-text", raising=False)
+
+        assert system._get_clipboard({}) == ""
+        assert system._set_clipboard({"content": "hi"}) == "success"
+        pasteboard.clearContents.assert_called_once_with()
+        pasteboard.setString_forType_.assert_called_once_with("hi", "public.utf8-plain-text")
+
     def test_system_set_volume_validation(self):
         """Test system_set_volume parameter validation."""
         sat = system.system_set_volume
@@ -114,6 +139,45 @@ class TestFilesSatellites:
         assert sat.parameters[0].name == "path"
         assert sat.parameters[0].default == "/"
 
+    def test_file_result_parsers(self):
+        """Test file_list and file_search return parsed lists."""
+        parse_list = files.file_list.result_parser
+        assert parse_list("") == []
+        assert parse_list("a,1.txt|/tmp/a,1.txt|text|12\nb|/tmp/b|folder|0") == [
+            {"name": "a,1.txt", "path": "/tmp/a,1.txt", "type": "text", "size": "12"},
+            {"name": "b", "path": "/tmp/b", "type": "folder", "size": "0"},
+        ]
+
+        rows = files._iter_file_list("a|/a|text|1\nb|/b|text|2")
+        assert next(rows)["name"] == "a"
+        assert [row["path"] for row in rows] == ["/b"]
+
+        parse_search = files.file_search.result_parser
+        assert parse_search("") == []
+        assert parse_search("/tmp/a, b.txt\n/tmp/b.txt") == ["/tmp/a, b.txt", "/tmp/b.txt"]
+
+    def test_file_list_joins_once(self):
+        """Test file_list joins rows with text item delimiters."""
+        script = files.file_list.render({"path": "~/Documents"})
+
+        assert "(count of fileList) = 0" not in script
+        assert "set AppleScript's text item delimiters to linefeed" in script
+        assert script.endswith("return output")
+
+    def test_file_search_uses_spotlight(self):
+        """Test file_search queries mdfind instead of walking Finder contents."""
+        script = files.file_search.render({"path": "~", "query": "orbit", "file_type": "txt"})
+
+        assert "mdfind -onlyin" in script
+        assert "entire contents" not in script
+        assert '"[.]txt$"' in script
+        assert "grep" not in files.file_search.render({"path": "~", "query": "orbit"})
+
+    def test_file_templates_use_expanded_paths_directly(self):
+        """Test file templates no longer coerce paths with POSIX path of."""
+        for name in files.__all__:
+            assert "POSIX path of \"" not in getattr(files, name).applescript_template, name
+
     def test_file_write_parameters(self):
         """Test file_write satellite parameters."""
         sat = files.file_write
@@ -180,6 +244,36 @@ class TestNotesSatellites:
         for sat in notes_sats:
             assert sat.category == "notes"
 
+    def test_notes_result_parsers_memoized(self):
+        """Test notes parsers cache repeated output and return copies."""
+        parse = notes.notes_list.result_parser
+        output = "Todo\x1fbuy milk, eggs | bread\x1fx-coredata://1"
+
+        assert parse(output) is not parse(output)
+        assert parse.cache_info().hits
+        assert parse(output)[0]["body"] == "buy milk, eggs | bread"
+        assert parse(output)[0]["id"] == "x-coredata://1"
+        assert parse("") == []
+        assert notes.notes_list_folders.result_parser("Notes\x1eWork, Q3") == ["Notes", "Work, Q3"]
+
+    def test_notes_get_parser_reports_errors(self):
+        """Test notes_get maps error output and keeps "|" in bodies."""
+        parse = notes.notes_get.result_parser
+
+        assert parse("Error: Note not found") == {"error": "Error: Note not found"}
+        assert parse("a | b|Monday|Tuesday") == {
+            "body": "a | b",
+            "created": "Monday",
+            "modified": "Tuesday",
+        }
+
+    def test_notes_search_filters_in_notes(self):
+        """Test notes_search uses a whose filter instead of scanning every note."""
+        script = notes.notes_search.render({"query": "plan", "folder": "Work"})
+
+        assert 'whose name contains "plan" or body contains "plan"' in script
+        assert "set noteBody" not in script
+
 
 class TestRemindersSatellites:
     """Tests for Reminders satellites."""
@@ -193,12 +287,57 @@ class TestRemindersSatellites:
         assert "due_date" in param_names
 
     def test_reminders_complete_parameters(self):
-        """Test reminders_complete has id parameter."""
+        """Test reminders_complete takes an id, or a name as fallback."""
         sat = reminders.reminders_complete
 
-        assert len(sat.parameters) == 1
-        assert sat.parameters[0].name == "id"
-        assert sat.parameters[0].required is True
+        assert [p.name for p in sat.parameters] == ["id", "name", "list_name"]
+        # Neither is required on its own, but one of them must be given
+        assert not sat.required_params
+
+    @pytest.mark.parametrize("sat", [
+        reminders.reminders_complete,
+        reminders.reminders_uncomplete,
+        reminders.reminders_delete,
+    ])
+    def test_reminders_require_id_or_name(self, sat):
+        """Test targeting satellites need an id or a name."""
+        from orbit.core.exceptions import ParameterValidationError
+
+        with pytest.raises(ParameterValidationError):
+            sat.validate_parameters({})
+        with pytest.raises(ParameterValidationError):
+            sat.validate_parameters({"name": "", "list_name": "Work"})
+
+        assert sat.validate_parameters({"id": "x-apple-reminder://1"})
+        assert sat.validate_parameters({"name": "Team meeting"})
+        for param in sat.parameters[:2]:
+            assert "id or name is required" in param.description
+
+    def test_reminders_list_specialized(self):
+        """Test reminders_list renders from precomputed variants."""
+        sat = reminders.reminders_list
+
+        assert sat._compiled_template is None
+        assert "whose completed is false" in sat.render({})
+        assert "whose completed is false" in sat.render({"include_completed": "false"})
+        script = sat.render({"list_name": "Work", "include_completed": True})
+        assert "set allReminders to every reminder in targetList\n" in script
+
+    def test_reminder_lookup_by_id(self):
+        """Test reminders are resolved by id, else by name within a list or everywhere."""
+        for sat in (
+            reminders.reminders_complete,
+            reminders.reminders_uncomplete,
+            reminders.reminders_delete,
+        ):
+            by_id = sat.render({"id": "x-apple-reminder://1", "name": "Pay"})
+            assert 'set targetReminder to reminder id "x-apple-reminder://1"' in by_id
+            assert "whose" not in by_id
+
+            assert 'first reminder whose name is "Pay"' in sat.render({"name": "Pay"})
+            assert 'first reminder of list "Work" whose name is "Pay"' in sat.render(
+                {"name": "Pay", "list_name": "Work"}
+            )
 
     def test_reminders_list_no_params(self):
         """Test reminders_list has no parameters."""
@@ -206,6 +345,25 @@ class TestRemindersSatellites:
 
         assert len(sat.parameters) == 0
 
+    def test_reminders_result_parsers(self):
+        """Test reminder and list rows parse into dicts."""
+        parse = reminders.reminders_list.result_parser
+
+        assert parse("Call, Bob|x\x1fdate\x1ffalse\x1fx-1\x1ePay\x1fmissing value\x1ftrue\x1fx-2") == [
+            {"name": "Call, Bob|x", "due_date": "date", "completed": "false", "id": "x-1"},
+            {"name": "Pay", "due_date": "missing value", "completed": "true", "id": "x-2"},
+        ]
+        assert parse("") == []
+        assert reminders.reminders_list_lists.result_parser("Work, Home\x1f3") == [
+            {"name": "Work, Home", "count": "3"}
+        ]
+
+    def test_reminders_lists_joined_once(self):
+        """Test list templates join rows once instead of branching per row."""
+        for sat in (reminders.reminders_list, reminders.reminders_list_lists):
+            assert "if (count of" not in sat.applescript_template, sat.name
+            assert "text item delimiters to (character id 30)" in sat.applescript_template
+
 
 class TestCalendarSatellites:
     """Tests for Calendar satellites."""
@@ -227,6 +385,83 @@ class TestCalendarSatellites:
         param_names = [p.name for p in sat.parameters]
         assert "event_id" in param_names or "calendar" in param_names
 
+    def test_calendar_get_events_result_parser(self):
+        """Test calendar_get_events parses event records."""
+        parser = calendar.calendar_get_events.result_parser
+
+        result = parser(
+            "Standup\x1fMonday, 27 January 2026\x1fMonday, 27 January 2026\x1fRoom 1\x1f\x1fWork"
+            "\x1eLunch\x1fTue\x1fTue\x1f\x1f\x1fHome"
+        )
+
+        assert result == [
+            {"summary": "Standup", "start": "Monday, 27 January 2026",
+             "end": "Monday, 27 January 2026",
+             "location": "Room 1", "status": "", "calendar": "Work"},
+            {"summary": "Lunch", "start": "Tue", "end": "Tue",
+             "location": "", "status": "", "calendar": "Home"},
+        ]
+        assert parser("") == []
+
+    def test_calendar_events_streamed(self):
+        """Test event rows are read lazily and a trailing separator is ignored."""
+        rows = calendar._iter_rows("a\x1eb\x1e")
+
+        assert next(rows) == "a"
+        assert list(rows) == ["b"]
+        assert calendar.calendar_get_events.result_parser(
+            "Lunch\x1fTue\x1fTue\x1f\x1f\x1fHome\x1e"
+        ) == [{"summary": "Lunch", "start": "Tue", "end": "Tue",
+               "location": "", "status": "", "calendar": "Home"}]
+
+    def test_calendar_list_calendars_result_parser(self):
+        """Test calendar_list_calendars parses calendar records."""
+        parser = calendar.calendar_list_calendars.result_parser
+
+        assert parser("Home, Family\x1ftrue\x1ffalse\x1eWork|Q3\x1ftrue\x1ftrue") == [
+            {"name": "Home, Family", "writable": "true", "subscribed": "false"},
+            {"name": "Work|Q3", "writable": "true", "subscribed": "true"},
+        ]
+        assert parser("") == []
+
+    def test_calendar_create_event_dates_rendered_in_python(self):
+        """Test event dates are parsed at render time, not in AppleScript."""
+        script = calendar.calendar_create_event.render({
+            "summary": "Review",
+            "start_date": "2026-01-31 15:30",
+            "end_date": "2026-01-31 16:00",
+        })
+
+        assert "parseDateTime" not in script
+        assert "set day of startDate to 1\nset year of startDate to 2026" in script
+        assert "set day of startDate to 31" in script
+        assert "set time of startDate to 55800" in script
+
+    def test_calendar_list_calendars_joins_once(self):
+        """Test calendar rows are joined by the shared snippet and stay static."""
+        sat = calendar.calendar_list_calendars
+
+        assert "(count of calendarList) = 0" not in sat.applescript_template
+        assert sat.render({}).endswith("return output")
+        assert sat._static_body is not None
+
+    def test_calendar_invalid_date_rejected(self):
+        """Test malformed dates fail before reaching osascript."""
+        from orbit.core.exceptions import TemplateRenderingError
+
+        with pytest.raises(TemplateRenderingError):
+            calendar.calendar_get_events.render({"start_date": "next tuesday"})
+
+    def test_calendar_result_parser_memoized(self):
+        """Test repeated identical output is parsed once and copied."""
+        parser = calendar.calendar_get_events.result_parser
+
+        output = "Review\x1fWed\x1fWed\x1f\x1f\x1fWork"
+        first = parser(output)
+        first[0]["summary"] = "changed"
+        assert parser(output)[0]["summary"] == "Review"
+        assert parser.cache_info().hits
+
 
 class TestMailSatellites:
     """Tests for Mail satellites."""
@@ -254,6 +489,94 @@ class TestMailSatellites:
         assert len(sat.parameters) >= 1
         assert any(p.name == "id" for p in sat.parameters)
 
+    def test_mail_result_parsers_memoized(self):
+        """Test mail parsers cache repeated output and return copies."""
+        inbox = mail.mail_list_inbox.result_parser
+        output = "Hi, all\x1fann@x.com\x1fMonday\x1ffalse\x1eRe: Hi\x1fbob@x.com\x1fTuesday\x1ftrue"
+
+        assert inbox(output) is not inbox(output)
+        assert inbox.cache_info().hits
+        assert inbox(output)[0]["subject"] == "Hi, all"
+        assert inbox(output)[1]["read"] == "true"
+        assert inbox("") == []
+        assert mail.mail_get.result_parser("Error: Message not found") == {"error": "Error: Message not found"}
+
+    def test_mail_get_parser_checks_error_prefix_only(self):
+        """Test mail_get only treats a leading "Error:" as a failure."""
+        parse = mail.mail_get.result_parser
+
+        assert parse("Build Error: fixed | see log|ann@x.com") == {
+            "content": "Build Error: fixed | see log",
+            "sender": "ann@x.com",
+        }
+
+    def test_mail_batch_satellites_render_one_script(self):
+        """Test batch satellites cover every subject in a single script."""
+        script = mail.mail_batch_mark.render({"subjects": ['Re: "Q3"', "Hello"], "read": False})
+
+        assert script.count('tell application "Mail"') == 1
+        assert 'set end of subjectList to "Re: \\"Q3\\""' in script
+        assert 'set end of subjectList to "Hello"' in script
+        assert "to false" in script
+        assert mail.mail_batch_delete.safety_level == SafetyLevel.DANGEROUS
+
+    def test_mail_batch_mark_read_text_false(self):
+        """Test read given as text "false" marks messages unread."""
+        script = mail.mail_batch_mark.render({"subjects": ["Hello"], "read": "false"})
+
+        assert "set readStatus to false" in script
+        assert "set readStatus to true" not in script
+
+    def test_mail_batch_renders_every_subject(self):
+        """Test every accepted subject is sent in the batch."""
+        subjects = [f"s{i}" for i in range(500)]
+        mail.mail_batch_delete.validate_parameters({"subjects": subjects})
+        script = mail.mail_batch_delete.render({"subjects": subjects})
+
+        assert script.count("set end of subjectList") == 500
+
+    @pytest.mark.parametrize("subjects", [
+        "Hello",
+        [],
+        [f"s{i}" for i in range(501)],
+        ["Hello", 3],
+    ])
+    def test_mail_batch_rejects_invalid_subjects(self, subjects):
+        """Test subjects must be a list of 1 to 500 strings."""
+        from orbit.core.exceptions import ParameterValidationError
+
+        for sat in (mail.mail_batch_mark, mail.mail_batch_delete):
+            with pytest.raises(ParameterValidationError):
+                sat.validate_parameters({"subjects": subjects})
+
+    def test_mail_batch_result_parser(self):
+        """Test per-subject outcomes are reported."""
+        parse = mail.mail_batch_mark.result_parser
+
+        assert parse("A\x1fok\x1eB\x1fCan't get message") == [
+            {"subject": "A", "ok": True},
+            {"subject": "B", "ok": False, "error": "Can't get message"},
+        ]
+        assert parse("") == []
+
+    def test_mail_batch_result_parser_keeps_tabs_and_newlines(self):
+        """Test tabs and newlines in subjects or errors stay in their record."""
+        parse = mail.mail_batch_delete.result_parser
+
+        assert parse("A\tB\x1fok\x1eC\nD\x1fline 1\nline 2") == [
+            {"subject": "A\tB", "ok": True},
+            {"subject": "C\nD", "ok": False, "error": "line 1\nline 2"},
+        ]
+
+    def test_mail_batch_templates_use_record_separators(self):
+        """Test batch rows are built with the ASCII record separators."""
+        for sat in (mail.mail_batch_mark, mail.mail_batch_delete):
+            script = sat.render({"subjects": ["Hello"], "read": True})
+
+            assert "& tab &" not in script
+            assert "(character id 31)" in script
+            assert "character id 30" in script
+
 
 class TestSafariSatellites:
     """Tests for Safari satellites."""
@@ -272,6 +595,12 @@ class TestSafariSatellites:
 
         assert sat.parameters[0].name == "query"
 
+    def test_safari_search_url_encodes_query(self):
+        """Test the query is URL-encoded so quotes cannot end the string."""
+        script = safari.safari_search.render({"query": 'C# "tips" & más'})
+
+        assert 'search?q=C%23+%22tips%22+%26+m%C3%A1s"' in script
+
     def test_safari_get_url_no_params(self):
         """Test safari_get_url has no parameters."""
         sat = safari.safari_get_url
@@ -283,6 +612,48 @@ class TestSafariSatellites:
         assert len(safari.safari_zoom_in.parameters) == 0
         assert len(safari.safari_zoom_out.parameters) == 0
 
+    def test_safari_navigation_avoids_system_events(self):
+        """Test navigation and zoom talk to Safari directly, not via keystrokes."""
+        for sat in (
+            safari.safari_go_back,
+            safari.safari_go_forward,
+            safari.safari_refresh,
+            safari.safari_zoom_in,
+            safari.safari_zoom_out,
+        ):
+            script = sat.render({})
+            assert "System Events" not in script, sat.name
+            assert "do JavaScript" in script, sat.name
+
+    def test_safari_get_text_single_javascript_call(self):
+        """Test safari_get_text evaluates the page text once."""
+        assert safari.safari_get_text.render({}).count("do JavaScript") == 1
+
+    def test_safari_snapshot(self):
+        """Test safari_snapshot reads the page in one static script."""
+        sat = safari.safari_snapshot
+
+        script = sat.render({})
+        assert script.count('tell application "Safari"') == 1
+        assert "document.body.innerText) || ''\" in front document" in script
+        assert "on error" not in script
+        assert sat.result_parser.parse("https://a.b\x1fA | B\x1fline 1\nline 2") == {
+            "url": "https://a.b", "title": "A | B", "text": "line 1\nline 2"
+        }
+
+    def test_safari_list_tabs_result_parser(self):
+        """Test tab rows are joined once and parse into name/url dicts."""
+        parse = safari.safari_list_tabs.result_parser
+
+        assert parse("GitHub, Inc.\x1fhttps://github.com\x1ea|b\x1fhttps://x.y/?q=1,2") == [
+            {"name": "GitHub, Inc.", "url": "https://github.com"},
+            {"name": "a|b", "url": "https://x.y/?q=1,2"},
+        ]
+        assert parse("") == []
+        script = safari.safari_list_tabs.render({})
+        assert "if (count of" not in script
+        assert "text item delimiters to (character id 30)" in script
+
 
 class TestMusicSatellites:
     """Tests for Music satellites."""
@@ -313,6 +684,76 @@ class TestMusicSatellites:
 
         assert len(sat.parameters) == 0
 
+    def test_music_result_parsers_memoized(self):
+        """Test music parsers cache repeated output and return copies."""
+        search = music.music_search.result_parser
+        output = "Song\x1fAlbum\x1fArtist"
+
+        assert search(output) is not search(output)
+        assert search.cache_info().hits
+        assert search(output) == [{"name": "Song", "album": "Album", "artist": "Artist"}]
+        assert music.music_get_current.result_parser("No track playing") == {"status": "stopped"}
+        assert music.music_get_playlists.result_parser("Mix\x1f12") == [{"name": "Mix", "count": "12"}]
+
+    def test_music_search_filters_in_music(self):
+        """Test music_search hands a whose filter to Music instead of looping."""
+        script = music.music_search.render({"query": "love"})
+
+        assert 'every track of library playlist 1 whose name contains "love"' in script
+        assert "if name of currentTrack contains" not in script
+
+    def test_safe_satellites_do_not_activate_apps(self):
+        """Test read-only Music/Mail/Notes satellites never steal focus."""
+        for module in (music, mail, notes):
+            for sat in module.SATELLITES.values():
+                if sat.safety_level == SafetyLevel.SAFE:
+                    assert "activate" not in sat._source.splitlines(), sat.name
+
+    def test_success_satellites_return_raw_status(self):
+        """Test write satellites hand back osascript's "success" unparsed."""
+        for module in (music, mail, notes):
+            for sat in module.SATELLITES.values():
+                if 'return "success"' in sat._source:
+                    assert sat.result_parser is None, sat.name
+
+    def test_list_results_join_once_with_delimiters(self):
+        """Test list satellites append rows and join them in one TID pass."""
+        for sat, params in (
+            (music.music_search, {"query": "x"}),
+            (music.music_get_playlists, {}),
+            (notes.notes_list, {}),
+            (notes.notes_search, {"query": "x"}),
+            (notes.notes_list_folders, {}),
+        ):
+            script = sat.render(params)
+            assert "text item delimiters to (character id 30)" in script, sat.name
+            assert 'to "," &' not in script, sat.name
+            assert "do shell script" not in script, sat.name
+
+    def test_search_limits_default_and_override(self):
+        """Test list/search satellites stop after limit results (default 50)."""
+        assert "if (count of trackList) >= 50 then exit repeat" in music.music_search.render({"query": "x"})
+        assert "if (count of noteList) >= 5 then exit repeat" in notes.notes_list.render({"limit": 5})
+        assert "if (count of results) >= 50 then exit repeat" in notes.notes_search.render({"query": "x"})
+        assert "set limitCount to 10" in mail.mail_list_inbox.render({})
+
+    def test_search_limits_coerced_to_integers(self):
+        """Test limits are rendered as integers and text cannot inject code."""
+        from orbit.core.exceptions import ParameterValidationError
+
+        assert ">= 7 then exit repeat" in notes.notes_list.render({"limit": "7"})
+
+        injected = "0 then do shell script (character id {105, 100})\n if false"
+        for sat, params in (
+            (music.music_search, {"query": "x"}),
+            (notes.notes_list, {}),
+            (notes.notes_search, {"query": "x"}),
+            (mail.mail_list_inbox, {}),
+            (contacts.contacts_list_all, {}),
+        ):
+            with pytest.raises(ParameterValidationError):
+                sat.render({**params, "limit": injected})
+
 
 class TestFinderSatellites:
     """Tests for Finder satellites."""
@@ -337,6 +778,31 @@ class TestFinderSatellites:
         assert "name" in param_names
         assert "location" in param_names
 
+    def test_list_scripts_return_empty_text_for_empty_lists(self):
+        """Test list satellites join with delimiters instead of 'my list'."""
+        for sat in (finder.finder_get_selection, apps.app_list, apps.app_get_running,
+                    contacts.contacts_list_all):
+            script = sat.render({"path": "/Applications", "limit": 5})
+            assert "my list" not in script
+            assert script.endswith("return output")
+
+        assert finder.finder_get_selection.result_parser("") == []
+        assert finder.finder_get_selection.result_parser("/a,b\n/c") == ["/a,b", "/c"]
+
+    def test_finder_open_folder_closes_result_literal(self):
+        """Test finder_open_folder returns a terminated string literal."""
+        script = finder.finder_open_folder.render({"path": "/tmp"})
+
+        assert script.endswith('return "success"')
+
+    def test_finder_get_trash_info_fetches_sizes_at_once(self):
+        """Test trash sizes are fetched in one batch and summed locally."""
+        script = finder.finder_get_trash_info.render({})
+
+        assert "set sizeList to physical size of every item of trash" in script
+        assert script.count("end tell") == script.count('tell application "Finder"')
+        assert "physical size of item)" not in script
+
 
 class TestContactsSatellites:
     """Tests for Contacts satellites."""
@@ -355,6 +821,82 @@ class TestContactsSatellites:
         assert "name" in param_names
         assert "email" in param_names or "phone" in param_names
 
+    def test_contacts_search_filters_in_contacts(self):
+        """Test contacts_search uses a whose clause instead of scanning everyone."""
+        script = contacts.contacts_search.render({"query": "Ann"})
+
+        assert 'every person whose name contains "Ann"' in script
+        assert "set allPeople to every person" not in script
+        assert "set nameList to name of matches" in script
+        assert "of currentPerson" not in script
+        assert 'personPhone2, personCompany} as string' in script
+        assert script.endswith("return output")
+
+    def test_contacts_list_all_fetches_names_in_one_range(self):
+        """Test contacts_list_all reads names of a person range at once."""
+        script = contacts.contacts_list_all.render({"limit": 10})
+
+        assert "set limitCount to 10" in script
+        assert "name of people 1 thru limitCount" in script
+        assert "currentPerson" not in script
+        assert contacts.contacts_list_all.result_parser("Ann,Bob") == ["Ann", "Bob"]
+        assert contacts.contacts_list_all.result_parser("") == []
+
+    @pytest.mark.parametrize("sat, params, literal", [
+        (contacts.contacts_search, {"query": 'x" & (do shell script "id") & "'},
+         '"x\\" & (do shell script \\"id\\") & \\""'),
+        (files.file_search, {"path": "~", "query": 'a\\"b', "file_type": "txt"},
+         '"a\\\\\\"b"'),
+    ])
+    def test_quoted_parameters_cannot_close_literals(self, sat, params, literal):
+        """Test quotes and backslashes in user input stay inside the literal."""
+        assert literal in sat.render(params)
+
+    def test_join_delimiter_is_escaped(self):
+        """Test applescript_join escapes its delimiter literal."""
+        from orbit.core.templating import applescript_join
+
+        assert 'delimiters to "\\""' in applescript_join("items", '"')
+
+    def test_join_record_separator_uses_character_id(self):
+        """Test the record separator is joined via character id, not a literal."""
+        from orbit.core.templating import RECORD_SEPARATOR, applescript_join
+
+        assert "delimiters to (character id 30)" in applescript_join("rows", RECORD_SEPARATOR)
+
+    def test_contacts_get_defaults_missing_fields_without_coercion(self):
+        """Test contacts_get handles missing fields without '& ""' copies."""
+        script = contacts.contacts_get.render({"name": "Ann"})
+
+        assert '& ""' not in script
+        assert "set personNote to note of personProps" in script
+        assert "set personEmail to value of email 1 of targetPerson" in script
+
+    def test_contacts_get_reads_properties_once(self):
+        """Test contacts_get reads plain properties from one properties record."""
+        script = contacts.contacts_get.render({"name": "Ann"})
+
+        assert script.count("properties of targetPerson") == 1
+        for prop in ("organization", "birth date", "note"):
+            assert f"{prop} of personProps" in script
+            assert f"{prop} of targetPerson" not in script
+
+    def test_contacts_result_parsers(self):
+        """Test contacts_search and contacts_get record parsing."""
+        search = contacts.contacts_search.result_parser
+        assert search("") == []
+        assert search("Ann|a@x.com|1|2|Acme, Inc\nBob|b@x.com|||") == [
+            {"name": "Ann", "email": "a@x.com", "phone1": "1", "phone2": "2", "company": "Acme, Inc"},
+            {"name": "Bob", "email": "b@x.com", "phone1": "", "phone2": "", "company": ""},
+        ]
+
+        get = contacts.contacts_get.result_parser
+        assert get("Error: Contact not found") == {"error": "Error: Contact not found"}
+        contact = get("Ann|a@x.com|1|2|Acme|Main St|1990|likes | pipes")
+        assert contact["address"] == "Main St"
+        assert contact["note"] == "likes | pipes"
+        assert get("Ann|||||||Error: in a note")["note"] == "Error: in a note"
+
 
 class TestWifiSatellites:
     """Tests for WiFi satellites."""
@@ -395,6 +937,40 @@ class TestAppsSatellites:
 
         sat.validate_parameters({})
 
+    def test_app_result_parsers_drop_empty_entries(self):
+        """Test app list parsers sort names and skip empty entries."""
+        assert apps.app_list.result_parser("Safari,,Finder,") == ["Finder", "Safari"]
+        assert apps.app_list.result_parser("") == []
+        assert apps.app_get_running.result_parser("") == []
+        assert apps.app_get_running.result_parser("Music,Finder") == ["Finder", "Music"]
+
+    def test_app_list_parser_returns_copies(self):
+        """Test the memoized app list parser returns a fresh list per call."""
+        parse = apps.app_list.result_parser
+
+        parse("Safari,Finder").append("Mail")
+
+        assert parse("Safari,Finder") == ["Finder", "Safari"]
+
+    def test_app_name_parameter_is_shared(self):
+        """Test single-app satellites share one immutable name parameter."""
+        param = apps.app_launch.parameters[0]
+
+        for sat in (apps.app_quit, apps.app_activate, apps.app_force_quit,
+                    apps.app_hide, apps.app_show):
+            assert sat.parameters[0] is param
+        with pytest.raises(AttributeError):
+            param.required = False
+
+    @pytest.mark.parametrize("sat", [apps.app_hide, apps.app_show])
+    def test_app_visibility_scripts_use_one_line_tells(self, sat):
+        """Test app_hide/app_show target each application once without nesting."""
+        script = sat.render({"name": "Safari"})
+
+        assert 'tell application "Safari" to activate' in script
+        assert 'tell application "System Events" to set visible of' in script
+        assert "end tell" not in script
+
 
 class TestSatelliteExportFormats:
     """Tests for satellite export capabilities."""
@@ -578,3 +1154,97 @@ class TestAllSatellitesRegistry:
         }
 
         assert categories.issuperset(expected_categories) or len(categories.intersection(expected_categories)) >= 10
+
+    def test_parameterless_satellites_render_precomputed_scripts(self):
+        """Test satellites without parameters never reach Jinja at call time."""
+        from orbit.satellites.all_satellites import all_satellites
+
+        for sat in all_satellites:
+            if not sat.parameters:
+                assert sat._static_body is not None, sat.name
+                assert sat.render({}) is sat._static_body
+
+    def test_all_satellites_prepared_at_import(self):
+        """Test every template is static, format_map-ready or precompiled."""
+        from orbit.satellites.all_satellites import all_satellites
+
+        for sat in all_satellites:
+            assert (
+                sat._static_body is not None
+                or sat._format_body is not None
+                or sat._variants is not None
+                or sat._compiled_template is not None
+            ), sat.name
+
+        assert notes.notes_list._variants is not None
+
+        assert music.music_play.render({}) is music.music_play._static_body
+
+    def test_all_satellites_by_category(self):
+        """Test per-category loaders match the full registry."""
+        from orbit.satellites.all_satellites import (
+            all_satellites,
+            all_satellites_by_category,
+        )
+
+        for category, load in all_satellites_by_category.items():
+            expected = [sat for sat in all_satellites if sat.category == category]
+            assert load() == expected
+
+    def test_load_satellite(self):
+        """Test single-satellite lookup resolves every registered name."""
+        from orbit.satellites.all_satellites import all_satellites, load_satellite
+
+        for sat in all_satellites:
+            assert load_satellite(sat.name) is sat
+
+        with pytest.raises(KeyError):
+            load_satellite("no_such_satellite")
+
+    def test_modules_export_read_only_satellite_mappings(self):
+        """Test each module's SATELLITES matches its registry group."""
+        import importlib
+        from types import MappingProxyType
+
+        from orbit.satellites.all_satellites import _SATELLITE_GROUPS
+
+        for module_name, names in _SATELLITE_GROUPS.values():
+            module = importlib.import_module(f"orbit.satellites.{module_name}")
+            assert isinstance(module.SATELLITES, MappingProxyType)
+            assert tuple(module.SATELLITES) == names == tuple(module.__all__)
+            assert all(module.SATELLITES[name] is getattr(module, name) for name in names)
+
+    def test_rendered_examples_pass_basic_applescript_lint(self):
+        """Test example scripts have balanced quotes and no "set x = y"."""
+        import re
+
+        from orbit.satellites.all_satellites import all_satellites
+
+        unescaped_quote = re.compile(r'(?<!\\)"')
+        equals_assignment = re.compile(r"^set \w+ = ")
+        for sat in all_satellites:
+            for example in sat.examples:
+                script = sat.render(example.get("input", {}))
+                for line in script.splitlines():
+                    assert len(unescaped_quote.findall(line)) % 2 == 0, (sat.name, line)
+                    assert not equals_assignment.match(line), (sat.name, line)
+
+    def test_rendering_never_compiles_templates(self):
+        """Test reminders, safari and system satellites render without compiling."""
+        from unittest.mock import patch
+
+        with patch(
+            "orbit.core.satellite.TEMPLATE_ENV.from_string",
+            side_effect=AssertionError("template compiled at call time"),
+        ):
+            for module in (reminders, safari, system):
+                for sat in module.SATELLITES.values():
+                    for example in sat.examples:
+                        sat.render(example.get("input", {}))
+
+    def test_jinja_templates_compiled_when_module_loads(self):
+        """Test Jinja-dependent templates are compiled by importing the module."""
+        from jinja2 import Template
+
+        for sat in (safari.safari_close_tab, calendar.calendar_get_events, files.file_list):
+            assert isinstance(sat._compiled_template, Template), sat.name
@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from orbit.core import SafetyShield, ShieldAction, Satellite, SafetyLevel
 from orbit.core.exceptions import ShieldError
 
@@ -275,6 +275,44 @@ class TestCheckPath:
         # Should not raise - ~/Documents is not protected
         shield._check_path("~/Documents/test.txt")
 
+    def test_check_path_sibling_prefix_allowed(self):
+        """Test that a sibling sharing a name prefix is not protected."""
+        shield = SafetyShield()
+
+        # Should not raise - /usrlocal is not under /usr
+        shield._check_path("/usrlocal/file.txt")
+
+    def test_check_path_normalizes_traversal(self):
+        """Test that parent references are resolved before checking."""
+        shield = SafetyShield()
+
+        with pytest.raises(ShieldError):
+            shield._check_path("/tmp/../usr/bin/test")
+
+    def test_check_path_protected_skips_resolve(self):
+        """Test that lexically protected paths are rejected without resolving."""
+        shield = SafetyShield()
+
+        with patch("orbit.core.shield.Path.resolve") as mock_resolve:
+            with pytest.raises(ShieldError):
+                shield._check_path("/usr/local/bin")
+
+        mock_resolve.assert_not_called()
+
+    def test_check_path_symlinks_into_protected_paths(self, tmp_path):
+        """Test that symlinks into protected paths are caught."""
+        protected = tmp_path / "protected"
+        protected.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(protected)
+        shield = SafetyShield(protected_paths=[protected.resolve()])
+
+        with pytest.raises(ShieldError):
+            shield._check_path(str(link / "file.txt"))
+
+        # Names containing ".." or "~" are ordinary names
+        shield._check_path(str(tmp_path / "notes..backup" / "a~b.txt"))
+
     def test_check_protected_path_in_validate(self):
         """Test path checking through validate method."""
         from orbit.core import SatelliteParameter
@@ -433,6 +471,36 @@ class TestProtectedPathManagement:
         assert len(shield.protected_paths) == initial_count - 1
         assert test_path not in shield.protected_paths
 
+    def test_direct_list_edits_enforced(self):
+        """Test paths appended to protected_paths directly are enforced."""
+        shield = SafetyShield()
+        shield._check_path("/opt/data/file.txt")
+
+        shield.protected_paths.append(Path("/opt/data"))
+
+        with pytest.raises(ShieldError):
+            shield._check_path("/opt/data/file.txt")
+
+        shield.protected_paths.remove(Path("/opt/data"))
+        shield._check_path("/opt/data/file.txt")
+
+    def test_prefixes_cached_between_checks(self):
+        """Test repeated checks reuse the prefixes until the list changes."""
+        shield = SafetyShield()
+        shield._check_path("/opt/data/file.txt")
+
+        with patch.object(
+            SafetyShield, "_build_prefixes", wraps=SafetyShield._build_prefixes
+        ) as build:
+            shield._check_path("/opt/data/file.txt")
+            shield._check_path("/opt/other/file.txt")
+            assert build.call_count == 0
+
+            shield.protected_paths = [Path("/opt/data")]
+            with pytest.raises(ShieldError):
+                shield._check_path("/opt/data/file.txt")
+            assert build.call_count == 1
+
     def test_remove_nonexistent_path(self):
         """Test removing a path that doesn't exist."""
         shield = SafetyShield()
@@ -483,6 +551,37 @@ class TestCustomDangerousCommands:
         shield._check_command("rm -rf /test")  # Not in custom list
 
 
+class TestDangerousCommandManagement:
+    """Tests for dangerous command management methods."""
+
+    def test_add_dangerous_command(self):
+        """Test that an added command is blocked."""
+        shield = SafetyShield()
+        shield._check_command("shutdown -h now")  # Should not raise
+
+        shield.add_dangerous_command("shutdown -h")
+
+        with pytest.raises(ShieldError):
+            shield._check_command("sudo shutdown -h now")
+
+    def test_remove_dangerous_command(self):
+        """Test that a removed command is no longer blocked."""
+        shield = SafetyShield()
+        shield.remove_dangerous_command("mkfs")
+
+        shield._check_command("mkfs.ext4 /dev/sda1")  # Should not raise
+        assert "mkfs" in SafetyShield.DANGEROUS_COMMANDS
+
+    def test_regex_metacharacters_are_literal(self):
+        """Test that patterns are matched literally, not as regex."""
+        shield = SafetyShield(dangerous_commands=["a.b"])
+
+        shield._check_command("axb")  # Should not raise
+
+        with pytest.raises(ShieldError):
+            shield._check_command("run a.b now")
+
+
 class TestDefaultConstants:
     """Tests for default shield constants."""
 